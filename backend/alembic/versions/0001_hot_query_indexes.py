@@ -0,0 +1,57 @@
+"""Composite indexes for the hot list/filter query shapes
+
+Every list endpoint orders by created_at DESC (keyset pages add id as tie-breaker)
+and most filter on one foreign key or enum column first.
+
+Revision ID: 0001_hot_query_indexes
+Revises:
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_hot_query_indexes"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (index name, table, columns) - keep in sync with __table_args__ in app/db/models.py
+INDEXES = [
+    ("ix_users_created_at_id", "users", ["created_at", "id"]),
+    ("ix_accounts_created_at_id", "accounts", ["created_at", "id"]),
+    ("ix_contacts_created_at_id", "contacts", ["created_at", "id"]),
+    ("ix_contacts_account_id_created_at", "contacts", ["account_id", "created_at"]),
+    ("ix_leads_created_at_id", "leads", ["created_at", "id"]),
+    ("ix_leads_status_created_at", "leads", ["status", "created_at"]),
+    ("ix_deals_created_at_id", "deals", ["created_at", "id"]),
+    ("ix_deals_stage_created_at", "deals", ["stage", "created_at"]),
+    ("ix_deals_account_id_created_at", "deals", ["account_id", "created_at"]),
+    ("ix_activities_created_at_id", "activities", ["created_at", "id"]),
+    ("ix_activities_lead_id_created_at", "activities", ["lead_id", "created_at"]),
+    ("ix_notifications_user_id_created_at", "notifications", ["user_id", "created_at"]),
+    ("ix_notifications_user_id_is_read_created_at", "notifications", ["user_id", "is_read", "created_at"]),
+    ("ix_audit_logs_created_at", "audit_logs", ["created_at"]),
+]
+
+
+def _existing_indexes(table: str) -> set:
+    inspector = sa.inspect(op.get_bind())
+    return {ix["name"] for ix in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    # init_db's create_all already builds these on fresh databases, so only add what is missing.
+    for name, table, columns in INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    for name, table, _ in reversed(INDEXES):
+        if name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
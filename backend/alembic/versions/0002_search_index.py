@@ -0,0 +1,36 @@
+"""Full-text search index for leads, contacts and accounts
+
+SQLite: external-content FTS5 tables plus sync triggers. MySQL: FULLTEXT indexes.
+
+Revision ID: 0002_search_index
+Revises: 0001_hot_query_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.search import SEARCH_ENTITIES, ensure_search_index
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_search_index"
+down_revision: Union[str, None] = "0001_hot_query_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    ensure_search_index(op.get_bind())
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for table, _, _, _ in SEARCH_ENTITIES.values():
+        if bind.dialect.name == "sqlite":
+            for suffix in ("ai", "ad", "au"):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        elif bind.dialect.name == "mysql":
+            op.drop_index(f"ft_{table}", table_name=table)
@@ -0,0 +1,36 @@
+"""Pre-aggregated lead_stats table
+
+Revision ID: 0003_lead_stats
+Revises: 0002_search_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_lead_stats"
+down_revision: Union[str, None] = "0002_search_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "lead_stats",
+        sa.Column("status", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.Column("total_value", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("status"),
+    )
+    op.execute(
+        "INSERT INTO lead_stats (status, count, total_value) "
+        "SELECT status, COUNT(id), COALESCE(SUM(value), 0) FROM leads GROUP BY status"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("lead_stats")
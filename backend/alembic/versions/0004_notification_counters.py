@@ -0,0 +1,36 @@
+"""Per-user unread notification counters
+
+Revision ID: 0004_notification_counters
+Revises: 0003_lead_stats
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_notification_counters"
+down_revision: Union[str, None] = "0003_lead_stats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "notification_counters",
+        sa.Column("user_id", sa.String(), nullable=False),
+        sa.Column("unread", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        "INSERT INTO notification_counters (user_id, unread) "
+        "SELECT user_id, COUNT(id) FROM notifications WHERE NOT is_read GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("notification_counters")
@@ -0,0 +1,37 @@
+"""Index deals.updated_at for the forecast pipeline fingerprint
+
+app/services/forecast.pipeline_version reads max(deals.updated_at) on every forecast
+request; with this index that is a single index seek instead of a table scan.
+
+Revision ID: 0005_deals_updated_at_index
+Revises: 0004_notification_counters
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_deals_updated_at_index"
+down_revision: Union[str, None] = "0004_notification_counters"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _has_index() -> bool:
+    inspector = sa.inspect(op.get_bind())
+    return "ix_deals_updated_at" in {ix["name"] for ix in inspector.get_indexes("deals")}
+
+
+def upgrade() -> None:
+    # init_db's create_all already builds it on fresh databases
+    if not _has_index():
+        op.create_index("ix_deals_updated_at", "deals", ["updated_at"])
+
+
+def downgrade() -> None:
+    if _has_index():
+        op.drop_index("ix_deals_updated_at", table_name="deals")
@@ -0,0 +1,36 @@
+"""Keep notification_counters in sync with triggers on notifications
+
+SQLite and MySQL: AFTER INSERT/UPDATE/DELETE triggers, so writes that bypass
+app/services/notifications.py still move the counter. The counters are rebuilt once to
+clear any drift from such writes made before the triggers existed.
+
+Revision ID: 0006_notification_counter_triggers
+Revises: 0005_deals_updated_at_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.services.notifications import drop_unread_triggers, ensure_unread_triggers
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_notification_counter_triggers"
+down_revision: Union[str, None] = "0005_deals_updated_at_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    ensure_unread_triggers(op.get_bind())
+    op.execute("DELETE FROM notification_counters")
+    op.execute(
+        "INSERT INTO notification_counters (user_id, unread) "
+        "SELECT user_id, COUNT(id) FROM notifications WHERE NOT is_read GROUP BY user_id"
+    )
+
+
+def downgrade() -> None:
+    drop_unread_triggers(op.get_bind())
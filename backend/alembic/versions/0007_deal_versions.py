@@ -0,0 +1,41 @@
+"""Per-scope deal write counters for the forecast cache
+
+deal_versions holds one counter per deals scope ('all', 'account:<id>', 'owner:<id>'),
+bumped by AFTER INSERT/UPDATE/DELETE triggers on deals (SQLite and MySQL), so
+app/services/forecast.pipeline_version is a primary-key lookup that cannot miss edits
+landing within the same second.
+
+Revision ID: 0007_deal_versions
+Revises: 0006_notification_counter_triggers
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.services.forecast import drop_pipeline_triggers, ensure_pipeline_triggers
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007_deal_versions"
+down_revision: Union[str, None] = "0006_notification_counter_triggers"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Starts empty: every scope reads as version 0 until its first write
+    op.create_table(
+        "deal_versions",
+        sa.Column("scope", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("scope"),
+    )
+    ensure_pipeline_triggers(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_pipeline_triggers(op.get_bind())
+    op.drop_table("deal_versions")
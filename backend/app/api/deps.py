@@ -1,38 +1,66 @@
 from typing import Annotated
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+from jose import JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.core.config import settings
+from app.core.cache import TTLCache
+from app.core.security import decode_access_token
 from app.db.session import get_db
-from app.db.models import User, UserStatus
+from app.db.models import User, UserStatus, RoleEnum
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# sub -> column snapshot of the user (identity, role, status), minus credentials.
+# Per-process: other workers see changes once their entry's TTL runs out, hence the short
+# USER_CACHE_TTL_SECONDS default. Hit/miss counters are served by GET /api/admin/caches.
+user_cache = TTLCache(maxsize=settings.USER_CACHE_MAX_SIZE, ttl=settings.USER_CACHE_TTL_SECONDS)
+_UNCACHED_COLUMNS = {"hashed_password", "otp"}
+
+def invalidate_user(user_id: str) -> None:
+    user_cache.pop(user_id)
+
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[AsyncSession, Depends(get_db)]
 ) -> User:
+    """The caller's User. On a user_cache hit this is a transient User built from the snapshot:
+    column values only, with hashed_password and otp unset, no loaded relationships and no
+    session. Handlers may read its columns (id, role, status, profile fields); anything else
+    (credentials, relationships, changing the row) must load the user from `db` first, as
+    PATCH /api/users/{id} does through update_returning.
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        payload = decode_access_token(token)
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
     except JWTError:
         raise credentials_exception
     
+    if settings.USER_CACHE_ENABLED:
+        cached = user_cache.get(user_id)
+        if cached is not None:
+            # Detached User built from the snapshot; no DB round-trip
+            return User(**cached)
+
     # Fetch user from DB
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     
     if user is None:
         raise credentials_exception
+
+    if settings.USER_CACHE_ENABLED:
+        user_cache.set(user_id, {
+            c.key: getattr(user, c.key) for c in User.__table__.columns if c.key not in _UNCACHED_COLUMNS
+        })
     
     return user
 
@@ -42,3 +70,10 @@ async def get_current_active_user(
     if current_user.status != UserStatus.ACTIVE:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
+
+async def get_current_admin_user(
+    current_user: Annotated[User, Depends(get_current_active_user)]
+) -> User:
+    if current_user.role != RoleEnum.ADMIN:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+    return current_user
@@ -0,0 +1,128 @@
+"""
+Opt-in fast JSON path and sparse fieldsets for list endpoints.
+
+The default path loads ORM objects, has FastAPI validate every row against the
+`response_model` with from_attributes (through a Union when the endpoint can also return a
+CursorPage) and then serializes the result. With the fast path the handler instead selects
+only the response schema's columns and encodes the plain rows straight to JSON bytes:
+
+    orjson installed    rows -> orjson.dumps, no validation pass
+    otherwise           rows -> json.dumps (C encoder, datetimes as isoformat)
+
+Either way the body decodes to the same JSON as the response_model output (same keys and
+order, datetime text, enum values, nulls and float values; only exponent spelling such as
+1e20 vs 1e+20 can differ), and returning a Response makes FastAPI skip its own validation. The response_model stays on the route for the OpenAPI schema.
+
+Sparse fieldsets (`?fields=first_name,email`, parsed by the sparse_fields dependency) take
+the same path with only those columns in the SELECT, so wide Text columns such as
+Account.billing_address are never read. `id` is always included. When the fast path is
+off, the rows are still validated, against a trimmed copy of the response schema.
+"""
+import json
+from datetime import datetime
+from functools import lru_cache
+from typing import Annotated, Any, Callable, List, Optional, Tuple, Type
+from fastapi import HTTPException, Query, Response
+from pydantic import BaseModel, TypeAdapter, create_model
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.pagination import encode_cursor
+from app.core.config import settings
+from app.schemas.schemas import CursorPage
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def sparse_fields(schema: Type[BaseModel], model: Any) -> Callable:
+    """Dependency for a `fields` query parameter: a comma-separated subset of `schema`'s fields.
+
+    Resolves to None when absent, else the chosen names plus "id" in schema order.
+    Raises TypeError when the route is defined if a field of `schema` is not a column of
+    `model`, since fast_json_list selects the fields by column name.
+    """
+    allowed = tuple(schema.model_fields)
+    missing = [name for name in allowed if name not in model.__table__.c]
+    if missing:
+        raise TypeError(f"{schema.__name__} fields are not {model.__tablename__} columns: {', '.join(missing)}")
+
+    def dependency(
+        fields: Annotated[Optional[str], Query(description=f"Comma-separated subset of: {', '.join(allowed)}")] = None
+    ) -> Optional[Tuple[str, ...]]:
+        if not fields:
+            return None
+        names = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = names.difference(allowed)
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+        names.add("id")
+        return tuple(name for name in allowed if name in names)
+
+    return dependency
+
+@lru_cache(maxsize=None)
+def trimmed_schema(schema: Type[BaseModel], names: Tuple[str, ...]) -> Type[BaseModel]:
+    """`schema` with only `names`, keeping each field's type and constraints."""
+    return create_model(
+        f"{schema.__name__}Fields",
+        **{name: (schema.model_fields[name].annotation, schema.model_fields[name]) for name in names},
+    )
+
+@lru_cache(maxsize=None)
+def _adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+@lru_cache(maxsize=None)
+def _columns(model: Any, names: Tuple[str, ...]) -> tuple:
+    # Every field of the list schemas is a plain column of the same name (sparse_fields checks)
+    return tuple(model.__table__.c[name] for name in names)
+
+def _default(value: Any) -> Any:
+    # Same text as pydantic's and orjson's for the naive datetimes the DB returns
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _dumps(content: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode()
+
+async def fast_json_list(
+    db: AsyncSession,
+    query: Select,
+    model: Any,
+    schema: Type[BaseModel],
+    page_limit: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> Response:
+    """Run `query` projected onto `schema`'s columns (or just `fields`) and return the rows
+    as a JSON Response.
+
+    With `page_limit` the query must come from keyset_paginate, and the body is a
+    CursorPage: {"items": [...], "next_cursor": ...}.
+    """
+    names = fields or tuple(schema.model_fields)
+    # The next cursor needs created_at even when the client did not ask for it
+    extra = ("created_at",) if page_limit is not None and "created_at" not in names else ()
+    result = await db.execute(query.with_only_columns(*_columns(model, names + extra)))
+    keys = list(result.keys())
+    rows = [dict(zip(keys, row)) for row in result.all()]
+
+    content: Any = rows
+    if page_limit is not None:
+        next_cursor = None
+        if len(rows) > page_limit:
+            rows = rows[:page_limit]
+            if rows:
+                next_cursor = encode_cursor(rows[-1]["created_at"], rows[-1]["id"])
+        for row in rows if extra else ():
+            del row["created_at"]
+        content = {"items": rows, "next_cursor": next_cursor}
+
+    if fields and not settings.FAST_JSON_RESPONSES:
+        item = trimmed_schema(schema, fields)
+        adapter = _adapter(List[item] if page_limit is None else CursorPage[item])
+        return Response(adapter.dump_json(adapter.validate_python(content)), media_type="application/json")
+    return Response(_dumps(content), media_type="application/json")
@@ -0,0 +1,47 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, Sequence, Tuple
+from fastapi import HTTPException
+from sqlalchemy import Select, and_, desc, or_
+
+# Keyset pagination over (created_at, id).
+# The cursor is an opaque urlsafe-base64 blob of the last row's sort key, so a page
+# is a bounded index range scan instead of an OFFSET scan over every skipped row.
+
+def encode_cursor(created_at: datetime, id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def keyset_condition(model: Any, cursor: str):
+    """Rows strictly after `cursor` in (created_at, id) DESC order."""
+    created_at, last_id = decode_cursor(cursor)
+    return or_(
+        model.created_at < created_at,
+        and_(model.created_at == created_at, model.id < last_id)
+    )
+
+def keyset_paginate(query: Select, model: Any, cursor: str, limit: int) -> Select:
+    """Order by (created_at, id) DESC and start after `cursor` ("" = first page).
+
+    Fetches one extra row so `cursor_page` knows whether another page exists.
+    """
+    if cursor:
+        query = query.where(keyset_condition(model, cursor))
+    return query.order_by(desc(model.created_at), desc(model.id)).limit(limit + 1)
+
+def cursor_page(rows: Sequence[Any], limit: int) -> dict:
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        last = items[-1]
+        next_cursor = encode_cursor(last.created_at, last.id)
+    return {"items": items, "next_cursor": next_cursor}
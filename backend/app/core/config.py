@@ -12,11 +12,81 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "your-super-secret-key-change-this-in-production"
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
+
+    # Authenticated-user cache (app/api/deps.get_current_user). Per-process: invalidate_user
+    # only clears the worker that handled the change, so with several workers a suspension or
+    # role change reaches the others after up to USER_CACHE_TTL_SECONDS. Keep it short.
+    USER_CACHE_ENABLED: bool = True
+    USER_CACHE_TTL_SECONDS: int = 5
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # Decoded-JWT cache (app/core/security.decode_access_token); entries never outlive `exp`
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_TTL_SECONDS: int = 300
+    TOKEN_CACHE_MAX_SIZE: int = 10000
+
+    # Password hashing pool (app/core/security); 0 workers hashes inline on the event loop
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_PENDING: int = 64  # queued + running; beyond this login/register return 429
     
     # Database
     # Default to SQLite for ease of use if MySQL env vars aren't set, but prefer MySQL structure
     DATABASE_URL: str = "sqlite+aiosqlite:///./crm.db" 
+
+    # Connection pool; unset values fall back to per-dialect defaults in app/db/session.py
+    DB_POOL_SIZE: Optional[int] = None
+    DB_MAX_OVERFLOW: Optional[int] = None
+    DB_POOL_TIMEOUT: Optional[float] = None  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: Optional[int] = None  # seconds; -1 disables
+    DB_POOL_PRE_PING: Optional[bool] = None
+
+    # SQLite pragmas applied to every new connection (ignored on other dialects)
+    SQLITE_JOURNAL_MODE: str = "WAL"  # readers no longer block on a writer
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # durable in WAL mode except on power loss
+    SQLITE_MMAP_SIZE: int = 256 * 1024 * 1024  # bytes
+    SQLITE_CACHE_SIZE: int = -64000  # negative = KiB, i.e. ~64MB page cache per connection
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
     
+    # Bulk lead import (POST /api/leads/bulk)
+    BULK_IMPORT_CHUNK_SIZE: int = 1000  # rows per INSERT + commit
+    BULK_IMPORT_MAX_ERRORS: int = 1000  # row errors reported before truncating the list
+    BULK_IMPORT_MAX_LINE_LENGTH: int = 1024 * 1024  # characters
+
+    # Streaming exports (GET /api/{entity}/export)
+    EXPORT_BATCH_SIZE: int = 1000  # rows fetched from the server-side cursor per partition
+
+    # List endpoints: encode rows straight to JSON instead of validating ORM objects (app/api/fast_json.py)
+    FAST_JSON_RESPONSES: bool = False
+
+    # Real-time events (/api/ws, app/realtime); "unix" shares events between workers on one host
+    REALTIME_BACKPLANE: str = "inprocess"  # inprocess | unix
+    REALTIME_SOCKET_DIR: str = "/tmp/crm-realtime"
+    REALTIME_MAX_EVENT_BYTES: int = 64 * 1024  # encoded event size limit for "unix"; larger events are logged and dropped
+    WS_SEND_QUEUE_SIZE: int = 256  # queued messages per connection before it is dropped as slow
+    WS_SEND_TIMEOUT_SECONDS: float = 5.0
+    WS_MAX_SUBSCRIPTIONS: int = 100  # topics per connection
+
+    # Audit log writer (app/services/audit.py)
+    AUDIT_QUEUE_MAX_SIZE: int = 10000  # events beyond this are dropped and counted
+    AUDIT_BATCH_SIZE: int = 500  # events per INSERT
+    AUDIT_FLUSH_INTERVAL_MS: int = 200  # max time an event waits before its batch is written
+
+    # Deal forecast (GET /api/deals/forecast)
+    FORECAST_COMMIT_PROBABILITY: int = 90  # open deals at or above this count towards worst_case
+    FORECAST_CACHE_MAX_SIZE: int = 8  # cached pipelines (one per account/owner filter)
+    FORECAST_CACHE_TTL_SECONDS: int = 300  # frees idle pipelines; freshness comes from the version check
+
+    # Monte Carlo revenue simulation (GET /api/deals/simulation)
+    SIMULATION_DEFAULT_TRIALS: int = 10000
+    SIMULATION_MAX_TRIALS: int = 100000
+    SIMULATION_SLIP_PROBABILITY: float = 0.3  # chance an open deal closes later than its closing_date
+    SIMULATION_MAX_SLIP_MONTHS: int = 3
+    SIMULATION_SEED: int = 0  # fixed so repeated runs over the same pipeline agree
+    SIMULATION_WORKERS: int = 0  # process pool size; 0 always runs in a thread
+    SIMULATION_POOL_MIN_CELLS: int = 50_000_000  # trials x open deals from which the pool is used
+    SIMULATION_CACHE_MAX_SIZE: int = 32
+    SIMULATION_CACHE_TTL_SECONDS: int = 600
+
     # Email
     MAIL_USERNAME: str = "replace_me"
     MAIL_PASSWORD: str = "replace_me"
@@ -1,17 +1,65 @@
+import asyncio
+import hashlib
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.cache import TTLCache
 
 pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
 
+# SHA-256(token) -> verified claims. Only successfully verified tokens are cached.
+token_cache = TTLCache(maxsize=settings.TOKEN_CACHE_MAX_SIZE, ttl=settings.TOKEN_CACHE_TTL_SECONDS)
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+class HashingPoolSaturated(Exception):
+    """Too many password hash operations are already queued; the caller should back off."""
+
+# pbkdf2 runs in hashlib's C code with the GIL released, so threads keep the event loop free
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_pending = 0
+
+def _get_hash_executor() -> ThreadPoolExecutor:
+    global _hash_executor
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+    return _hash_executor
+
+async def _run_hashing(fn, *args):
+    global _hash_pending
+    if settings.PASSWORD_HASH_WORKERS <= 0:
+        return fn(*args)
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise HashingPoolSaturated()
+    _hash_pending += 1
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_get_hash_executor(), fn, *args)
+    finally:
+        _hash_pending -= 1
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await _run_hashing(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await _run_hashing(get_password_hash, password)
+
+def hash_pool_stats() -> dict:
+    return {"workers": settings.PASSWORD_HASH_WORKERS, "pending": _hash_pending, "max_pending": settings.PASSWORD_HASH_MAX_PENDING}
+
+def shutdown_hash_pool() -> None:
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     if expires_delta:
@@ -21,3 +69,25 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode.update({"exp": expire})
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
+
+def decode_access_token(token: str) -> dict:
+    """Verify and decode a JWT, reusing the result for repeat presentations of the same token.
+
+    Raises JWTError like jwt.decode. The returned claims must be treated as read-only.
+    """
+    if not settings.TOKEN_CACHE_ENABLED:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    key = hashlib.sha256(token.encode()).digest()
+    claims = token_cache.get(key)
+    if claims is not None:
+        return claims
+
+    claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    ttl = settings.TOKEN_CACHE_TTL_SECONDS
+    exp = claims.get("exp")
+    if isinstance(exp, (int, float)):
+        ttl = min(ttl, exp - time.time())
+    if ttl > 0:
+        token_cache.set(key, claims, expires_at=time.monotonic() + ttl)
+    return claims
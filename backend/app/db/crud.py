@@ -0,0 +1,41 @@
+from typing import Any, Optional, Type
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Single-statement PATCH: UPDATE ... WHERE id = :id RETURNING * instead of SELECT, mutate, flush.
+# MySQL has no UPDATE ... RETURNING, so there the UPDATE runs on its own, rowcount decides the
+# 404 (the MySQL drivers connect with CLIENT.FOUND_ROWS, so an unchanged row still counts as
+# matched) and the row is read back with a primary-key SELECT.
+
+async def update_returning(db: AsyncSession, model: Type[Any], id: str, values: dict) -> Optional[Any]:
+    """Apply `values` to the row with this id and return it, or None if no row matched.
+
+    Keys that are not columns of `model` are dropped. SET clauses are rendered in the
+    order of `values`; MySQL evaluates them left to right, so a CASE that reads a column
+    must come before the assignment to that column.
+    """
+    columns = model.__table__.columns
+    values = {k: v for k, v in values.items() if k in columns}
+    if not values:
+        result = await db.execute(select(model).where(model.id == id))
+        return result.scalar_one_or_none()
+
+    stmt = (
+        update(model)
+        .where(model.id == id)
+        .ordered_values(*values.items())
+        .execution_options(synchronize_session=False)
+    )
+    if db.bind.dialect.update_returning:
+        # populate_existing: an instance already in the identity map (e.g. the current user,
+        # loaded by get_current_user) is overwritten with the returned row, not handed back stale
+        result = await db.execute(stmt.returning(model).execution_options(populate_existing=True))
+        return result.scalar_one_or_none()
+
+    result = await db.execute(stmt)
+    if result.rowcount == 0:
+        return None
+    result = await db.execute(
+        select(model).where(model.id == id).execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
@@ -1,5 +1,9 @@
 from app.db.session import engine, Base
 from app.db import models
+from app.db.search import ensure_search_index
+from app.services.forecast import ensure_pipeline_triggers
+from app.services.lead_stats import ensure_lead_stats
+from app.services.notifications import ensure_unread_counters
 
 async def init_db():
     async with engine.begin() as conn:
@@ -8,3 +12,7 @@ async def init_db():
         # comment out drop_all if you want to persist data across restarts
         # await conn.run_sync(Base.metadata.drop_all) 
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(ensure_search_index)
+        await ensure_lead_stats(conn)
+        await ensure_unread_counters(conn)
+        await conn.run_sync(ensure_pipeline_triggers)
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 from typing import Optional
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Float, Text, Enum as SQLEnum, Integer
+from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Float, Text, Enum as SQLEnum, Integer, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from app.db.base import Base
 import enum
@@ -9,6 +9,11 @@ import enum
 def generate_uuid():
     return str(uuid.uuid4())
 
+def utcnow() -> datetime:
+    # Naive UTC, the form DateTime columns hand back on read, so a freshly created
+    # instance serializes the same as the row loaded later
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 class RoleEnum(str, enum.Enum):
     ADMIN = "ADMIN"
     MANAGER = "MANAGER"
@@ -36,6 +41,9 @@ class DealStage(str, enum.Enum):
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
     email: Mapped[str] = mapped_column(String, unique=True, index=True)
@@ -49,8 +57,8 @@ class User(Base):
     avatar: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     last_seen: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     is_online: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
 
     # Relationships
     accounts = relationship("Account", back_populates="owner")
@@ -63,6 +71,9 @@ class User(Base):
 class Account(Base):
     """Replaces 'Customer'. Represents a Company/Organization."""
     __tablename__ = "accounts"
+    __table_args__ = (
+        Index("ix_accounts_created_at_id", "created_at", "id"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
     name: Mapped[str] = mapped_column(String, index=True) # Company Name
@@ -70,8 +81,8 @@ class Account(Base):
     website: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     phone: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     billing_address: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     
     created_by_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     owner = relationship("User", back_populates="accounts")
@@ -83,6 +94,10 @@ class Account(Base):
 class Contact(Base):
     """Represents a Person within an Account."""
     __tablename__ = "contacts"
+    __table_args__ = (
+        Index("ix_contacts_created_at_id", "created_at", "id"),
+        Index("ix_contacts_account_id_created_at", "account_id", "created_at"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
     first_name: Mapped[str] = mapped_column(String)
@@ -97,12 +112,16 @@ class Contact(Base):
     owner_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     owner = relationship("User", back_populates="contacts")
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
 class Lead(Base):
     """Unqualified prospect."""
     __tablename__ = "leads"
+    __table_args__ = (
+        Index("ix_leads_created_at_id", "created_at", "id"),
+        Index("ix_leads_status_created_at", "status", "created_at"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
     first_name: Mapped[str] = mapped_column(String)
@@ -117,8 +136,8 @@ class Lead(Base):
     created_by_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     owner = relationship("User", back_populates="leads")
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
     converted_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # When converted, link to the created entities (optional tracking)
@@ -126,9 +145,23 @@ class Lead(Base):
     converted_contact_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
     converted_deal_id: Mapped[Optional[str]] = mapped_column(String, nullable=True)
 
+class LeadStat(Base):
+    """Per-status lead count and value total, kept current by the lead write paths."""
+    __tablename__ = "lead_stats"
+    
+    status: Mapped[str] = mapped_column(String, primary_key=True)
+    count: Mapped[int] = mapped_column(Integer, default=0)
+    total_value: Mapped[float] = mapped_column(Float, default=0.0)
+
 class Deal(Base):
     """Sales Opportunity."""
     __tablename__ = "deals"
+    __table_args__ = (
+        Index("ix_deals_created_at_id", "created_at", "id"),
+        Index("ix_deals_stage_created_at", "stage", "created_at"),
+        Index("ix_deals_account_id_created_at", "account_id", "created_at"),
+        Index("ix_deals_updated_at", "updated_at"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
     name: Mapped[str] = mapped_column(String) # Deal Name
@@ -146,11 +179,15 @@ class Deal(Base):
     owner_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     owner = relationship("User", back_populates="deals")
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
 class Activity(Base):
     __tablename__ = "activities"
+    __table_args__ = (
+        Index("ix_activities_created_at_id", "created_at", "id"),
+        Index("ix_activities_lead_id_created_at", "lead_id", "created_at"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
     type: Mapped[str] = mapped_column(String) # CALL, MEETING, EMAIL, NOTE
@@ -169,10 +206,14 @@ class Activity(Base):
     
     deal_id: Mapped[Optional[str]] = mapped_column(ForeignKey("deals.id"), nullable=True)
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
 
 class Notification(Base):
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_id_created_at", "user_id", "created_at"),
+        Index("ix_notifications_user_id_is_read_created_at", "user_id", "is_read", "created_at"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
     title: Mapped[str] = mapped_column(String)
@@ -182,10 +223,27 @@ class Notification(Base):
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
     user = relationship("User", back_populates="notifications")
     
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+
+class NotificationCounter(Base):
+    """Per-user unread notification count, kept current by triggers on notifications (app/services/notifications.py)."""
+    __tablename__ = "notification_counters"
+    
+    user_id: Mapped[str] = mapped_column(ForeignKey("users.id"), primary_key=True)
+    unread: Mapped[int] = mapped_column(Integer, default=0)
+
+class DealVersion(Base):
+    """Write counter per deals scope ('all', 'account:<id>', 'owner:<id>'), bumped by triggers on deals (app/services/forecast.py)."""
+    __tablename__ = "deal_versions"
+
+    scope: Mapped[str] = mapped_column(String, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0)
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_created_at", "created_at"),
+    )
     
     id: Mapped[str] = mapped_column(String, primary_key=True, default=generate_uuid)
     action: Mapped[str] = mapped_column(String) # CREATE, UPDATE, DELETE
@@ -194,4 +252,4 @@ class AuditLog(Base):
     changes: Mapped[Optional[str]] = mapped_column(Text, nullable=True) # JSON string
     
     user_id: Mapped[str] = mapped_column(ForeignKey("users.id"))
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=lambda: datetime.now(timezone.utc))
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
@@ -0,0 +1,179 @@
+import asyncio
+import re
+from typing import List, Optional, Sequence
+from sqlalchemy import text, or_, literal, select
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models import Lead, Contact, Account
+
+# Full-text search over leads, contacts and accounts.
+#
+# SQLite: one external-content FTS5 table per entity (<table>_fts), kept in sync by
+# AFTER INSERT/UPDATE/DELETE triggers so every write path (routers, bulk SQL) is covered.
+# The FTS rowid mirrors the base table's implicit rowid; run rebuild_search_index after a
+# VACUUM, which may renumber rowids on tables without an INTEGER PRIMARY KEY:
+#
+#     python -m app.db.search        (or POST /api/admin/search/rebuild)
+#
+# MySQL: InnoDB FULLTEXT indexes on the base tables, maintained by the engine itself.
+#
+# Any other dialect falls back to the old ILIKE scan.
+
+SEARCH_ENTITIES = {
+    # entity: (table, indexed columns, title SQL, subtitle SQL)
+    "lead": ("leads", ["first_name", "last_name", "company", "email", "title"],
+             "t.first_name || ' ' || t.last_name", "t.company"),
+    "contact": ("contacts", ["first_name", "last_name", "email", "title"],
+                "t.first_name || ' ' || t.last_name", "t.email"),
+    "account": ("accounts", ["name", "industry", "website"],
+                "t.name", "t.industry"),
+}
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+def _tokens(q: str) -> List[str]:
+    return _TOKEN_RE.findall(q)
+
+def fts5_query(q: str) -> Optional[str]:
+    """Quote every token and prefix-match it so user input can't inject FTS syntax."""
+    tokens = _tokens(q)
+    return " ".join(f'"{t}"*' for t in tokens) if tokens else None
+
+def boolean_mode_query(q: str) -> Optional[str]:
+    tokens = _tokens(q)
+    return " ".join(f"+{t}*" for t in tokens) if tokens else None
+
+def _sqlite_ddl(entity: str) -> List[str]:
+    table, columns, _, _ = SEARCH_ENTITIES[entity]
+    fts = f"{table}_fts"
+    cols = ", ".join(columns)
+    new_vals = ", ".join(f"new.{c}" for c in columns)
+    old_vals = ", ".join(f"old.{c}" for c in columns)
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{table}', content_rowid='rowid', tokenize='unicode61')",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ai AFTER INSERT ON {table} BEGIN "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_vals}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_fts_ad AFTER DELETE ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_vals}); END",
+        f"CREATE TRIGGER IF NOT EXISTS {table}_fts_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+        f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ('delete', old.rowid, {old_vals}); "
+        f"INSERT INTO {fts}(rowid, {cols}) VALUES (new.rowid, {new_vals}); END",
+    ]
+
+def ensure_search_index(conn: Connection) -> None:
+    """Create the dialect's search structures if missing (sync; use via run_sync)."""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        for entity, (table, _, _, _) in SEARCH_ENTITIES.items():
+            exists = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+                {"name": f"{table}_fts"}
+            ).first()
+            for ddl in _sqlite_ddl(entity):
+                conn.exec_driver_sql(ddl)
+            if not exists:
+                # Backfill rows written before the index existed
+                conn.exec_driver_sql(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+    elif dialect == "mysql":
+        for table, columns, _, _ in SEARCH_ENTITIES.values():
+            exists = conn.execute(
+                text(
+                    "SELECT 1 FROM information_schema.statistics "
+                    "WHERE table_schema = DATABASE() AND table_name = :table AND index_name = :name"
+                ),
+                {"table": table, "name": f"ft_{table}"}
+            ).first()
+            if not exists:
+                conn.exec_driver_sql(f"CREATE FULLTEXT INDEX ft_{table} ON {table} ({', '.join(columns)})")
+
+def rebuild_search_index(conn: Connection) -> None:
+    """Repopulate the SQLite FTS tables from their base tables (sync; use via run_sync).
+
+    A no-op elsewhere: MySQL's FULLTEXT indexes are maintained by InnoDB.
+    """
+    if conn.dialect.name == "sqlite":
+        for table, _, _, _ in SEARCH_ENTITIES.values():
+            conn.exec_driver_sql(f"INSERT INTO {table}_fts({table}_fts) VALUES ('rebuild')")
+
+def lead_search_clause(dialect: str, search: str):
+    """WHERE clause for get_leads' `search` param, using the index when there is one."""
+    table, columns, _, _ = SEARCH_ENTITIES["lead"]
+    if dialect == "sqlite":
+        query = fts5_query(search)
+        if query is None:
+            return literal(True)
+        return text(f"leads.rowid IN (SELECT rowid FROM {table}_fts WHERE {table}_fts MATCH :lead_search)").bindparams(lead_search=query)
+    if dialect == "mysql":
+        query = boolean_mode_query(search)
+        if query is None:
+            return literal(True)
+        return text(f"MATCH ({', '.join(columns)}) AGAINST (:lead_search IN BOOLEAN MODE)").bindparams(lead_search=query)
+
+    search_filter = f"%{search}%"
+    return or_(
+        Lead.first_name.ilike(search_filter),
+        Lead.last_name.ilike(search_filter),
+        Lead.company.ilike(search_filter),
+        Lead.email.ilike(search_filter)
+    )
+
+def _ranked_sql(dialect: str, entity: str) -> str:
+    table, columns, title, subtitle = SEARCH_ENTITIES[entity]
+    if dialect == "sqlite":
+        # bm25() is lower-is-better; negate so every dialect sorts by score DESC
+        return (
+            f"SELECT * FROM (SELECT '{entity}' AS entity, t.id AS id, {title} AS title, {subtitle} AS subtitle, "
+            f"-bm25({table}_fts) AS score FROM {table}_fts JOIN {table} t ON t.rowid = {table}_fts.rowid "
+            f"WHERE {table}_fts MATCH :q ORDER BY score DESC LIMIT :limit)"
+        )
+    match = f"MATCH ({', '.join('t.' + c for c in columns)}) AGAINST (:q IN BOOLEAN MODE)"
+    title = title.replace("t.first_name || ' ' || t.last_name", "CONCAT(t.first_name, ' ', t.last_name)")
+    return (
+        f"(SELECT '{entity}' AS entity, t.id AS id, {title} AS title, {subtitle} AS subtitle, "
+        f"{match} AS score FROM {table} t WHERE {match} ORDER BY score DESC LIMIT :limit)"
+    )
+
+async def _ilike_search(db: AsyncSession, q: str, entities: Sequence[str], limit: int) -> List[dict]:
+    pattern = f"%{q}%"
+    results = []
+    if "lead" in entities:
+        rows = await db.execute(select(Lead).where(lead_search_clause("", q)).limit(limit))
+        results += [{"entity": "lead", "id": l.id, "title": f"{l.first_name} {l.last_name}", "subtitle": l.company, "score": 0.0} for l in rows.scalars()]
+    if "contact" in entities:
+        rows = await db.execute(select(Contact).where(or_(
+            Contact.first_name.ilike(pattern), Contact.last_name.ilike(pattern), Contact.email.ilike(pattern)
+        )).limit(limit))
+        results += [{"entity": "contact", "id": c.id, "title": f"{c.first_name} {c.last_name}", "subtitle": c.email, "score": 0.0} for c in rows.scalars()]
+    if "account" in entities:
+        rows = await db.execute(select(Account).where(Account.name.ilike(pattern)).limit(limit))
+        results += [{"entity": "account", "id": a.id, "title": a.name, "subtitle": a.industry, "score": 0.0} for a in rows.scalars()]
+    return results[:limit]
+
+async def search(db: AsyncSession, q: str, entities: Sequence[str], limit: int = 20) -> List[dict]:
+    """Ranked search across the requested entities, best match first."""
+    dialect = db.bind.dialect.name
+    if dialect not in ("sqlite", "mysql"):
+        return await _ilike_search(db, q, entities, limit)
+
+    query = fts5_query(q) if dialect == "sqlite" else boolean_mode_query(q)
+    if query is None or not entities:
+        return []
+
+    union = " UNION ALL ".join(_ranked_sql(dialect, e) for e in entities)
+    stmt = text(f"SELECT * FROM ({union}) AS ranked ORDER BY score DESC LIMIT :limit")
+    result = await db.execute(stmt, {"q": query, "limit": limit})
+    return [dict(row._mapping) for row in result]
+
+async def _main() -> None:
+    from app.db.session import engine
+    async with engine.begin() as conn:
+        await conn.run_sync(rebuild_search_index)
+        dialect = conn.dialect.name
+    await engine.dispose()
+    if dialect == "sqlite":
+        print(f"Rebuilt {', '.join(t for t, _, _, _ in SEARCH_ENTITIES.values())} search indexes")
+    else:
+        print(f"Nothing to rebuild on {dialect}")
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -1,21 +1,153 @@
+import time
+from sqlalchemy import exc, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.util import queue as sqla_queue
 from app.core.config import settings
 from app.db.base import Base
 
+# Per-dialect pool defaults, overridable through the DB_POOL_* settings.
+# MySQL drops idle connections after wait_timeout (and proxies often sooner), so recycle
+# well below that and pre-ping on checkout instead of handing out dead sockets.
+POOL_DEFAULTS = {
+    "sqlite": {"pool_size": 5, "max_overflow": 10, "pool_timeout": 30, "pool_recycle": -1, "pool_pre_ping": False},
+    "mysql": {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30, "pool_recycle": 1800, "pool_pre_ping": True},
+    "postgresql": {"pool_size": 10, "max_overflow": 20, "pool_timeout": 30, "pool_recycle": 3600, "pool_pre_ping": True},
+}
+
+class PoolMetrics:
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, waited: float) -> None:
+        self.wait_total += waited
+        self.wait_max = max(self.wait_max, waited)
+
+pool_metrics = PoolMetrics()
+
+class TimedQueue(sqla_queue.AsyncAdaptedQueue):
+    """The pool's idle-connection queue, timing each blocking get.
+
+    QueuePool only blocks here once pool_size + max_overflow connections are out, so this
+    is the time a checkout waited for another request to return a connection; opening a
+    new connection and the pre-ping happen after it and are not counted.
+    """
+
+    def get(self, block=True, timeout=None):
+        if not block:
+            return super().get(block, timeout)
+        start = time.perf_counter()
+        try:
+            return super().get(block, timeout)
+        finally:
+            pool_metrics.record_wait(time.perf_counter() - start)
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that counts checkouts and timeouts and times queue waits."""
+
+    _queue_class = TimedQueue
+
+    def connect(self):
+        pool_metrics.checkouts += 1
+        try:
+            return super().connect()
+        except exc.TimeoutError:
+            pool_metrics.timeouts += 1
+            raise
+
+def pool_options(database_url: str) -> dict:
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    if backend == "sqlite" and url.database in (None, "", ":memory:"):
+        # In-memory SQLite lives in a single connection; keep SQLAlchemy's StaticPool
+        return {}
+
+    options = dict(POOL_DEFAULTS.get(backend, POOL_DEFAULTS["postgresql"]))
+    overrides = {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+    options.update({k: v for k, v in overrides.items() if v is not None})
+    options["poolclass"] = InstrumentedQueuePool
+    return options
+
 # Create Async Engine
 # check_same_thread=False is needed only for SQLite
 connect_args = {"check_same_thread": False} if "sqlite" in settings.DATABASE_URL else {}
 
+engine_pool_options = pool_options(settings.DATABASE_URL)
+
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=False,
     connect_args=connect_args,
+    **engine_pool_options,
 )
 
+def sqlite_pragmas() -> dict:
+    return {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT_MS,
+    }
+
+def apply_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in sqlite_pragmas().items():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+if engine.dialect.name == "sqlite":
+    event.listen(engine.sync_engine, "connect", apply_sqlite_pragmas)
+
+def pool_status() -> dict:
+    pool = engine.pool
+    status = {
+        "dialect": engine.dialect.name,
+        "pool_class": type(pool).__name__,
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        status.update({
+            "size": pool.size(),
+            "checked_in": pool.checkedin(),
+            "checked_out": pool.checkedout(),
+            # QueuePool counts overflow from -pool_size; only connections beyond pool_size matter here
+            "overflow": max(pool.overflow(), 0),
+            # Configuration as passed to the engine, not read back from pool internals
+            "max_overflow": engine_pool_options["max_overflow"],
+            "timeout": engine_pool_options["pool_timeout"],
+            "recycle": engine_pool_options["pool_recycle"],
+            "pre_ping": engine_pool_options["pool_pre_ping"],
+        })
+    checkouts = pool_metrics.checkouts
+    status.update({
+        "checkouts": checkouts,
+        "timeouts": pool_metrics.timeouts,
+        # Time spent queued for a connection, averaged over all checkouts
+        "wait_ms_avg": round(pool_metrics.wait_total / checkouts * 1000, 3) if checkouts else 0.0,
+        "wait_ms_max": round(pool_metrics.wait_max * 1000, 3),
+    })
+    return status
+
 # Create Session Factory
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
+    # Write handlers return the committed object as-is, without a post-commit refresh SELECT.
+    # That is only safe while every column default is Python-side (populated at flush) and
+    # timestamps are naive UTC (models.utcnow), the form a later read returns; a server-side
+    # default or a column rewritten by a trigger would need db.refresh() again
     expire_on_commit=False,
     autocommit=False,
     autoflush=False,
@@ -1,16 +1,27 @@
 from contextlib import asynccontextmanager
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.core.config import settings
+from app.core.security import HashingPoolSaturated, shutdown_hash_pool
 from app.db.init_db import init_db
-from app.routers import auth, users, accounts, leads, contacts, deals, activities, notifications, audit_logs
+from app.realtime.hub import hub
+from app.services.audit import audit_writer
+from app.services.simulation import shutdown_simulation_pool
+from app.routers import auth, users, accounts, leads, contacts, deals, activities, notifications, audit_logs, search, admin, realtime
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
     await init_db()
+    await hub.start()
+    await audit_writer.start()
     yield
     # Shutdown
+    await hub.stop()
+    await audit_writer.stop()
+    shutdown_hash_pool()
+    shutdown_simulation_pool()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -27,6 +38,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.exception_handler(HashingPoolSaturated)
+async def hashing_pool_saturated_handler(request: Request, exc: HashingPoolSaturated):
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many authentication requests, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
 # Routers
 app.include_router(auth.router, prefix=f"{settings.API_V1_STR}/auth", tags=["auth"])
 app.include_router(users.router, prefix=f"{settings.API_V1_STR}/users", tags=["users"])
@@ -37,6 +56,9 @@ app.include_router(deals.router, prefix=f"{settings.API_V1_STR}/deals", tags=["d
 app.include_router(activities.router, prefix=f"{settings.API_V1_STR}/activities", tags=["activities"])
 app.include_router(notifications.router, prefix=f"{settings.API_V1_STR}/notifications", tags=["notifications"])
 app.include_router(audit_logs.router, prefix=f"{settings.API_V1_STR}/audit-logs", tags=["audit-logs"])
+app.include_router(search.router, prefix=f"{settings.API_V1_STR}/search", tags=["search"])
+app.include_router(admin.router, prefix=f"{settings.API_V1_STR}/admin", tags=["admin"])
+app.include_router(realtime.router, prefix=settings.API_V1_STR, tags=["realtime"])
 
 @app.get("/")
 async def root():
@@ -0,0 +1,272 @@
+"""
+Cross-worker event backplane for real-time delivery.
+
+Each worker publishes events to the backplane and hands whatever it receives, its own events
+included, to its local ConnectionManager. Either way every socket sees every event exactly
+once, whichever worker it happens to be connected to.
+
+  inprocess  single worker: publish calls the handler directly
+  unix       workers on one host: every worker binds a Unix datagram socket in
+             `socket_dir` and publish sends one datagram to each peer socket found there.
+             When a peer's receive queue is full, events wait in a bounded per-peer outbox
+             until the socket drains. Sockets left behind by dead workers are unlinked.
+             Each event travels as one datagram, so its encoded envelope must fit in
+             `max_event_bytes` (REALTIME_MAX_EVENT_BYTES, 64 KiB by default; keep it below
+             the kernel's net.core.wmem_default). Larger events are rejected on publish,
+             logged and counted as "oversize", and delivered to no worker, this one
+             included, so all sockets keep seeing the same stream. Publish ids and let
+             clients refetch instead of embedding large payloads.
+
+Delivery latency (publish -> handler) is recorded per received event and exposed by stats().
+"""
+import asyncio
+import collections
+import glob
+import json
+import logging
+import os
+import socket
+import time
+from typing import Awaitable, Callable, Deque, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[dict], Awaitable[None]]
+
+class LatencyMetrics:
+    """Delivery counters plus a window of recent latencies for percentiles."""
+
+    def __init__(self, window: int = 2048):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.recent: Deque[float] = collections.deque(maxlen=window)
+
+    def record(self, latency: float) -> None:
+        latency = max(latency, 0.0)
+        self.count += 1
+        self.total += latency
+        self.max = max(self.max, latency)
+        self.recent.append(latency)
+
+    def snapshot(self) -> dict:
+        recent = sorted(self.recent)
+
+        def pct(p: float) -> float:
+            return round(recent[min(int(len(recent) * p), len(recent) - 1)] * 1000, 3) if recent else 0.0
+
+        return {
+            "delivered": self.count,
+            "latency_ms_avg": round(self.total / self.count * 1000, 3) if self.count else 0.0,
+            "latency_ms_p50": pct(0.50),
+            "latency_ms_p99": pct(0.99),
+            "latency_ms_max": round(self.max * 1000, 3),
+        }
+
+class Backplane:
+    kind = "base"
+
+    def __init__(self):
+        self.handler: Optional[Handler] = None
+        self.metrics = LatencyMetrics()
+        self.published = 0
+
+    async def start(self, handler: Handler) -> None:
+        self.handler = handler
+
+    async def stop(self) -> None:
+        self.handler = None
+
+    async def publish(self, event: dict) -> None:
+        raise NotImplementedError
+
+    async def _deliver(self, event: dict, published_at: float) -> None:
+        self.metrics.record(time.time() - published_at)
+        if self.handler is not None:
+            await self.handler(event)
+
+    def stats(self) -> dict:
+        return {"backplane": self.kind, "published": self.published, **self.metrics.snapshot()}
+
+class InProcessBackplane(Backplane):
+    kind = "inprocess"
+
+    async def publish(self, event: dict) -> None:
+        self.published += 1
+        await self._deliver(event, time.time())
+
+class _Peer:
+    __slots__ = ("path", "sock", "outbox")
+
+    def __init__(self, path: str, sock: socket.socket):
+        self.path = path
+        self.sock = sock
+        self.outbox: Deque[bytes] = collections.deque()
+
+class UnixSocketBackplane(Backplane):
+    kind = "unix"
+
+    def __init__(self, socket_dir: str, peer_refresh: float = 1.0, max_backlog: int = 10000,
+                 max_event_bytes: int = 65536):
+        super().__init__()
+        self.socket_dir = socket_dir
+        self.path = os.path.join(socket_dir, f"worker-{os.getpid()}.sock")
+        self.peer_refresh = peer_refresh
+        self.max_backlog = max_backlog
+        self.max_event_bytes = max_event_bytes
+        self.sock: Optional[socket.socket] = None
+        self._peers: Dict[str, _Peer] = {}
+        self._peers_at = 0.0
+        self._inbox: asyncio.Queue = asyncio.Queue()
+        self._dispatcher: Optional[asyncio.Task] = None
+        self.counters: Dict[str, int] = {"sent": 0, "backlogged": 0, "peer_full": 0, "stale_peers": 0, "oversize": 0, "errors": 0}
+
+    async def start(self, handler: Handler) -> None:
+        await super().start(handler)
+        os.makedirs(self.socket_dir, mode=0o700, exist_ok=True)
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self.sock.bind(self.path)
+        self.sock.setblocking(False)
+        loop = asyncio.get_running_loop()
+        loop.add_reader(self.sock.fileno(), self._on_readable)
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def stop(self) -> None:
+        for peer in list(self._peers.values()):
+            self._close_peer(peer)
+        if self.sock is not None:
+            asyncio.get_running_loop().remove_reader(self.sock.fileno())
+            self.sock.close()
+            self.sock = None
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        await super().stop()
+
+    def _on_readable(self) -> None:
+        while True:
+            try:
+                # Publishers never send more than max_event_bytes, so one read holds a whole datagram
+                data = self.sock.recv(self.max_event_bytes)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                self.counters["errors"] += 1
+                return
+            self._inbox.put_nowait(data)
+
+    async def _dispatch(self) -> None:
+        while True:
+            data = await self._inbox.get()
+            try:
+                envelope = json.loads(data)
+                await self._deliver(envelope["event"], envelope["ts"])
+            except Exception:
+                self.counters["errors"] += 1
+                logger.exception("Failed to deliver backplane event")
+
+    def _refresh_peers(self) -> None:
+        now = time.monotonic()
+        if now - self._peers_at <= self.peer_refresh:
+            return
+        self._peers_at = now
+        paths = set(glob.glob(os.path.join(self.socket_dir, "*.sock"))) - {self.path}
+        for path in paths - self._peers.keys():
+            sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+            sock.setblocking(False)
+            try:
+                # Connected, so the kernel reports writability against this peer's queue
+                sock.connect(path)
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Nobody bound to it any more: a worker that died without cleaning up
+                sock.close()
+                self.counters["stale_peers"] += 1
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
+                continue
+            self._peers[path] = _Peer(path, sock)
+        for path in self._peers.keys() - paths:
+            self._close_peer(self._peers[path])
+
+    def _close_peer(self, peer: _Peer) -> None:
+        self._peers.pop(peer.path, None)
+        if peer.outbox:
+            asyncio.get_running_loop().remove_writer(peer.sock.fileno())
+        peer.sock.close()
+
+    def _send(self, peer: _Peer, data: bytes) -> None:
+        if peer.outbox:
+            if len(peer.outbox) >= self.max_backlog:
+                # Peer has stopped reading; shed its oldest event rather than grow without bound
+                peer.outbox.popleft()
+                self.counters["peer_full"] += 1
+            peer.outbox.append(data)
+            return
+        try:
+            peer.sock.send(data)
+            self.counters["sent"] += 1
+        except (BlockingIOError, InterruptedError):
+            # Receive queue full (net.unix.max_dgram_qlen); resume once it drains
+            self.counters["backlogged"] += 1
+            peer.outbox.append(data)
+            asyncio.get_running_loop().add_writer(peer.sock.fileno(), self._flush, peer)
+        except ConnectionRefusedError:
+            # Peer exited; the next refresh reconnects or unlinks its socket
+            self._close_peer(peer)
+        except OSError:
+            self.counters["errors"] += 1
+            logger.exception("Failed to publish backplane event to %s", peer.path)
+
+    def _flush(self, peer: _Peer) -> None:
+        while peer.outbox:
+            try:
+                peer.sock.send(peer.outbox[0])
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                self._close_peer(peer)
+                return
+            peer.outbox.popleft()
+            self.counters["sent"] += 1
+        asyncio.get_running_loop().remove_writer(peer.sock.fileno())
+
+    async def publish(self, event: dict) -> None:
+        published_at = time.time()
+        if self.sock is not None:
+            data = json.dumps({"ts": published_at, "event": event}, default=str).encode()
+            if len(data) > self.max_event_bytes:
+                self.counters["oversize"] += 1
+                message = event.get("message") or {}
+                logger.warning(
+                    "Rejected %s event on %s: %d bytes exceeds the %d-byte backplane limit",
+                    message.get("type"), event.get("topic"), len(data), self.max_event_bytes,
+                )
+                return
+            self._refresh_peers()
+            for peer in list(self._peers.values()):
+                self._send(peer, data)
+        self.published += 1
+        await self._deliver(event, published_at)
+
+    def stats(self) -> dict:
+        return {
+            **super().stats(),
+            "peers": len(self._peers),
+            "backlog": sum(len(peer.outbox) for peer in self._peers.values()),
+            **self.counters,
+        }
+
+def create_backplane(kind: str, socket_dir: str, max_event_bytes: int = 65536) -> Backplane:
+    if kind == "inprocess":
+        return InProcessBackplane()
+    if kind == "unix":
+        return UnixSocketBackplane(socket_dir, max_event_bytes=max_event_bytes)
+    raise ValueError(f"Unknown realtime backplane: {kind}")
@@ -0,0 +1,112 @@
+"""
+Topic-based real-time events for the app API (/api/ws).
+
+Routers call `hub.publish(topic, type, data)` after their commit. The event goes through the
+backplane to every worker, and each worker sends it only to its own connections subscribed
+to that topic, serialized once per worker. Topics:
+
+  leads                     every lead create/update/delete/convert/import
+  deals:{account_id}        deals of one account
+  notifications:{user_id}   the user's own unread count; only that user may subscribe
+"""
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from pydantic import BaseModel
+from app.core.config import settings
+from app.realtime.backplane import Backplane, create_backplane
+from app.realtime.manager import Connection, ConnectionManager
+
+logger = logging.getLogger(__name__)
+
+_TOPIC_RE = re.compile(r"^(leads|deals:[\w-]{1,64}|notifications:[\w-]{1,64})$")
+
+class TopicHub:
+    def __init__(self, manager: ConnectionManager, backplane: Backplane, max_subscriptions: int):
+        self.manager = manager
+        self.backplane = backplane
+        self.max_subscriptions = max_subscriptions
+        self.subscriptions: Dict[str, Set[Connection]] = {}
+        self._topics: Dict[Connection, Set[str]] = {}
+
+    async def start(self) -> None:
+        await self.backplane.start(self.deliver)
+
+    async def stop(self) -> None:
+        await self.backplane.stop()
+        await self.manager.close()
+
+    @staticmethod
+    def check_topic(topic: str, user_id: str) -> Optional[str]:
+        """Return why `user_id` may not subscribe to `topic`, or None if it may."""
+        if not _TOPIC_RE.match(topic):
+            return f"Unknown topic: {topic}"
+        if topic.startswith("notifications:") and topic != f"notifications:{user_id}":
+            return f"Not allowed: {topic}"
+        return None
+
+    def subscribe(self, conn: Connection, topics: Iterable[str]) -> Tuple[List[str], List[str]]:
+        """Subscribe to each valid topic; returns (subscribed, errors)."""
+        subscribed, errors = [], []
+        current = self._topics.setdefault(conn, set())
+        for topic in topics:
+            error = self.check_topic(topic, conn.user_id)
+            if error is None and topic not in current and len(current) >= self.max_subscriptions:
+                error = f"Too many subscriptions (max {self.max_subscriptions})"
+            if error is not None:
+                errors.append(error)
+                continue
+            current.add(topic)
+            self.subscriptions.setdefault(topic, set()).add(conn)
+            subscribed.append(topic)
+        return subscribed, errors
+
+    def unsubscribe(self, conn: Connection, topics: Iterable[str]) -> List[str]:
+        current = self._topics.get(conn, set())
+        removed = []
+        for topic in topics:
+            if topic in current:
+                current.discard(topic)
+                conns = self.subscriptions.get(topic)
+                if conns is not None:
+                    conns.discard(conn)
+                    if not conns:
+                        del self.subscriptions[topic]
+                removed.append(topic)
+        return removed
+
+    def disconnect(self, conn: Connection) -> bool:
+        self.unsubscribe(conn, list(self._topics.get(conn, ())))
+        self._topics.pop(conn, None)
+        return self.manager.disconnect(conn)
+
+    def reply(self, conn: Connection, message: dict) -> None:
+        self.manager.send_text_to_connections((conn,), self.manager.encode(message))
+
+    async def publish(self, topic: str, type: str, data: Any) -> None:
+        """Publish a change event. Never raises: the write it reports is already committed."""
+        if isinstance(data, BaseModel):
+            data = data.model_dump(mode="json")
+        try:
+            await self.backplane.publish({"topic": topic, "message": {"type": type, "topic": topic, "data": data}})
+        except Exception:
+            logger.exception("Failed to publish %s to %s", type, topic)
+
+    async def deliver(self, event: dict) -> None:
+        conns = self.subscriptions.get(event["topic"])
+        if conns:
+            self.manager.send_text_to_connections(conns, self.manager.encode(event["message"]))
+
+    def stats(self) -> dict:
+        return {
+            "topics": len(self.subscriptions),
+            "subscriptions": sum(len(conns) for conns in self.subscriptions.values()),
+            "connections": self.manager.stats(),
+            "backplane": self.backplane.stats(),
+        }
+
+hub = TopicHub(
+    ConnectionManager(queue_size=settings.WS_SEND_QUEUE_SIZE, send_timeout=settings.WS_SEND_TIMEOUT_SECONDS),
+    create_backplane(settings.REALTIME_BACKPLANE, settings.REALTIME_SOCKET_DIR, settings.REALTIME_MAX_EVENT_BYTES),
+    settings.WS_MAX_SUBSCRIPTIONS,
+)
@@ -0,0 +1,149 @@
+"""
+WebSocket fan-out.
+
+Every connection gets a bounded send queue drained by its own sender task. A broadcast
+serializes the payload once and only enqueues the text, so one slow socket no longer stalls
+delivery to everyone else. A connection whose queue is full, or whose send exceeds
+`send_timeout`, is a slow consumer. It is closed with 1013 (try again later), and the client
+reconnects and refetches instead of the server buffering without bound for it.
+
+Connections are held per user in a set, so several tabs per user work. The per-user sets are
+spread over shards keyed by user id, and broadcast yields to the event loop between shards,
+so a fan-out to thousands of sockets does not hold the loop for the whole pass.
+"""
+import asyncio
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set
+from starlette.websockets import WebSocket
+
+# Close code for slow consumers (RFC 6455 "Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+class Connection:
+    __slots__ = ("user_id", "websocket", "queue", "task", "closed")
+
+    def __init__(self, user_id: str, websocket: WebSocket, queue_size: int):
+        self.user_id = user_id
+        self.websocket = websocket
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.task: Optional[asyncio.Task] = None
+        self.closed = False
+
+class ConnectionManager:
+    def __init__(self, shards: int = 16, queue_size: int = 256, send_timeout: float = 5.0):
+        self.shards: List[Dict[str, Set[Connection]]] = [{} for _ in range(shards)]
+        self.queue_size = queue_size
+        self.send_timeout = send_timeout
+        self.counters = {"sent": 0, "dropped_slow": 0, "send_errors": 0}
+        self._closing: Set[asyncio.Task] = set()
+
+    def _shard(self, user_id: str) -> Dict[str, Set[Connection]]:
+        return self.shards[hash(user_id) % len(self.shards)]
+
+    @staticmethod
+    def encode(message: Any) -> str:
+        return json.dumps(message, default=str)
+
+    async def connect(self, user_id: str, websocket: WebSocket) -> Connection:
+        await websocket.accept()
+        conn = Connection(user_id, websocket, self.queue_size)
+        self._shard(user_id).setdefault(user_id, set()).add(conn)
+        conn.task = asyncio.create_task(self._sender(conn))
+        return conn
+
+    def _remove(self, conn: Connection) -> None:
+        conn.closed = True
+        shard = self._shard(conn.user_id)
+        conns = shard.get(conn.user_id)
+        if conns is not None:
+            conns.discard(conn)
+            if not conns:
+                del shard[conn.user_id]
+        if conn.task is not None and conn.task is not asyncio.current_task():
+            conn.task.cancel()
+
+    def disconnect(self, conn: Connection) -> bool:
+        """Forget the connection. Returns True if the user has no other open connection."""
+        self._remove(conn)
+        return not self.is_connected(conn.user_id)
+
+    def is_connected(self, user_id: str) -> bool:
+        return user_id in self._shard(user_id)
+
+    def _drop(self, conn: Connection, code: int) -> None:
+        if conn.closed:
+            return
+        self._remove(conn)
+        task = asyncio.create_task(self._close(conn.websocket, code))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    @staticmethod
+    async def _close(websocket: WebSocket, code: int) -> None:
+        try:
+            await websocket.close(code=code)
+        except Exception:
+            pass
+
+    async def _sender(self, conn: Connection) -> None:
+        while True:
+            text = await conn.queue.get()
+            try:
+                await asyncio.wait_for(conn.websocket.send_text(text), self.send_timeout)
+            except asyncio.TimeoutError:
+                self.counters["dropped_slow"] += 1
+                self._drop(conn, SLOW_CONSUMER_CLOSE_CODE)
+                return
+            except Exception:
+                self.counters["send_errors"] += 1
+                self._drop(conn, 1011)
+                return
+            self.counters["sent"] += 1
+
+    def _offer(self, conn: Connection, text: str) -> None:
+        if conn.closed:
+            return
+        try:
+            conn.queue.put_nowait(text)
+        except asyncio.QueueFull:
+            self.counters["dropped_slow"] += 1
+            self._drop(conn, SLOW_CONSUMER_CLOSE_CODE)
+
+    def send_text_to_connections(self, conns: Iterable[Connection], text: str) -> None:
+        """Enqueue pre-encoded text for specific connections, e.g. a topic's subscribers."""
+        for conn in list(conns):
+            self._offer(conn, text)
+
+    def send_text_to(self, user_ids: Iterable[str], text: str) -> None:
+        """Enqueue pre-encoded text for every connection of the given users."""
+        for user_id in user_ids:
+            for conn in list(self._shard(user_id).get(user_id, ())):
+                self._offer(conn, text)
+
+    async def send_personal_message(self, message: dict, user_id: str):
+        self.send_text_to((user_id,), self.encode(message))
+
+    async def broadcast(self, message: dict, exclude_user: Optional[str] = None):
+        text = self.encode(message)
+        for shard in self.shards:
+            for user_id, conns in list(shard.items()):
+                if user_id != exclude_user:
+                    for conn in list(conns):
+                        self._offer(conn, text)
+            await asyncio.sleep(0)
+
+    async def close(self) -> None:
+        """Close every connection, e.g. on shutdown."""
+        for shard in self.shards:
+            for conns in list(shard.values()):
+                for conn in list(conns):
+                    self._drop(conn, 1001)
+        if self._closing:
+            await asyncio.gather(*self._closing, return_exceptions=True)
+
+    def stats(self) -> dict:
+        return {
+            "users": sum(len(shard) for shard in self.shards),
+            "connections": sum(len(conns) for shard in self.shards for conns in shard.values()),
+            **self.counters,
+        }
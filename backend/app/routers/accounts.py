@@ -1,11 +1,17 @@
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Literal, Optional, Tuple, Union
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.db.session import get_db
+from app.db.crud import update_returning
 from app.db.models import Account, User
-from app.schemas.schemas import AccountCreate, AccountUpdate, AccountResponse
+from app.schemas.schemas import AccountCreate, AccountUpdate, AccountResponse, CursorPage
 from app.api.deps import get_current_user
+from app.api.pagination import keyset_paginate, cursor_page
+from app.api.fast_json import fast_json_list, sparse_fields
+from app.core.config import settings
+from app.api.export import export_response
+from app.services.audit import audit_writer
 
 router = APIRouter()
 
@@ -21,20 +27,38 @@ async def create_account(
     )
     db.add(account)
     await db.commit()
-    await db.refresh(account)
+    audit_writer.record("CREATE", "ACCOUNT", account.id, current_user.id)
     return account
 
-@router.get("/", response_model=List[AccountResponse])
+@router.get("/", response_model=Union[List[AccountResponse], CursorPage[AccountResponse]])
 async def get_accounts(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    fields: Annotated[Optional[Tuple[str, ...]], Depends(sparse_fields(AccountResponse, Account))],
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None
 ):
+    if cursor is not None:
+        query = keyset_paginate(select(Account), Account, cursor, limit)
+        if settings.FAST_JSON_RESPONSES or fields:
+            return await fast_json_list(db, query, Account, AccountResponse, page_limit=limit, fields=fields)
+        result = await db.execute(query)
+        return cursor_page(result.scalars().all(), limit)
+
     query = select(Account).offset(skip).limit(limit).order_by(desc(Account.created_at))
+    if settings.FAST_JSON_RESPONSES or fields:
+        return await fast_json_list(db, query, Account, AccountResponse, fields=fields)
     result = await db.execute(query)
     return result.scalars().all()
 
+@router.get("/export")
+async def export_accounts(
+    current_user: Annotated[User, Depends(get_current_user)],
+    format: Literal["csv", "ndjson"] = "csv"
+):
+    return export_response(select(Account), Account, list(AccountResponse.model_fields), format, "accounts")
+
 @router.get("/{account_id}", response_model=AccountResponse)
 async def get_account(
     account_id: str,
@@ -54,17 +78,13 @@ async def update_account(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)]
 ):
-    result = await db.execute(select(Account).where(Account.id == account_id))
-    account = result.scalar_one_or_none()
+    update_data = account_in.model_dump(exclude_unset=True)
+    account = await update_returning(db, Account, account_id, update_data)
     if not account:
         raise HTTPException(status_code=404, detail="Account not found")
     
-    update_data = account_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(account, field, value)
-    
     await db.commit()
-    await db.refresh(account)
+    audit_writer.record("UPDATE", "ACCOUNT", account.id, current_user.id, account_in.model_dump(exclude_unset=True, mode="json"))
     return account
 
 @router.delete("/{account_id}")
@@ -80,4 +100,5 @@ async def delete_account(
         
     await db.delete(account)
     await db.commit()
+    audit_writer.record("DELETE", "ACCOUNT", account_id, current_user.id)
     return {"message": "Account deleted successfully"}
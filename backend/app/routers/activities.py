@@ -1,22 +1,28 @@
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Optional, Tuple, Union
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.db.session import get_db
 from app.db.models import Activity, User
-from app.schemas.schemas import ActivityResponse, ActivityCreate
+from app.schemas.schemas import ActivityResponse, ActivityCreate, CursorPage
 from app.api.deps import get_current_user
+from app.api.pagination import keyset_paginate, cursor_page
+from app.api.fast_json import fast_json_list, sparse_fields
+from app.core.config import settings
+from app.services.audit import audit_writer
 
 router = APIRouter()
 
-@router.get("/", response_model=List[ActivityResponse])
+@router.get("/", response_model=Union[List[ActivityResponse], CursorPage[ActivityResponse]])
 async def get_activities(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    fields: Annotated[Optional[Tuple[str, ...]], Depends(sparse_fields(ActivityResponse, Activity))],
     skip: int = 0,
     limit: int = 50,
     customer_id: Optional[str] = None,
-    lead_id: Optional[str] = None
+    lead_id: Optional[str] = None,
+    cursor: Optional[str] = None
 ):
     query = select(Activity)
     
@@ -24,8 +30,17 @@ async def get_activities(
         query = query.where(Activity.customer_id == customer_id)
     if lead_id:
         query = query.where(Activity.lead_id == lead_id)
+
+    if cursor is not None:
+        query = keyset_paginate(query, Activity, cursor, limit)
+        if settings.FAST_JSON_RESPONSES or fields:
+            return await fast_json_list(db, query, Activity, ActivityResponse, page_limit=limit, fields=fields)
+        result = await db.execute(query)
+        return cursor_page(result.scalars().all(), limit)
         
     query = query.offset(skip).limit(limit).order_by(desc(Activity.created_at))
+    if settings.FAST_JSON_RESPONSES or fields:
+        return await fast_json_list(db, query, Activity, ActivityResponse, fields=fields)
     
     result = await db.execute(query)
     return result.scalars().all()
@@ -42,5 +57,5 @@ async def create_activity(
     )
     db.add(activity)
     await db.commit()
-    await db.refresh(activity)
+    audit_writer.record("CREATE", "ACTIVITY", activity.id, current_user.id)
     return activity
@@ -0,0 +1,55 @@
+from typing import Annotated
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models import User
+from app.db.session import get_db, pool_status
+from app.api.deps import get_current_admin_user, user_cache
+from app.core.security import token_cache
+from app.db.search import rebuild_search_index
+from app.services.lead_stats import rebuild_lead_stats
+from app.realtime.hub import hub
+from app.services.audit import audit_writer
+
+router = APIRouter()
+
+@router.get("/db-pool")
+async def get_db_pool(
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+):
+    return pool_status()
+
+@router.get("/caches")
+async def get_cache_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+):
+    return {"user": user_cache.stats(), "token": token_cache.stats()}
+
+@router.get("/realtime")
+async def get_realtime_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+):
+    return hub.stats()
+
+@router.get("/audit")
+async def get_audit_writer_stats(
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+):
+    return audit_writer.stats()
+
+@router.post("/lead-stats/rebuild")
+async def rebuild_lead_stats_endpoint(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+):
+    await rebuild_lead_stats(db)
+    await db.commit()
+    return {"message": "Lead stats rebuilt"}
+
+@router.post("/search/rebuild")
+async def rebuild_search_index_endpoint(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_admin_user)]
+):
+    await db.run_sync(lambda session: rebuild_search_index(session.connection()))
+    await db.commit()
+    return {"message": "Search index rebuilt"}
@@ -5,9 +5,10 @@ from sqlalchemy import select, desc
 from app.db.session import get_db
 from app.db.models import AuditLog, User, RoleEnum
 from app.api.deps import get_current_user
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, field_validator
 from datetime import datetime
 from typing import Optional, Dict
+import json
 
 class AuditLogResponse(BaseModel):
     id: str
@@ -20,6 +21,12 @@ class AuditLogResponse(BaseModel):
 
     model_config = ConfigDict(from_attributes=True)
 
+    @field_validator("changes", mode="before")
+    @classmethod
+    def parse_changes(cls, v):
+        # Stored as a JSON string in audit_logs.changes
+        return json.loads(v) if isinstance(v, str) else v
+
 router = APIRouter()
 
 @router.get("/", response_model=List[AuditLogResponse])
@@ -1,17 +1,17 @@
 from typing import Annotated
-from datetime import timedelta, datetime, timezone
+from datetime import timedelta
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.db.session import get_db
-from app.db.models import User, UserStatus
+from app.db.models import User, UserStatus, utcnow
 from app.schemas.schemas import Token, LoginRequest, UserCreate, VerifyEmailRequest, UserResponse
-from app.core.security import verify_password, create_access_token, get_password_hash
+from app.core.security import verify_password_async, create_access_token, get_password_hash_async
 from app.core.config import settings
 import uuid
 import random
 import string
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, invalidate_user
 
 router = APIRouter()
 
@@ -33,7 +33,7 @@ async def register(
     otp = generate_otp()
     user = User(
         email=user_in.email,
-        hashed_password=get_password_hash(user_in.password),
+        hashed_password=await get_password_hash_async(user_in.password),
         first_name=user_in.first_name,
         last_name=user_in.last_name,
         role=user_in.role,
@@ -43,7 +43,6 @@ async def register(
     )
     db.add(user)
     await db.commit()
-    await db.refresh(user)
     
     # TODO: Send Email (mocked for now as per original server.py mostly)
     print(f"DEBUG: Sent OTP {otp} to {user.email}")
@@ -78,7 +77,7 @@ async def verify_email(
     user.otp = None
     
     await db.commit()
-    await db.refresh(user)
+    invalidate_user(user.id)
     
     access_token = create_access_token({"sub": user.id})
     return Token(access_token=access_token, token_type="bearer", user=user)
@@ -91,16 +90,17 @@ async def login(
     result = await db.execute(select(User).where(User.email == login_in.email))
     user = result.scalar_one_or_none()
     
-    if not user or not verify_password(login_in.password, user.hashed_password):
+    if not user or not await verify_password_async(login_in.password, user.hashed_password):
         raise HTTPException(status_code=401, detail="Incorrect email or password")
     
     if user.status != UserStatus.ACTIVE:
          raise HTTPException(status_code=401, detail="Account is not active")
          
     # Update last seen
-    user.last_seen = datetime.now(timezone.utc)
+    user.last_seen = utcnow()
     user.is_online = True
     await db.commit()
+    invalidate_user(user.id)
     
     access_token = create_access_token({"sub": user.id})
     return Token(access_token=access_token, token_type="bearer", user=user)
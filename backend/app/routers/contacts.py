@@ -1,11 +1,17 @@
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Literal, Optional, Tuple, Union
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.db.session import get_db
+from app.db.crud import update_returning
 from app.db.models import Contact, User, Account
-from app.schemas.schemas import ContactCreate, ContactUpdate, ContactResponse
+from app.schemas.schemas import ContactCreate, ContactUpdate, ContactResponse, CursorPage
 from app.api.deps import get_current_user
+from app.api.pagination import keyset_paginate, cursor_page
+from app.api.fast_json import fast_json_list, sparse_fields
+from app.core.config import settings
+from app.api.export import export_response
+from app.services.audit import audit_writer
 
 router = APIRouter()
 
@@ -28,24 +34,46 @@ async def create_contact(
     )
     db.add(contact)
     await db.commit()
-    await db.refresh(contact)
+    audit_writer.record("CREATE", "CONTACT", contact.id, current_user.id)
     return contact
 
-@router.get("/", response_model=List[ContactResponse])
+@router.get("/", response_model=Union[List[ContactResponse], CursorPage[ContactResponse]])
 async def get_contacts(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    fields: Annotated[Optional[Tuple[str, ...]], Depends(sparse_fields(ContactResponse, Contact))],
     account_id: Optional[str] = None,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None
 ):
     query = select(Contact)
     if account_id:
         query = query.where(Contact.account_id == account_id)
+
+    if cursor is not None:
+        query = keyset_paginate(query, Contact, cursor, limit)
+        if settings.FAST_JSON_RESPONSES or fields:
+            return await fast_json_list(db, query, Contact, ContactResponse, page_limit=limit, fields=fields)
+        result = await db.execute(query)
+        return cursor_page(result.scalars().all(), limit)
         
     query = query.order_by(desc(Contact.created_at)).limit(limit)
+    if settings.FAST_JSON_RESPONSES or fields:
+        return await fast_json_list(db, query, Contact, ContactResponse, fields=fields)
     result = await db.execute(query)
     return result.scalars().all()
 
+@router.get("/export")
+async def export_contacts(
+    current_user: Annotated[User, Depends(get_current_user)],
+    format: Literal["csv", "ndjson"] = "csv",
+    account_id: Optional[str] = None
+):
+    query = select(Contact)
+    if account_id:
+        query = query.where(Contact.account_id == account_id)
+    return export_response(query, Contact, list(ContactResponse.model_fields), format, "contacts")
+
 @router.get("/{contact_id}", response_model=ContactResponse)
 async def get_contact(
     contact_id: str,
@@ -65,17 +93,13 @@ async def update_contact(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)]
 ):
-    result = await db.execute(select(Contact).where(Contact.id == contact_id))
-    contact = result.scalar_one_or_none()
+    update_data = contact_in.model_dump(exclude_unset=True)
+    contact = await update_returning(db, Contact, contact_id, update_data)
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
     
-    update_data = contact_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(contact, field, value)
-    
     await db.commit()
-    await db.refresh(contact)
+    audit_writer.record("UPDATE", "CONTACT", contact.id, current_user.id, contact_in.model_dump(exclude_unset=True, mode="json"))
     return contact
 
 @router.delete("/{contact_id}")
@@ -91,4 +115,5 @@ async def delete_contact(
         
     await db.delete(contact)
     await db.commit()
+    audit_writer.record("DELETE", "CONTACT", contact_id, current_user.id)
     return {"message": "Contact deleted"}
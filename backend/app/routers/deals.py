@@ -1,14 +1,32 @@
-from typing import Annotated, List, Optional
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, List, Literal, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.db.session import get_db
-from app.db.models import Deal, User, Account, DealStage, Contact
-from app.schemas.schemas import DealCreate, DealUpdate, DealResponse
+from app.db.crud import update_returning
+from app.db.models import Deal, User, Account, DealStage, Contact, utcnow
+from app.schemas.schemas import (
+    DealCreate, DealUpdate, DealResponse, DealBoardResponse, DealForecastResponse, DealSimulationResponse
+)
 from app.api.deps import get_current_user
+from app.api.export import export_response
+from app.api.fast_json import fast_json_list, sparse_fields
+from app.core.config import settings
+from app.realtime.hub import hub
+from app.services.audit import audit_writer
+from app.services.deal_board import fetch_board
+from app.services.forecast import GroupBy, forecast, get_pipeline
+from app.services.simulation import get_simulation
 
 router = APIRouter()
 
+def filter_deals(query, stage: Optional[DealStage], account_id: Optional[str]):
+    if stage:
+        query = query.where(Deal.stage == stage)
+    if account_id:
+        query = query.where(Deal.account_id == account_id)
+    return query
+
 @router.post("/", response_model=DealResponse)
 async def create_deal(
     deal_in: DealCreate,
@@ -26,26 +44,78 @@ async def create_deal(
     )
     db.add(deal)
     await db.commit()
-    await db.refresh(deal)
+    audit_writer.record("CREATE", "DEAL", deal.id, current_user.id)
+    await hub.publish(f"deals:{deal.account_id}", "deal_created", DealResponse.model_validate(deal))
     return deal
 
 @router.get("/", response_model=List[DealResponse])
 async def get_deals(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    fields: Annotated[Optional[Tuple[str, ...]], Depends(sparse_fields(DealResponse, Deal))],
     stage: Optional[DealStage] = None,
     account_id: Optional[str] = None
 ):
-    query = select(Deal)
-    if stage:
-        query = query.where(Deal.stage == stage)
-    if account_id:
-        query = query.where(Deal.account_id == account_id)
-        
+    query = filter_deals(select(Deal), stage, account_id)
     query = query.order_by(desc(Deal.created_at))
+    if settings.FAST_JSON_RESPONSES or fields:
+        return await fast_json_list(db, query, Deal, DealResponse, fields=fields)
     result = await db.execute(query)
     return result.scalars().all()
 
+@router.get("/export")
+async def export_deals(
+    current_user: Annotated[User, Depends(get_current_user)],
+    format: Literal["csv", "ndjson"] = "csv",
+    stage: Optional[DealStage] = None,
+    account_id: Optional[str] = None
+):
+    query = filter_deals(select(Deal), stage, account_id)
+    return export_response(query, Deal, list(DealResponse.model_fields), format, "deals")
+
+@router.get("/board", response_model=DealBoardResponse)
+async def get_deal_board(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    account_id: Optional[str] = None,
+    stage: Optional[DealStage] = None,
+    cursor: Optional[str] = None
+):
+    """Top `limit` cards per stage with stage count, amount and weighted amount.
+
+    For "load more" in one column pass that column's `stage` and `next_cursor`.
+    """
+    if cursor and not stage:
+        raise HTTPException(status_code=400, detail="cursor requires stage")
+    return {"columns": await fetch_board(db, stage, account_id, cursor, limit)}
+
+@router.get("/forecast", response_model=DealForecastResponse)
+async def get_deal_forecast(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    group_by: GroupBy = "month",
+    account_id: Optional[str] = None,
+    owner_id: Optional[str] = None,
+    commit_probability: Annotated[Optional[int], Query(ge=0, le=100)] = None
+):
+    """Weighted, best-case and worst-case revenue by closing month, owner or stage."""
+    pipeline = await get_pipeline(db, account_id, owner_id)
+    if commit_probability is None:
+        commit_probability = settings.FORECAST_COMMIT_PROBABILITY
+    return forecast(pipeline, group_by, commit_probability)
+
+@router.get("/simulation", response_model=DealSimulationResponse)
+async def get_deal_simulation(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    trials: Annotated[int, Query(ge=100, le=settings.SIMULATION_MAX_TRIALS)] = settings.SIMULATION_DEFAULT_TRIALS,
+    account_id: Optional[str] = None,
+    owner_id: Optional[str] = None
+):
+    """P10/P50/P90 revenue per closing quarter from a Monte Carlo run over open deals."""
+    return await get_simulation(db, trials, account_id, owner_id)
+
 @router.patch("/{deal_id}", response_model=DealResponse)
 async def update_deal(
     deal_id: str,
@@ -53,17 +123,16 @@ async def update_deal(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)]
 ):
-    result = await db.execute(select(Deal).where(Deal.id == deal_id))
-    deal = result.scalar_one_or_none()
+    update_data = deal_in.model_dump(exclude_unset=True)
+    # Always bumped: the forecast cache falls back to max(updated_at) without version triggers
+    update_data["updated_at"] = utcnow()
+    deal = await update_returning(db, Deal, deal_id, update_data)
     if not deal:
         raise HTTPException(status_code=404, detail="Deal not found")
-    
-    update_data = deal_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(deal, field, value)
         
     await db.commit()
-    await db.refresh(deal)
+    audit_writer.record("UPDATE", "DEAL", deal.id, current_user.id, deal_in.model_dump(exclude_unset=True, mode="json"))
+    await hub.publish(f"deals:{deal.account_id}", "deal_updated", DealResponse.model_validate(deal))
     return deal
 
 @router.delete("/{deal_id}")
@@ -79,4 +148,6 @@ async def delete_deal(
         
     await db.delete(deal)
     await db.commit()
+    audit_writer.record("DELETE", "DEAL", deal.id, current_user.id)
+    await hub.publish(f"deals:{deal.account_id}", "deal_deleted", {"id": deal.id})
     return {"message": "Deal deleted"}
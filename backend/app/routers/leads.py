@@ -1,41 +1,59 @@
-from typing import Annotated, List, Optional
-from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Annotated, List, Literal, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, or_, desc, func
+from sqlalchemy import select, desc, case
 from app.db.session import get_db
-from app.db.models import Lead, LeadStatus, User, RoleEnum, Account, Contact, Deal, DealStage
-from app.schemas.schemas import LeadResponse, LeadCreate, LeadUpdate
+from app.db.crud import update_returning
+from app.db.models import Lead, LeadStatus, LeadStat, User, RoleEnum, utcnow
+from app.schemas.schemas import (
+    LeadResponse, LeadCreate, LeadUpdate, CursorPage, BulkImportResponse,
+    LeadConvertResponse, LeadConvertBatchRequest, LeadConvertBatchResponse
+)
 from app.api.deps import get_current_user
+from app.api.pagination import keyset_paginate, cursor_page
+from app.api.fast_json import fast_json_list, sparse_fields
+from app.core.config import settings
+from app.api.export import export_response
+from app.db.search import lead_search_clause
+from app.services.lead_stats import adjust_lead_stats, move_lead_stats
+from app.services.lead_import import import_leads, iter_lines, iter_csv_rows, iter_ndjson_rows, ImportFormatError
+from app.services.conversion import convert_leads
+from app.realtime.hub import hub
+from app.services.audit import audit_writer
 
 router = APIRouter()
 
-@router.get("/", response_model=List[LeadResponse])
+def filter_leads(query, dialect: str, search: Optional[str], status: Optional[LeadStatus]):
+    if search:
+        query = query.where(lead_search_clause(dialect, search))
+    if status:
+        query = query.where(Lead.status == status)
+    return query
+
+@router.get("/", response_model=Union[List[LeadResponse], CursorPage[LeadResponse]])
 async def get_leads(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    fields: Annotated[Optional[Tuple[str, ...]], Depends(sparse_fields(LeadResponse, Lead))],
     skip: int = 0,
     limit: int = 100,
     search: Optional[str] = None,
-    status: Optional[LeadStatus] = None
+    status: Optional[LeadStatus] = None,
+    cursor: Optional[str] = None
 ):
-    query = select(Lead)
-    
-    if search:
-        search_filter = f"%{search}%"
-        query = query.where(
-            or_(
-                Lead.first_name.ilike(search_filter),
-                Lead.last_name.ilike(search_filter),
-                Lead.company.ilike(search_filter),
-                Lead.email.ilike(search_filter)
-            )
-        )
-    
-    if status:
-        query = query.where(Lead.status == status)
+    query = filter_leads(select(Lead), db.bind.dialect.name, search, status)
+
+    # Keyset mode: pass cursor="" for the first page, then the returned next_cursor
+    if cursor is not None:
+        query = keyset_paginate(query, Lead, cursor, limit)
+        if settings.FAST_JSON_RESPONSES or fields:
+            return await fast_json_list(db, query, Lead, LeadResponse, page_limit=limit, fields=fields)
+        result = await db.execute(query)
+        return cursor_page(result.scalars().all(), limit)
         
     query = query.offset(skip).limit(limit).order_by(desc(Lead.created_at))
+    if settings.FAST_JSON_RESPONSES or fields:
+        return await fast_json_list(db, query, Lead, LeadResponse, fields=fields)
     
     result = await db.execute(query)
     return result.scalars().all()
@@ -51,10 +69,52 @@ async def create_lead(
         created_by_id=current_user.id
     )
     db.add(lead)
+    await adjust_lead_stats(db, lead.status, 1, lead.value or 0.0)
     await db.commit()
-    await db.refresh(lead)
+    audit_writer.record("CREATE", "LEAD", lead.id, current_user.id)
+    await hub.publish("leads", "lead_created", LeadResponse.model_validate(lead))
     return lead
 
+@router.post("/bulk", response_model=BulkImportResponse)
+async def bulk_import_leads(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    format: Optional[str] = None
+):
+    """Stream a CSV (text/csv, header row first) or NDJSON (application/x-ndjson) body of leads."""
+    if format is None:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+        if content_type in ("text/csv", "application/csv"):
+            format = "csv"
+        elif content_type in ("application/x-ndjson", "application/ndjson", "application/jsonl"):
+            format = "ndjson"
+    if format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=415, detail="Send text/csv or application/x-ndjson, or pass format=csv|ndjson")
+
+    lines = iter_lines(request.stream())
+    rows = iter_csv_rows(lines) if format == "csv" else iter_ndjson_rows(lines)
+    try:
+        report = await import_leads(db, rows, current_user.id)
+    except ImportFormatError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    audit_writer.record("IMPORT", "LEAD", "*", current_user.id, {"format": format, "inserted": report["inserted"], "failed": report["failed"]})
+    if report["inserted"]:
+        # One summary event instead of one per row; subscribers refetch
+        await hub.publish("leads", "leads_imported", {"inserted": report["inserted"]})
+    return report
+
+@router.get("/export")
+async def export_leads(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    format: Literal["csv", "ndjson"] = "csv",
+    search: Optional[str] = None,
+    status: Optional[LeadStatus] = None
+):
+    query = filter_leads(select(Lead), db.bind.dialect.name, search, status)
+    return export_response(query, Lead, list(LeadResponse.model_fields), format, "leads")
+
 @router.get("/{lead_id}", response_model=LeadResponse)
 async def get_lead(
     lead_id: str,
@@ -74,85 +134,75 @@ async def update_lead(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)]
 ):
-    result = await db.execute(select(Lead).where(Lead.id == lead_id))
-    lead = result.scalar_one_or_none()
-    
+    update_data = lead_in.model_dump(exclude_unset=True)
+    now = utcnow()
+
+    # Status conversion logic: stamp converted_at only on the transition into CONVERTED.
+    # The CASE reads the pre-update status, so it goes ahead of the status assignment.
+    if update_data.get("status") == LeadStatus.CONVERTED:
+        update_data = {
+            "converted_at": case((Lead.status != LeadStatus.CONVERTED, now), else_=Lead.converted_at),
+            **update_data,
+        }
+    update_data["updated_at"] = now
+
+    tracks_stats = "status" in update_data or "value" in update_data
+    if tracks_stats:
+        # lead_stats needs the old bucket; lock the row so the delta matches what the UPDATE replaces
+        result = await db.execute(
+            select(Lead.status, Lead.value).where(Lead.id == lead_id).with_for_update()
+        )
+        old = result.one_or_none()
+
+    lead = await update_returning(db, Lead, lead_id, update_data)
     if not lead:
         raise HTTPException(status_code=404, detail="Lead not found")
-        
-    update_data = lead_in.model_dump(exclude_unset=True)
-    
-    # Status conversion logic
-    if update_data.get("status") == LeadStatus.CONVERTED and lead.status != LeadStatus.CONVERTED:
-        update_data["converted_at"] = datetime.now(timezone.utc)
-        
-    for field, value in update_data.items():
-        setattr(lead, field, value)
-        
-    lead.updated_at = datetime.now(timezone.utc)
-    
+
+    if tracks_stats:
+        await move_lead_stats(db, old.status, old.value, lead.status, lead.value)
+
     await db.commit()
-    await db.refresh(lead)
+    audit_writer.record("UPDATE", "LEAD", lead.id, current_user.id, lead_in.model_dump(exclude_unset=True, mode="json"))
+    await hub.publish("leads", "lead_updated", LeadResponse.model_validate(lead))
     return lead
 
-@router.post("/{lead_id}/convert")
+@router.post("/{lead_id}/convert", response_model=LeadConvertResponse)
 async def convert_lead(
     lead_id: str,
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)]
 ):
-    # 1. Fetch Lead
-    result = await db.execute(select(Lead).where(Lead.id == lead_id))
-    lead = result.scalar_one_or_none()
-    if not lead:
-        raise HTTPException(status_code=404, detail="Lead not found")
-        
-    if lead.status == LeadStatus.CONVERTED:
-         # Optionally just return success if already converted
-        raise HTTPException(status_code=400, detail="Lead already converted")
-        
-    # 2. Create Account
-    account = Account(
-        name=lead.company,
-        created_by_id=current_user.id
-    )
-    db.add(account)
-    # Flush to get ID
-    await db.flush()
-    message = "Created Account"
-
-    # 3. Create Contact
-    contact = Contact(
-        first_name=lead.first_name,
-        last_name=lead.last_name,
-        email=lead.email,
-        title=lead.title,
-        account_id=account.id, # Link via ID
-        owner_id=current_user.id
-    )
-    db.add(contact)
-    message += ", Contact"
-
-    # 4. Create Deal
-    deal = Deal(
-        name=f"{lead.company} - {lead.last_name} Deal",
-        amount=lead.value,
-        stage=DealStage.QUALIFICATION,
-        account_id=account.id,
-        owner_id=current_user.id
-    )
-    db.add(deal)
-    message += ", Deal"
+    converted, errors = await convert_leads(db, [lead_id], current_user.id)
+    if errors:
+        await db.rollback()
+        detail = errors[0]["detail"]
+        raise HTTPException(status_code=404 if detail == "Lead not found" else 400, detail=detail)
 
-    # 5. Update Lead
-    lead.status = LeadStatus.CONVERTED
-    lead.converted_at = datetime.now(timezone.utc)
-    lead.converted_account_id = account.id
-    
     await db.commit()
-    await db.refresh(lead)
-    
-    return {"message": f"Lead converted successfully. {message}", "account_id": account.id, "deal_id": deal.id}
+    result = converted[0]
+    audit_writer.record("CONVERT", "LEAD", lead_id, current_user.id, result)
+    await hub.publish("leads", "lead_converted", result)
+    return {
+        "message": "Lead converted successfully. Created Account, Contact, Deal",
+        "account_id": result["account_id"],
+        "contact_id": result["contact_id"],
+        "deal_id": result["deal_id"],
+    }
+
+@router.post("/convert-batch", response_model=LeadConvertBatchResponse)
+async def convert_leads_batch(
+    batch_in: LeadConvertBatchRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)]
+):
+    """Convert many leads in one transaction; missing or already-converted ids are reported, not fatal."""
+    converted, errors = await convert_leads(db, batch_in.lead_ids, current_user.id)
+    await db.commit()
+    for result in converted:
+        audit_writer.record("CONVERT", "LEAD", result["lead_id"], current_user.id, result)
+    if converted:
+        await hub.publish("leads", "leads_converted", {"converted": converted})
+    return {"converted": converted, "errors": errors}
 
 @router.delete("/{lead_id}")
 async def delete_lead(
@@ -170,7 +220,10 @@ async def delete_lead(
         raise HTTPException(status_code=404, detail="Lead not found")
         
     await db.delete(lead)
+    await adjust_lead_stats(db, lead.status, -1, -(lead.value or 0.0))
     await db.commit()
+    audit_writer.record("DELETE", "LEAD", lead_id, current_user.id)
+    await hub.publish("leads", "lead_deleted", {"id": lead_id})
     return {"message": "Lead deleted successfully"}
 
 @router.get("/stats/overview")
@@ -178,8 +231,8 @@ async def get_lead_stats(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)]
 ):
-    # Group by status
-    stmt = select(Lead.status, func.count(Lead.id).label("count"), func.sum(Lead.value).label("total_value")).group_by(Lead.status)
+    # Pre-aggregated per status, see app/services/lead_stats.py
+    stmt = select(LeadStat.status, LeadStat.count, LeadStat.total_value).where(LeadStat.count > 0)
     result = await db.execute(stmt)
     
     stats = []
@@ -1,14 +1,22 @@
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, desc
 from app.db.session import get_db
 from app.db.models import Notification, User
-from app.schemas.schemas import NotificationResponse
+from app.schemas.schemas import (
+    NotificationResponse, NotificationReadRequest, NotificationReadResponse, UnreadCountResponse
+)
 from app.api.deps import get_current_user
+from app.services.notifications import mark_read, get_unread_count
+from app.realtime.hub import hub
 
 router = APIRouter()
 
+async def _publish_unread(db: AsyncSession, user_id: str) -> None:
+    unread = await get_unread_count(db, user_id)
+    await hub.publish(f"notifications:{user_id}", "unread_count", {"unread": unread})
+
 @router.get("/", response_model=List[NotificationResponse])
 async def get_notifications(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -30,29 +38,57 @@ async def mark_notification_read(
     current_user: Annotated[User, Depends(get_current_user)]
 ):
     result = await db.execute(
-        select(Notification)
+        select(Notification.is_read)
         .where(Notification.id == notification_id, Notification.user_id == current_user.id)
     )
-    notification = result.scalar_one_or_none()
+    is_read = result.scalar_one_or_none()
     
-    if not notification:
+    if is_read is None:
         raise HTTPException(status_code=404, detail="Notification not found")
-        
-    notification.is_read = True
-    await db.commit()
+
+    if not is_read:
+        await mark_read(db, current_user.id, Notification.id == notification_id)
+        await db.commit()
+        await _publish_unread(db, current_user.id)
     return {"message": "Marked as read"}
 
+@router.post("/read", response_model=NotificationReadResponse)
+async def mark_notifications_read(
+    read_in: NotificationReadRequest,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)]
+):
+    # Ids that are unknown, already read or owned by someone else are skipped
+    updated = await mark_read(db, current_user.id, Notification.id.in_(set(read_in.ids)))
+    await db.commit()
+    if updated:
+        await _publish_unread(db, current_user.id)
+    return {"message": "Marked as read", "updated": updated}
+
 @router.post("/read-all")
 async def mark_all_read(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)]
 ):
-    # This might be inefficient for huge lists but fine for this scale
-    result = await db.execute(
-        select(Notification).where(Notification.user_id == current_user.id, Notification.is_read == False)
-    )
-    notifications = result.scalars().all()
-    for n in notifications:
-        n.is_read = True
-    await db.commit()
+    # One set-based UPDATE over ix_notifications_user_id_is_read_created_at
+    if await mark_read(db, current_user.id):
+        await db.commit()
+        await _publish_unread(db, current_user.id)
     return {"message": "All marked as read"}
+
+@router.get("/unread-count", response_model=UnreadCountResponse, responses={304: {"description": "Count unchanged"}})
+async def unread_count(
+    response: Response,
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    if_none_match: Annotated[Optional[str], Header()] = None
+):
+    # One primary-key read of notification_counters; the body is just the count, so the
+    # count itself is the validator and an unchanged poll costs a 304 with no body
+    unread = await get_unread_count(db, current_user.id)
+    etag = f'"{unread}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if if_none_match and etag in [t.strip().removeprefix("W/") for t in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return {"unread": unread}
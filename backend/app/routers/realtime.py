@@ -0,0 +1,80 @@
+import json
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Query, WebSocket, WebSocketDisconnect, status
+from jose import JWTError
+from sqlalchemy import select
+from app.api.deps import user_cache
+from app.core.security import decode_access_token
+from app.db.models import User, UserStatus
+from app.db.session import AsyncSessionLocal
+from app.realtime.hub import hub
+
+router = APIRouter()
+
+async def _authenticate(token: str) -> Optional[str]:
+    try:
+        user_id = decode_access_token(token).get("sub")
+    except JWTError:
+        return None
+    if not user_id:
+        return None
+    # Same rule as HTTP logins: only ACTIVE users, whether the status comes from the cache or the DB
+    cached = user_cache.get(user_id)
+    if cached is not None:
+        return user_id if cached["status"] == UserStatus.ACTIVE else None
+    # Short-lived session: the socket may stay open for hours and must not pin a connection
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(select(User.status).where(User.id == user_id))
+        user_status = result.scalar_one_or_none()
+    return user_id if user_status == UserStatus.ACTIVE else None
+
+def _topic_list(value) -> List[str]:
+    if isinstance(value, str):
+        value = value.split(",")
+    if not isinstance(value, list):
+        return []
+    return [t.strip() for t in value if isinstance(t, str) and t.strip()]
+
+@router.websocket("/ws")
+async def websocket_endpoint(
+    websocket: WebSocket,
+    token: Annotated[Optional[str], Query()] = None,
+    topics: Annotated[Optional[str], Query()] = None
+):
+    """Change events for subscribed topics.
+
+    Connect with ?token=<access token>[&topics=leads,deals:<account_id>], then send
+    {"action": "subscribe" | "unsubscribe", "topics": [...]} or {"action": "ping"}.
+    """
+    user_id = await _authenticate(token) if token else None
+    if user_id is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    conn = await hub.manager.connect(user_id, websocket)
+    try:
+        if topics:
+            subscribed, errors = hub.subscribe(conn, _topic_list(topics))
+            hub.reply(conn, {"type": "subscribed", "topics": subscribed, "errors": errors})
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except ValueError:
+                hub.reply(conn, {"type": "error", "detail": "Invalid JSON"})
+                continue
+            action = message.get("action") if isinstance(message, dict) else None
+            if action == "subscribe":
+                subscribed, errors = hub.subscribe(conn, _topic_list(message.get("topics")))
+                hub.reply(conn, {"type": "subscribed", "topics": subscribed, "errors": errors})
+            elif action == "unsubscribe":
+                removed = hub.unsubscribe(conn, _topic_list(message.get("topics")))
+                hub.reply(conn, {"type": "unsubscribed", "topics": removed})
+            elif action == "ping":
+                hub.reply(conn, {"type": "pong"})
+            else:
+                hub.reply(conn, {"type": "error", "detail": "Unknown action"})
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the manager already closed this socket as a slow consumer
+        pass
+    finally:
+        hub.disconnect(conn)
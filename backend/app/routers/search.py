@@ -0,0 +1,29 @@
+from typing import Annotated, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.session import get_db
+from app.db.models import User
+from app.db.search import search as run_search, SEARCH_ENTITIES
+from app.schemas.schemas import SearchResponse
+from app.api.deps import get_current_user
+
+router = APIRouter()
+
+@router.get("/", response_model=SearchResponse)
+async def search(
+    db: Annotated[AsyncSession, Depends(get_db)],
+    current_user: Annotated[User, Depends(get_current_user)],
+    q: str = Query(..., min_length=1),
+    types: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100)
+):
+    # types is a comma separated subset of lead,contact,account (default: all)
+    entities = list(SEARCH_ENTITIES)
+    if types:
+        entities = [t.strip() for t in types.split(",") if t.strip()]
+        unknown = [t for t in entities if t not in SEARCH_ENTITIES]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"Unknown search types: {', '.join(unknown)}")
+
+    results = await run_search(db, q, entities, limit)
+    return {"results": results}
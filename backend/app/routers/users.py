@@ -1,23 +1,39 @@
-from typing import Annotated, List
+from typing import Annotated, List, Optional, Tuple, Union
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.db.session import get_db
-from app.db.models import User, RoleEnum
-from app.schemas.schemas import UserResponse, UserUpdate
-from app.api.deps import get_current_user
-from datetime import datetime, timezone
+from app.db.crud import update_returning
+from app.db.models import User, RoleEnum, utcnow
+from app.schemas.schemas import UserResponse, UserUpdate, CursorPage
+from app.api.deps import get_current_user, invalidate_user
+from app.api.pagination import keyset_paginate, cursor_page
+from app.api.fast_json import fast_json_list, sparse_fields
+from app.core.config import settings
+from app.services.audit import audit_writer
 
 router = APIRouter()
 
-@router.get("/", response_model=List[UserResponse])
+@router.get("/", response_model=Union[List[UserResponse], CursorPage[UserResponse]])
 async def get_users(
     db: Annotated[AsyncSession, Depends(get_db)],
     current_user: Annotated[User, Depends(get_current_user)],
+    fields: Annotated[Optional[Tuple[str, ...]], Depends(sparse_fields(UserResponse, User))],
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    cursor: Optional[str] = None
 ):
-    result = await db.execute(select(User).offset(skip).limit(limit))
+    if cursor is not None:
+        query = keyset_paginate(select(User), User, cursor, limit)
+        if settings.FAST_JSON_RESPONSES or fields:
+            return await fast_json_list(db, query, User, UserResponse, page_limit=limit, fields=fields)
+        result = await db.execute(query)
+        return cursor_page(result.scalars().all(), limit)
+
+    query = select(User).offset(skip).limit(limit)
+    if settings.FAST_JSON_RESPONSES or fields:
+        return await fast_json_list(db, query, User, UserResponse, fields=fields)
+    result = await db.execute(query)
     return result.scalars().all()
 
 @router.patch("/{user_id}", response_model=UserResponse)
@@ -30,17 +46,13 @@ async def update_user(
     if current_user.role != RoleEnum.ADMIN and current_user.id != user_id:
         raise HTTPException(status_code=403, detail="Insufficient permissions")
     
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    
+    update_data = user_in.model_dump(exclude_unset=True)
+    update_data["updated_at"] = utcnow()
+    user = await update_returning(db, User, user_id, update_data)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-        
-    update_data = user_in.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(user, field, value)
-    
-    user.updated_at = datetime.now(timezone.utc)
+
     await db.commit()
-    await db.refresh(user)
+    invalidate_user(user.id)
+    audit_writer.record("UPDATE", "USER", user.id, current_user.id, user_in.model_dump(exclude_unset=True, mode="json"))
     return user
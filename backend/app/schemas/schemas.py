@@ -1,8 +1,15 @@
-from pydantic import BaseModel, EmailStr, ConfigDict
-from typing import Optional, List, Any
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
+from typing import Optional, List, Any, Generic, TypeVar
 from datetime import datetime
 from app.db.models import RoleEnum, UserStatus, LeadStatus, DealStage
 
+T = TypeVar("T")
+
+# --- Pagination ---
+class CursorPage(BaseModel, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+
 # --- Token ---
 class Token(BaseModel):
     access_token: str
@@ -120,6 +127,44 @@ class DealResponse(DealBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+class DealBoardColumn(BaseModel):
+    stage: DealStage
+    count: int
+    total_amount: float
+    weighted_amount: float
+    items: List[DealResponse]
+    next_cursor: Optional[str] = None
+
+class DealBoardResponse(BaseModel):
+    columns: List[DealBoardColumn]
+
+class ForecastTotals(BaseModel):
+    deals: int
+    amount: float
+    weighted: float
+    best_case: float
+    worst_case: float
+
+class ForecastBucket(ForecastTotals):
+    key: Optional[str] = None  # "YYYY-MM", owner id or stage; None = no closing date
+
+class DealForecastResponse(BaseModel):
+    group_by: str
+    buckets: List[ForecastBucket]
+    totals: ForecastTotals
+
+class QuarterRevenue(BaseModel):
+    quarter: str  # "2026-Q3"
+    p10: float
+    p50: float
+    p90: float
+    mean: float
+
+class DealSimulationResponse(BaseModel):
+    trials: int
+    open_deals: int
+    quarters: List[QuarterRevenue]
+
 # --- Lead ---
 class LeadBase(BaseModel):
     first_name: str
@@ -150,6 +195,39 @@ class LeadResponse(LeadBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+class BulkImportError(BaseModel):
+    row: int
+    errors: List[str]
+
+class BulkImportResponse(BaseModel):
+    inserted: int
+    failed: int
+    errors: List[BulkImportError]
+    errors_truncated: bool
+
+class LeadConvertResponse(BaseModel):
+    message: str
+    account_id: str
+    contact_id: str
+    deal_id: str
+
+class LeadConvertBatchRequest(BaseModel):
+    lead_ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+class LeadConversion(BaseModel):
+    lead_id: str
+    account_id: str
+    contact_id: str
+    deal_id: str
+
+class LeadConversionError(BaseModel):
+    lead_id: str
+    detail: str
+
+class LeadConvertBatchResponse(BaseModel):
+    converted: List[LeadConversion]
+    errors: List[LeadConversionError]
+
 # --- Activity ---
 class ActivityBase(BaseModel):
     type: str
@@ -178,3 +256,25 @@ class NotificationResponse(BaseModel):
     created_at: datetime
     
     model_config = ConfigDict(from_attributes=True)
+
+class NotificationReadRequest(BaseModel):
+    ids: List[str] = Field(..., min_length=1, max_length=1000)
+
+class NotificationReadResponse(BaseModel):
+    message: str
+    updated: int
+
+class UnreadCountResponse(BaseModel):
+    unread: int
+
+
+# --- Search ---
+class SearchResult(BaseModel):
+    entity: str
+    id: str
+    title: str
+    subtitle: Optional[str] = None
+    score: float
+
+class SearchResponse(BaseModel):
+    results: List[SearchResult]
@@ -0,0 +1,139 @@
+"""
+Asynchronous audit-log writer.
+
+Handlers call `audit_writer.record(...)`, which only appends to a bounded in-memory queue, so
+auditing adds no DB round-trip to the request. A background task started in the lifespan
+drains the queue and writes one batched INSERT every `flush_interval` seconds or
+`batch_size` events, whichever comes first. Shutdown flushes whatever is still queued.
+
+When the queue is full, record() drops the event and counts it rather than block the
+request. Queue depth and the drop/failure counters are served at GET /api/admin/audit.
+"""
+import asyncio
+import json
+import logging
+import uuid
+from contextlib import suppress
+from typing import Awaitable, Callable, List, Optional
+from sqlalchemy import insert
+from app.core.config import settings
+from app.db.models import AuditLog, utcnow
+
+logger = logging.getLogger(__name__)
+
+Sink = Callable[[List[dict]], Awaitable[None]]
+
+class AuditWriter:
+    def __init__(self, sink: Sink, max_queue: int = 10000, batch_size: int = 500, flush_interval: float = 0.2):
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.counters = {"enqueued": 0, "written": 0, "dropped": 0, "failed": 0, "batches": 0}
+        self._task: Optional[asyncio.Task] = None
+        self._batch: List[dict] = []
+        self._inflight: Optional[asyncio.Future] = None
+
+    def record(self, action: str, entity: str, entity_id: str, user_id: str, changes: Optional[dict] = None) -> bool:
+        """Queue an audit event; returns False if it was dropped because the queue is full."""
+        event = {
+            "id": str(uuid.uuid4()),
+            "action": action,
+            "entity": entity,
+            "entity_id": entity_id,
+            "user_id": user_id,
+            "changes": changes,
+            "created_at": utcnow(),
+        }
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.counters["dropped"] += 1
+            return False
+        self.counters["enqueued"] += 1
+        return True
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the flush task and write everything still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._inflight is not None and not self._inflight.done():
+            await self._inflight
+        pending, self._batch = self._batch, []
+        while not self.queue.empty():
+            pending.append(self.queue.get_nowait())
+        for i in range(0, len(pending), self.batch_size):
+            await self._write(pending[i:i + self.batch_size])
+
+    async def _collect(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._batch.append(await self.queue.get())
+        deadline = loop.time() + self.flush_interval
+        while len(self._batch) < self.batch_size:
+            try:
+                self._batch.append(self.queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                return
+            try:
+                self._batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+            except asyncio.TimeoutError:
+                return
+
+    async def _run(self) -> None:
+        while True:
+            # Events being collected live in self._batch so stop() can still flush them
+            await self._collect()
+            batch, self._batch = self._batch, []
+            # Shielded: cancelling the loop on shutdown must not abort a half-written batch
+            self._inflight = asyncio.ensure_future(self._write(batch))
+            await asyncio.shield(self._inflight)
+
+    async def _write(self, batch: List[dict]) -> None:
+        if not batch:
+            return
+        try:
+            await self.sink(batch)
+        except Exception:
+            self.counters["failed"] += len(batch)
+            logger.exception("Failed to write %d audit events", len(batch))
+            return
+        self.counters["written"] += len(batch)
+        self.counters["batches"] += 1
+
+    def stats(self) -> dict:
+        return {
+            "queue_depth": self.queue.qsize(),
+            "queue_max": self.queue.maxsize,
+            "running": self._task is not None and not self._task.done(),
+            **self.counters,
+        }
+
+async def write_audit_logs(batch: List[dict]) -> None:
+    """Sink for the audit_logs table: one executemany INSERT per batch."""
+    # Imported here so server.py can reuse AuditWriter without building the SQL engine
+    from app.db.session import AsyncSessionLocal
+    rows = [
+        {**event, "changes": json.dumps(event["changes"], default=str) if event["changes"] is not None else None}
+        for event in batch
+    ]
+    async with AsyncSessionLocal() as db:
+        await db.execute(insert(AuditLog), rows)
+        await db.commit()
+
+audit_writer = AuditWriter(
+    write_audit_logs,
+    max_queue=settings.AUDIT_QUEUE_MAX_SIZE,
+    batch_size=settings.AUDIT_BATCH_SIZE,
+    flush_interval=settings.AUDIT_FLUSH_INTERVAL_MS / 1000,
+)
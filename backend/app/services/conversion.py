@@ -0,0 +1,102 @@
+"""
+Lead conversion engine.
+
+Converting a lead creates an Account (from the company), a Contact (from the person) and a
+Deal (from the lead value), then marks the lead CONVERTED with links to all three. IDs are
+generated up front, so each table gets one executemany INSERT for the whole batch with no
+intermediate flush to learn primary keys, and the leads are updated in one bulk UPDATE.
+Nothing here commits; the caller owns the transaction.
+"""
+from collections import defaultdict
+from typing import List, Sequence, Tuple
+from sqlalchemy import select, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.db.models import Lead, LeadStatus, Account, Contact, Deal, DealStage, generate_uuid, utcnow
+from app.services.lead_stats import adjust_lead_stats
+
+_LEAD_COLUMNS = (Lead.id, Lead.status, Lead.first_name, Lead.last_name, Lead.company, Lead.email, Lead.title, Lead.value)
+
+async def convert_leads(db: AsyncSession, lead_ids: Sequence[str], user_id: str) -> Tuple[List[dict], List[dict]]:
+    """Convert the given leads. Returns (converted, errors) in request order."""
+    result = await db.execute(
+        select(*_LEAD_COLUMNS).where(Lead.id.in_(set(lead_ids))).with_for_update()
+    )
+    leads = {row.id: row for row in result}
+
+    now = utcnow()
+    accounts, contacts, deals, lead_updates = [], [], [], []
+    converted, errors = [], []
+    stats_moved = defaultdict(lambda: [0, 0.0])
+    seen = set()
+
+    for lead_id in lead_ids:
+        lead = leads.get(lead_id)
+        if lead is None:
+            errors.append({"lead_id": lead_id, "detail": "Lead not found"})
+            continue
+        if lead_id in seen:
+            errors.append({"lead_id": lead_id, "detail": "Duplicate lead id"})
+            continue
+        if lead.status == LeadStatus.CONVERTED:
+            errors.append({"lead_id": lead_id, "detail": "Lead already converted"})
+            continue
+        seen.add(lead_id)
+
+        account_id, contact_id, deal_id = generate_uuid(), generate_uuid(), generate_uuid()
+        accounts.append({
+            "id": account_id,
+            "name": lead.company,
+            "created_by_id": user_id,
+            "created_at": now,
+            "updated_at": now,
+        })
+        contacts.append({
+            "id": contact_id,
+            "first_name": lead.first_name,
+            "last_name": lead.last_name,
+            "email": lead.email,
+            "title": lead.title,
+            "account_id": account_id,
+            "owner_id": user_id,
+            "created_at": now,
+            "updated_at": now,
+        })
+        deals.append({
+            "id": deal_id,
+            "name": f"{lead.company} - {lead.last_name} Deal",
+            "amount": lead.value,
+            "stage": DealStage.QUALIFICATION,
+            "account_id": account_id,
+            "contact_id": contact_id,
+            "owner_id": user_id,
+            "created_at": now,
+            "updated_at": now,
+        })
+        lead_updates.append({
+            "id": lead_id,
+            "status": LeadStatus.CONVERTED,
+            "converted_at": now,
+            "updated_at": now,
+            "converted_account_id": account_id,
+            "converted_contact_id": contact_id,
+            "converted_deal_id": deal_id,
+        })
+        stats_moved[lead.status][0] += 1
+        stats_moved[lead.status][1] += lead.value or 0.0
+        converted.append({"lead_id": lead_id, "account_id": account_id, "contact_id": contact_id, "deal_id": deal_id})
+
+    if converted:
+        await db.execute(insert(Account), accounts)
+        await db.execute(insert(Contact), contacts)
+        await db.execute(insert(Deal), deals)
+        # ORM bulk UPDATE by primary key: one executemany for every lead
+        await db.execute(update(Lead), lead_updates)
+
+        for status, (count, value) in stats_moved.items():
+            await adjust_lead_stats(db, status, -count, -value)
+        await adjust_lead_stats(
+            db, LeadStatus.CONVERTED,
+            sum(c for c, _ in stats_moved.values()), sum(v for _, v in stats_moved.values())
+        )
+
+    return converted, errors
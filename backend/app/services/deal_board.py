@@ -0,0 +1,79 @@
+"""
+Kanban board for deals: per-stage top-N cards plus stage totals in one query.
+
+    totals   every filtered deal + count / sum(amount) / sum(amount * probability / 100)
+             as window aggregates partitioned by stage
+    ranked   row_number() per stage in (created_at, id) DESC order, after the optional
+             "load more" keyset condition, so the totals still cover the whole column
+    outer    rn <= limit + 1; the extra row tells us whether the column has a next page
+"""
+from typing import List, Optional
+from sqlalchemy import desc, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+from app.api.pagination import cursor_page, keyset_condition
+from app.db.models import Deal, DealStage
+
+def board_query(stage: Optional[DealStage], account_id: Optional[str], cursor: Optional[str], limit: int):
+    base = select(Deal)
+    if stage:
+        base = base.where(Deal.stage == stage)
+    if account_id:
+        base = base.where(Deal.account_id == account_id)
+
+    amount = func.coalesce(Deal.amount, 0.0)
+    totals = base.add_columns(
+        func.count().over(partition_by=Deal.stage).label("stage_count"),
+        func.sum(amount).over(partition_by=Deal.stage).label("stage_amount"),
+        func.sum(amount * func.coalesce(Deal.probability, 0) / 100.0).over(partition_by=Deal.stage).label("stage_weighted"),
+    ).subquery("totals")
+    deal = aliased(Deal, totals)
+
+    ranked = select(
+        deal,
+        totals.c.stage_count,
+        totals.c.stage_amount,
+        totals.c.stage_weighted,
+        func.row_number().over(
+            partition_by=deal.stage, order_by=(desc(deal.created_at), desc(deal.id))
+        ).label("rn"),
+    )
+    if cursor:
+        ranked = ranked.where(keyset_condition(deal, cursor))
+    ranked = ranked.subquery("ranked")
+    card = aliased(Deal, ranked)
+
+    return (
+        select(card, ranked.c.stage_count, ranked.c.stage_amount, ranked.c.stage_weighted)
+        .where(ranked.c.rn <= limit + 1)
+        .order_by(ranked.c.stage, ranked.c.rn)
+    )
+
+async def fetch_board(
+    db: AsyncSession,
+    stage: Optional[DealStage] = None,
+    account_id: Optional[str] = None,
+    cursor: Optional[str] = None,
+    limit: int = 20,
+) -> List[dict]:
+    """One column per stage (or just `stage`), in DealStage order; empty stages included."""
+    result = await db.execute(board_query(stage, account_id, cursor, limit))
+    cards = {}
+    totals = {}
+    for deal, count, amount, weighted in result:
+        key = DealStage(deal.stage)
+        cards.setdefault(key, []).append(deal)
+        totals[key] = (count, amount, weighted)
+
+    columns = []
+    for s in ([stage] if stage else list(DealStage)):
+        count, amount, weighted = totals.get(s, (0, 0.0, 0.0))
+        page = cursor_page(cards.get(s, []), limit)
+        columns.append({
+            "stage": s,
+            "count": count,
+            "total_amount": amount or 0.0,
+            "weighted_amount": weighted or 0.0,
+            **page,
+        })
+    return columns
@@ -0,0 +1,234 @@
+"""
+Revenue forecast over the deals pipeline (GET /api/deals/forecast).
+
+load_pipeline runs one SELECT of (amount, probability, closing month, stage, owner) and
+turns it into NumPy columns; the closing month and the stage code are computed in SQL so
+no per-row datetime or enum work happens in Python. forecast() then buckets by month,
+owner or stage with np.bincount, so the cost after the query is a handful of vectorized
+passes regardless of the number of buckets:
+
+    weighted    CLOSED_WON at full amount + open deals at amount * probability / 100
+    best_case   CLOSED_WON + every open deal
+    worst_case  CLOSED_WON + open deals at or above the commit probability
+
+CLOSED_LOST deals count towards `deals` and `amount` only.
+
+Loading is the expensive part (seconds for a million deals), so get_pipeline keeps the
+columns in a small in-process cache per filter, checked against pipeline_version. On SQLite
+and MySQL that is read from deal_versions, a write counter per scope ('all', 'account:<id>',
+'owner:<id>') that AFTER INSERT/UPDATE/DELETE triggers on deals bump in the writing
+transaction, so a write from any worker or path invalidates exactly the filters whose deals
+it touched, and the check is a primary-key lookup. Other dialects fall back to a
+(count, max(updated_at)) fingerprint, a full index scan that misses edits landing within
+the column's timestamp precision.
+
+    python bench_forecast.py [deals]
+"""
+from typing import Hashable, List, Literal, Optional
+import numpy as np
+from sqlalchemy import case, extract, func, select, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.models import Deal, DealStage, DealVersion
+
+GroupBy = Literal["month", "owner", "stage"]
+
+STAGES = list(DealStage)
+WON = STAGES.index(DealStage.CLOSED_WON)
+LOST = STAGES.index(DealStage.CLOSED_LOST)
+NO_DATE = -1
+
+class Pipeline:
+    """Columnar deals: one array per column, aligned by position."""
+    __slots__ = ("amount", "probability", "month", "stage", "owner", "owners", "version")
+
+    def __init__(self, amount, probability, month, stage, owner, owners: List[str], version: Hashable = None):
+        self.amount = amount            # float64
+        self.probability = probability  # float64, 0-100
+        self.month = month              # int64, year * 12 + month - 1, NO_DATE without closing_date
+        self.stage = stage              # int64, index into STAGES, -1 for unknown stages
+        self.owner = owner              # int64, index into owners
+        self.owners = owners
+        self.version = version          # pipeline_version() it was loaded at, once cached
+
+    def __len__(self) -> int:
+        return len(self.amount)
+
+def pipeline_query(account_id: Optional[str] = None, owner_id: Optional[str] = None):
+    month = extract("year", Deal.closing_date) * 12 + extract("month", Deal.closing_date) - 1
+    query = select(
+        func.coalesce(Deal.amount, 0.0),
+        func.coalesce(Deal.probability, 0),
+        func.coalesce(month, NO_DATE),
+        case({s.value: i for i, s in enumerate(STAGES)}, value=Deal.stage, else_=-1),
+        Deal.owner_id,
+    )
+    if account_id:
+        query = query.where(Deal.account_id == account_id)
+    if owner_id:
+        query = query.where(Deal.owner_id == owner_id)
+    return query
+
+def build_pipeline(rows) -> Pipeline:
+    """Columns from (amount, probability, month, stage, owner_id) tuples."""
+    if not rows:
+        empty = np.empty(0, dtype=np.int64)
+        return Pipeline(np.empty(0), np.empty(0), empty, empty, empty, [])
+    amount, probability, month, stage, owner_ids = zip(*rows)
+    index = {}
+    owner = [index.setdefault(o, len(index)) for o in owner_ids]
+    return Pipeline(
+        np.array(amount, dtype=np.float64),
+        np.array(probability, dtype=np.float64),
+        np.array(month, dtype=np.int64),
+        np.array(stage, dtype=np.int64),
+        np.array(owner, dtype=np.int64),
+        list(index),
+    )
+
+async def load_pipeline(db: AsyncSession, account_id: Optional[str] = None, owner_id: Optional[str] = None) -> Pipeline:
+    result = await db.execute(pipeline_query(account_id, owner_id))
+    return build_pipeline(result.all())
+
+TRIGGER_DIALECTS = ("sqlite", "mysql")
+VERSION_TRIGGERS = ("deals_version_ai", "deals_version_ad", "deals_version_au")
+# What load_pipeline reads; updates touching none of these leave the version alone
+PIPELINE_COLUMNS = ("amount", "probability", "stage", "closing_date", "account_id", "owner_id")
+
+def _scope_values(rows, concat) -> str:
+    """VALUES rows bumping 'all' and the account and owner scopes of each trigger row."""
+    values = ["('all', 1)"]
+    for row in rows:
+        for kind in ("account", "owner"):
+            values.append(f"({concat(f'{kind}:', f'{row}.{kind}_id')}, 1)")
+    return ", ".join(values)
+
+def _sqlite_ddl() -> List[str]:
+    def bump(*rows):
+        values = _scope_values(rows, lambda prefix, column: f"'{prefix}' || COALESCE({column}, '')")
+        return f"INSERT INTO deal_versions (scope, version) VALUES {values} ON CONFLICT(scope) DO UPDATE SET version = version + 1;"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS deals_version_ai AFTER INSERT ON deals BEGIN {bump('new')} END",
+        f"CREATE TRIGGER IF NOT EXISTS deals_version_ad AFTER DELETE ON deals BEGIN {bump('old')} END",
+        f"CREATE TRIGGER IF NOT EXISTS deals_version_au AFTER UPDATE OF {', '.join(PIPELINE_COLUMNS)} ON deals "
+        f"BEGIN {bump('old', 'new')} END",
+    ]
+
+def _mysql_ddl() -> List[str]:
+    def bump(*rows):
+        values = _scope_values(rows, lambda prefix, column: f"CONCAT('{prefix}', COALESCE({column}, ''))")
+        return f"INSERT INTO deal_versions (scope, version) VALUES {values} ON DUPLICATE KEY UPDATE version = version + 1;"
+    unchanged = " AND ".join(f"OLD.{c} <=> NEW.{c}" for c in PIPELINE_COLUMNS)
+    return [
+        f"CREATE TRIGGER deals_version_ai AFTER INSERT ON deals FOR EACH ROW {bump('NEW')}",
+        f"CREATE TRIGGER deals_version_ad AFTER DELETE ON deals FOR EACH ROW {bump('OLD')}",
+        f"CREATE TRIGGER deals_version_au AFTER UPDATE ON deals FOR EACH ROW "
+        f"IF NOT ({unchanged}) THEN {bump('OLD', 'NEW')} END IF",
+    ]
+
+def ensure_pipeline_triggers(conn: Connection) -> None:
+    """Create the deal_versions triggers if missing (sync; use via run_sync)."""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        for ddl in _sqlite_ddl():
+            conn.exec_driver_sql(ddl)
+    elif dialect == "mysql":
+        existing = set(conn.execute(
+            text(
+                "SELECT trigger_name FROM information_schema.triggers "
+                "WHERE trigger_schema = DATABASE() AND event_object_table = 'deals'"
+            )
+        ).scalars())
+        for name, ddl in zip(VERSION_TRIGGERS, _mysql_ddl()):
+            if name not in existing:
+                conn.exec_driver_sql(ddl)
+
+def drop_pipeline_triggers(conn: Connection) -> None:
+    if conn.dialect.name in TRIGGER_DIALECTS:
+        for name in VERSION_TRIGGERS:
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+
+def version_scopes(account_id: Optional[str] = None, owner_id: Optional[str] = None) -> List[str]:
+    """deal_versions rows covering every deal a filter can see: a write to one of its deals
+    bumps the scopes of that deal's account and owner, before and after the write."""
+    scopes = []
+    if account_id:
+        scopes.append(f"account:{account_id}")
+    if owner_id:
+        scopes.append(f"owner:{owner_id}")
+    return scopes or ["all"]
+
+async def pipeline_version(db: AsyncSession, account_id: Optional[str] = None, owner_id: Optional[str] = None) -> Hashable:
+    """Changes whenever a deal matching the filter is inserted, updated or deleted."""
+    if db.bind.dialect.name not in TRIGGER_DIALECTS:
+        count, last_update = (await db.execute(select(func.count(), func.max(Deal.updated_at)).select_from(Deal))).one()
+        return count, last_update
+    scopes = version_scopes(account_id, owner_id)
+    result = await db.execute(select(DealVersion.scope, DealVersion.version).where(DealVersion.scope.in_(scopes)))
+    versions = dict(result.all())
+    # A scope without a row has never been written to since the triggers were created
+    return tuple(versions.get(scope, 0) for scope in scopes)
+
+pipeline_cache = TTLCache(maxsize=settings.FORECAST_CACHE_MAX_SIZE, ttl=settings.FORECAST_CACHE_TTL_SECONDS)
+
+async def get_pipeline(db: AsyncSession, account_id: Optional[str] = None, owner_id: Optional[str] = None) -> Pipeline:
+    """load_pipeline, served from pipeline_cache while the filter's deals are unchanged."""
+    key = (account_id, owner_id)
+    version = await pipeline_version(db, account_id, owner_id)
+    cached = pipeline_cache.get(key)
+    if cached is not None and cached.version == version:
+        return cached
+    pipeline = await load_pipeline(db, account_id, owner_id)
+    pipeline.version = version
+    pipeline_cache.set(key, pipeline)
+    return pipeline
+
+def _month_key(code: int) -> Optional[str]:
+    if code == NO_DATE:
+        return None
+    year, month = divmod(code, 12)
+    return f"{year:04d}-{month + 1:02d}"
+
+def forecast(pipeline: Pipeline, group_by: GroupBy = "month", commit_probability: float = 90) -> dict:
+    """Per-bucket and overall forecast; buckets without deals are left out."""
+    amount, probability, stage = pipeline.amount, pipeline.probability, pipeline.stage
+    won = stage == WON
+    open_ = (stage != WON) & (stage != LOST)
+    measures = {
+        "amount": amount,
+        "weighted": np.where(won, amount, np.where(open_, amount * probability / 100.0, 0.0)),
+        "best_case": np.where(won | open_, amount, 0.0),
+        "worst_case": np.where(won | (open_ & (probability >= commit_probability)), amount, 0.0),
+    }
+
+    if group_by == "month":
+        # Shift so the earliest month is bucket 1; bucket 0 holds deals without a closing date
+        dated = pipeline.month != NO_DATE
+        first = int(pipeline.month[dated].min()) if dated.any() else 0
+        codes = np.where(dated, pipeline.month - first + 1, 0)
+        key = lambda i: _month_key(first + i - 1) if i else None
+    elif group_by == "owner":
+        codes = pipeline.owner
+        key = lambda i: pipeline.owners[i]
+    else:
+        # Unknown stages (code -1) land in the bucket after the last DealStage
+        codes = np.where(stage >= 0, stage, len(STAGES))
+        key = lambda i: STAGES[i].value if i < len(STAGES) else None
+
+    counts = np.bincount(codes)
+    sums = {name: np.bincount(codes, weights=values, minlength=len(counts)) for name, values in measures.items()}
+    buckets = [
+        {"key": key(i), "deals": int(counts[i]), **{name: float(s[i]) for name, s in sums.items()}}
+        for i in np.flatnonzero(counts).tolist()
+    ]
+    if group_by == "month" and buckets and buckets[0]["key"] is None:
+        # Undated deals last, after the chronological buckets
+        buckets.append(buckets.pop(0))
+
+    return {
+        "group_by": group_by,
+        "buckets": buckets,
+        "totals": {"deals": len(pipeline), **{name: float(values.sum()) for name, values in measures.items()}},
+    }
@@ -0,0 +1,156 @@
+"""
+Streaming bulk lead import (POST /api/leads/bulk).
+
+The request body is consumed chunk by chunk, split into CSV records or NDJSON lines,
+validated with LeadCreate and inserted with one executemany INSERT + commit per
+BULK_IMPORT_CHUNK_SIZE rows. Only the current chunk and a capped error list are held in
+memory, whatever the size of the upload.
+"""
+import codecs
+import csv
+import json
+from collections import defaultdict
+from typing import AsyncIterator, List, Tuple, Union
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.db.models import Lead, generate_uuid, utcnow
+from app.schemas.schemas import LeadCreate
+from app.services.lead_stats import adjust_lead_stats
+
+class ImportFormatError(ValueError):
+    pass
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        if "\n" not in buffer:
+            if len(buffer) > settings.BULK_IMPORT_MAX_LINE_LENGTH:
+                raise ImportFormatError("Line exceeds BULK_IMPORT_MAX_LINE_LENGTH")
+            continue
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+async def iter_csv_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Union[dict, str]]]:
+    """Yield (row number, dict) per CSV record; the first record is the header.
+
+    A record whose quotes are unbalanced continues on the next line (quoted newline).
+    """
+    header = None
+    pending = None
+    row_number = 0
+    async for line in lines:
+        record = line if pending is None else f"{pending}\n{line}"
+        if record.count('"') % 2:
+            if len(record) > settings.BULK_IMPORT_MAX_LINE_LENGTH:
+                raise ImportFormatError("Unterminated quoted field")
+            pending = record
+            continue
+        pending = None
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [h.strip() for h in values]
+            continue
+        row_number += 1
+        if len(values) != len(header):
+            yield row_number, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        # Empty cells mean "not provided" so schema defaults apply
+        yield row_number, {k: v for k, v in zip(header, values) if v != ""}
+    if pending is not None:
+        yield row_number + 1, "Unterminated quoted field"
+
+async def iter_ndjson_rows(lines: AsyncIterator[str]) -> AsyncIterator[Tuple[int, Union[dict, str]]]:
+    row_number = 0
+    async for line in lines:
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            data = json.loads(line)
+        except ValueError as e:
+            yield row_number, f"Invalid JSON: {e}"
+            continue
+        if not isinstance(data, dict):
+            yield row_number, "Expected a JSON object"
+            continue
+        yield row_number, data
+
+class ImportReport:
+    def __init__(self):
+        self.inserted = 0
+        self.failed = 0
+        self.errors: List[dict] = []
+        self.errors_truncated = False
+
+    def fail(self, row: int, errors: List[str]) -> None:
+        self.failed += 1
+        if len(self.errors) < settings.BULK_IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row, "errors": errors})
+        else:
+            self.errors_truncated = True
+
+    def as_dict(self) -> dict:
+        return {
+            "inserted": self.inserted,
+            "failed": self.failed,
+            "errors": self.errors,
+            "errors_truncated": self.errors_truncated,
+        }
+
+async def _flush(db: AsyncSession, batch: List[Tuple[int, dict]], report: ImportReport) -> None:
+    rows = [values for _, values in batch]
+    deltas = defaultdict(lambda: [0, 0.0])
+    for values in rows:
+        deltas[values["status"]][0] += 1
+        deltas[values["status"]][1] += values["value"] or 0.0
+    try:
+        await db.execute(insert(Lead), rows)
+        for status, (count, value) in deltas.items():
+            await adjust_lead_stats(db, status, count, value)
+        await db.commit()
+        report.inserted += len(rows)
+    except SQLAlchemyError as e:
+        await db.rollback()
+        reason = f"Database error: {e.__class__.__name__}"
+        for row_number, _ in batch:
+            report.fail(row_number, [reason])
+
+async def import_leads(db: AsyncSession, rows: AsyncIterator[Tuple[int, Union[dict, str]]], user_id: str) -> dict:
+    report = ImportReport()
+    batch: List[Tuple[int, dict]] = []
+    async for row_number, data in rows:
+        if isinstance(data, str):
+            report.fail(row_number, [data])
+            continue
+        try:
+            lead_in = LeadCreate.model_validate(data)
+        except ValidationError as e:
+            report.fail(row_number, [
+                f"{'.'.join(str(p) for p in err['loc'])}: {err['msg']}" for err in e.errors()
+            ])
+            continue
+        now = utcnow()
+        batch.append((row_number, {
+            **lead_in.model_dump(),
+            "id": generate_uuid(),
+            "created_by_id": user_id,
+            "created_at": now,
+            "updated_at": now,
+        }))
+        if len(batch) >= settings.BULK_IMPORT_CHUNK_SIZE:
+            await _flush(db, batch, report)
+            batch = []
+    if batch:
+        await _flush(db, batch, report)
+    return report.as_dict()
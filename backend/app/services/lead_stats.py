@@ -0,0 +1,67 @@
+"""
+Incrementally maintained lead statistics (the lead_stats table).
+
+create_lead, update_lead, convert_lead and delete_lead call adjust_lead_stats inside their
+own transaction, so /api/leads/stats/overview reads one row per status instead of
+aggregating the whole leads table. rebuild_lead_stats recomputes everything from leads to
+repair drift:
+
+    python -m app.services.lead_stats
+"""
+import asyncio
+from typing import Union
+from sqlalchemy import select, update, delete, insert, func
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from app.db.models import Lead, LeadStat, LeadStatus
+
+async def adjust_lead_stats(db: AsyncSession, status: str, count: int, value: float) -> None:
+    """Add `count` / `value` to the status row. Does not commit."""
+    result = await db.execute(
+        update(LeadStat)
+        .where(LeadStat.status == status)
+        .values(count=LeadStat.count + count, total_value=LeadStat.total_value + value)
+    )
+    if result.rowcount == 0:
+        # Rows are seeded for every LeadStatus at startup; this only covers unknown statuses
+        await db.execute(insert(LeadStat).values(status=status, count=count, total_value=value))
+
+async def move_lead_stats(db: AsyncSession, old_status: str, old_value: float, new_status: str, new_value: float) -> None:
+    old_value, new_value = old_value or 0.0, new_value or 0.0
+    if old_status == new_status:
+        if new_value != old_value:
+            await adjust_lead_stats(db, new_status, 0, new_value - old_value)
+        return
+    await adjust_lead_stats(db, old_status, -1, -old_value)
+    await adjust_lead_stats(db, new_status, 1, new_value)
+
+async def rebuild_lead_stats(db: Union[AsyncSession, AsyncConnection]) -> None:
+    """Recompute lead_stats from the leads table. Does not commit."""
+    await db.execute(delete(LeadStat))
+    await db.execute(
+        insert(LeadStat).from_select(
+            ["status", "count", "total_value"],
+            select(Lead.status, func.count(Lead.id), func.coalesce(func.sum(Lead.value), 0.0)).group_by(Lead.status)
+        )
+    )
+    existing = set((await db.execute(select(LeadStat.status))).scalars())
+    missing = [{"status": s.value, "count": 0, "total_value": 0.0} for s in LeadStatus if s.value not in existing]
+    if missing:
+        await db.execute(insert(LeadStat), missing)
+
+async def ensure_lead_stats(conn: AsyncConnection) -> None:
+    """Build lead_stats on first start (empty table), e.g. for databases predating it."""
+    if not (await conn.execute(select(func.count()).select_from(LeadStat))).scalar():
+        await rebuild_lead_stats(conn)
+
+async def _main() -> None:
+    from app.db.session import AsyncSessionLocal, engine
+    async with AsyncSessionLocal() as db:
+        await rebuild_lead_stats(db)
+        await db.commit()
+        rows = (await db.execute(select(LeadStat).order_by(LeadStat.status))).scalars().all()
+    await engine.dispose()
+    for row in rows:
+        print(f"{row.status:<10} count={row.count:<8} total_value={row.total_value}")
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,149 @@
+"""
+Notification writes and the per-user unread counter (the notification_counters table).
+
+On SQLite and MySQL the counter is maintained by AFTER INSERT/UPDATE/DELETE triggers on
+notifications, so every write path (create_notification, mark_read, a plain
+db.add(Notification(...)), bulk or raw SQL) keeps it in step within the same transaction.
+On other dialects create_notification and mark_read adjust it themselves, so writes there
+must go through them. Either way GET /api/notifications/unread-count is a primary-key
+lookup instead of a COUNT over the user's notifications.
+rebuild_unread_counters recomputes the table from notifications to repair drift:
+
+    python -m app.services.notifications
+"""
+import asyncio
+from typing import List, Union
+from sqlalchemy import select, update, delete, insert, func, case, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from app.db.models import Notification, NotificationCounter
+
+TRIGGER_DIALECTS = ("sqlite", "mysql")
+COUNTER_TRIGGERS = ("notifications_unread_ai", "notifications_unread_ad", "notifications_unread_au")
+
+def _sqlite_ddl() -> List[str]:
+    # The WHERE on the INSERT ... SELECT keeps SQLite from parsing ON CONFLICT as a join clause
+    bump = (
+        "INSERT INTO notification_counters (user_id, unread) SELECT new.user_id, 1 WHERE NOT new.is_read "
+        "ON CONFLICT(user_id) DO UPDATE SET unread = unread + 1;"
+    )
+    drop = "UPDATE notification_counters SET unread = MAX(unread - 1, 0) WHERE user_id = old.user_id AND NOT old.is_read;"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS notifications_unread_ai AFTER INSERT ON notifications BEGIN {bump} END",
+        f"CREATE TRIGGER IF NOT EXISTS notifications_unread_ad AFTER DELETE ON notifications BEGIN {drop} END",
+        f"CREATE TRIGGER IF NOT EXISTS notifications_unread_au AFTER UPDATE OF is_read, user_id ON notifications "
+        f"BEGIN {drop} {bump} END",
+    ]
+
+def _mysql_ddl() -> List[str]:
+    bump = (
+        "INSERT INTO notification_counters (user_id, unread) VALUES (NEW.user_id, IF(NEW.is_read, 0, 1)) "
+        "ON DUPLICATE KEY UPDATE unread = unread + IF(NEW.is_read, 0, 1);"
+    )
+    drop = "UPDATE notification_counters SET unread = GREATEST(unread - 1, 0) WHERE user_id = OLD.user_id AND NOT OLD.is_read;"
+    return [
+        f"CREATE TRIGGER notifications_unread_ai AFTER INSERT ON notifications FOR EACH ROW {bump}",
+        f"CREATE TRIGGER notifications_unread_ad AFTER DELETE ON notifications FOR EACH ROW {drop}",
+        # MySQL has no UPDATE OF <columns>; skip updates that change neither column
+        f"CREATE TRIGGER notifications_unread_au AFTER UPDATE ON notifications FOR EACH ROW "
+        f"IF NOT (OLD.is_read <=> NEW.is_read AND OLD.user_id <=> NEW.user_id) THEN {drop} {bump} END IF",
+    ]
+
+def ensure_unread_triggers(conn: Connection) -> None:
+    """Create the counter triggers if missing (sync; use via run_sync)."""
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        for ddl in _sqlite_ddl():
+            conn.exec_driver_sql(ddl)
+    elif dialect == "mysql":
+        existing = set(conn.execute(
+            text(
+                "SELECT trigger_name FROM information_schema.triggers "
+                "WHERE trigger_schema = DATABASE() AND event_object_table = 'notifications'"
+            )
+        ).scalars())
+        for name, ddl in zip(COUNTER_TRIGGERS, _mysql_ddl()):
+            if name not in existing:
+                conn.exec_driver_sql(ddl)
+
+def drop_unread_triggers(conn: Connection) -> None:
+    if conn.dialect.name in TRIGGER_DIALECTS:
+        for name in COUNTER_TRIGGERS:
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+
+def _triggers_maintain_counter(db: AsyncSession) -> bool:
+    return db.bind.dialect.name in TRIGGER_DIALECTS
+
+async def adjust_unread(db: AsyncSession, user_id: str, delta: int) -> None:
+    """Add `delta` to the user's unread count, never going below zero. Does not commit."""
+    if not delta:
+        return
+    unread = NotificationCounter.unread + delta
+    result = await db.execute(
+        update(NotificationCounter)
+        .where(NotificationCounter.user_id == user_id)
+        .values(unread=case((unread < 0, 0), else_=unread))
+    )
+    if result.rowcount == 0:
+        await db.execute(insert(NotificationCounter).values(user_id=user_id, unread=max(delta, 0)))
+
+async def create_notification(db: AsyncSession, user_id: str, title: str, message: str) -> Notification:
+    """Add an unread notification for the user and bump their counter. Does not commit."""
+    notification = Notification(user_id=user_id, title=title, message=message, is_read=False)
+    db.add(notification)
+    await db.flush()
+    if not _triggers_maintain_counter(db):
+        await adjust_unread(db, user_id, 1)
+    return notification
+
+async def mark_read(db: AsyncSession, user_id: str, *criteria) -> int:
+    """Mark the user's unread notifications matching `criteria` as read. Does not commit.
+
+    Returns the number of rows flipped; only those come off the counter.
+    """
+    result = await db.execute(
+        update(Notification)
+        .where(Notification.user_id == user_id, Notification.is_read == False, *criteria)
+        .values(is_read=True)
+        .execution_options(synchronize_session=False)
+    )
+    if not _triggers_maintain_counter(db):
+        await adjust_unread(db, user_id, -result.rowcount)
+    return result.rowcount
+
+async def get_unread_count(db: AsyncSession, user_id: str) -> int:
+    result = await db.execute(
+        select(NotificationCounter.unread).where(NotificationCounter.user_id == user_id)
+    )
+    return result.scalar_one_or_none() or 0
+
+async def rebuild_unread_counters(db: Union[AsyncSession, AsyncConnection]) -> None:
+    """Recompute notification_counters from the notifications table. Does not commit."""
+    await db.execute(delete(NotificationCounter))
+    await db.execute(
+        insert(NotificationCounter).from_select(
+            ["user_id", "unread"],
+            select(Notification.user_id, func.count(Notification.id))
+            .where(Notification.is_read == False)
+            .group_by(Notification.user_id)
+        )
+    )
+
+async def ensure_unread_counters(conn: AsyncConnection) -> None:
+    """Create the triggers, and build notification_counters on first start (empty table),
+    e.g. for databases predating it."""
+    await conn.run_sync(ensure_unread_triggers)
+    if not (await conn.execute(select(func.count()).select_from(NotificationCounter))).scalar():
+        await rebuild_unread_counters(conn)
+
+async def _main() -> None:
+    from app.db.session import AsyncSessionLocal, engine
+    async with AsyncSessionLocal() as db:
+        await rebuild_unread_counters(db)
+        await db.commit()
+        total = (await db.execute(select(func.count()).select_from(NotificationCounter))).scalar()
+    await engine.dispose()
+    print(f"Rebuilt unread counters for {total} users")
+
+if __name__ == "__main__":
+    asyncio.run(_main())
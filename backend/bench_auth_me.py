@@ -0,0 +1,59 @@
+"""
+Micro-benchmark: requests/second on GET /api/auth/me with and without the decoded-JWT cache.
+
+Runs the app in-process over httpx's ASGI transport against a throwaway SQLite database,
+so the numbers measure handler + dependency cost, not network I/O.
+
+    python bench_auth_me.py [requests]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp}/bench.db"
+
+import httpx
+from app.main import app
+from app.core.config import settings
+from app.core.security import create_access_token, get_password_hash, token_cache
+from app.db.init_db import init_db
+from app.db.session import AsyncSessionLocal, engine
+from app.db.models import User, UserStatus
+
+async def run(client: httpx.AsyncClient, headers: dict, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        r = await client.get("/api/auth/me", headers=headers)
+        assert r.status_code == 200, r.text
+    return n / (time.perf_counter() - start)
+
+async def main(n: int):
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        user = User(email="bench@crm.com", hashed_password=get_password_hash("bench"), status=UserStatus.ACTIVE)
+        db.add(user)
+        await db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await run(client, headers, 50)  # warm up
+
+        settings.TOKEN_CACHE_ENABLED = False
+        uncached = await run(client, headers, n)
+
+        settings.TOKEN_CACHE_ENABLED = True
+        token_cache.clear()
+        cached = await run(client, headers, n)
+
+    await engine.dispose()
+    print(f"requests:        {n}")
+    print(f"jwt cache off:   {uncached:8.0f} req/s")
+    print(f"jwt cache on:    {cached:8.0f} req/s  ({cached / uncached:.2f}x)")
+    print(f"cache stats:     {token_cache.stats()}")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000))
@@ -0,0 +1,84 @@
+"""
+Cross-worker backplane check: N worker processes on one Unix-socket backplane directory.
+
+Worker 0 publishes `--events` events, and every worker (the publisher included) counts what
+it receives and reports delivery latency from its LatencyMetrics. It fails if any worker
+misses an event.
+
+    python bench_backplane.py [--workers 4] [--events 2000]
+"""
+import argparse
+import asyncio
+import multiprocessing as mp
+import sys
+import tempfile
+import time
+from app.realtime.backplane import UnixSocketBackplane
+
+async def worker(index: int, socket_dir: str, events: int, ready, go, results) -> None:
+    received = asyncio.Event()
+    seen = 0
+
+    async def handler(event: dict) -> None:
+        nonlocal seen
+        seen += 1
+        if seen == events:
+            received.set()
+
+    backplane = UnixSocketBackplane(socket_dir, peer_refresh=0.0)
+    await backplane.start(handler)
+    ready.wait()
+    if index == 0:
+        go.wait()
+        for i in range(events):
+            await backplane.publish({"message": {"type": "lead_created", "data": {"seq": i}}})
+            # Publishes come from separate requests; let the loop run between them
+            await asyncio.sleep(0)
+    try:
+        await asyncio.wait_for(received.wait(), timeout=30)
+    except asyncio.TimeoutError:
+        pass
+    results.put((index, seen, backplane.stats()))
+    await asyncio.sleep(0.5)
+    await backplane.stop()
+
+def run_worker(*args) -> None:
+    asyncio.run(worker(*args))
+
+def main(args) -> int:
+    socket_dir = tempfile.mkdtemp(prefix="crm-backplane-")
+    ready = mp.Barrier(args.workers + 1)
+    go = mp.Event()
+    results = mp.Queue()
+    procs = [
+        mp.Process(target=run_worker, args=(i, socket_dir, args.events, ready, go, results))
+        for i in range(args.workers)
+    ]
+    for p in procs:
+        p.start()
+    ready.wait()
+    time.sleep(0.2)
+    start = time.perf_counter()
+    go.set()
+    reports = sorted(results.get(timeout=60) for _ in procs)
+    elapsed = time.perf_counter() - start
+    for p in procs:
+        p.join()
+
+    failures = 0
+    print(f"{args.workers} workers, {args.events} events in {elapsed:.2f}s")
+    for index, seen, stats in reports:
+        ok = seen == args.events
+        failures += not ok
+        print(
+            f"[{'OK' if ok else 'FAIL'}] worker {index}: received {seen}/{args.events} "
+            f"p50={stats['latency_ms_p50']}ms p99={stats['latency_ms_p99']}ms max={stats['latency_ms_max']}ms "
+            f"backlogged={stats['backlogged']} peer_full={stats['peer_full']}"
+        )
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--events", type=int, default=2000)
+    sys.exit(main(parser.parse_args()))
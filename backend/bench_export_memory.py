@@ -0,0 +1,103 @@
+"""
+Memory ceiling check for GET /api/leads/export.
+
+Fills a throwaway SQLite database with N leads (default 1,000,000), streams the CSV export
+through the ASGI app and reports bytes received, throughput and the Python heap peak
+(tracemalloc) while streaming. Exits non-zero if the peak exceeds the ceiling, which does
+not depend on N because rows are sent one cursor partition at a time. tests/test_export.py
+asserts the same bound at 20,000 rows.
+
+    python bench_export_memory.py [rows] [ceiling_mb]
+"""
+import asyncio
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import tracemalloc
+import uuid
+
+_tmp = tempfile.mkdtemp()
+_db_path = os.path.join(_tmp, "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_path}"
+
+from app.main import app
+from app.core.security import create_access_token
+from app.db.init_db import init_db
+from app.db.session import AsyncSessionLocal, engine
+from app.db.models import User, UserStatus
+
+def fill(rows: int, user_id: str) -> None:
+    conn = sqlite3.connect(_db_path)
+    batch = 10000
+    for start in range(0, rows, batch):
+        conn.executemany(
+            "INSERT INTO leads (id, first_name, last_name, company, email, title, source, status, value, "
+            "created_by_id, created_at, updated_at) VALUES (?, ?, ?, ?, ?, NULL, 'WEBSITE', 'NEW', ?, ?, ?, ?)",
+            [
+                (str(uuid.uuid4()), f"First{i}", f"Last{i}", f"Company {i % 5000}", f"lead{i}@example.com",
+                 float(i % 1000), user_id, f"2024-01-01 00:00:{i % 60:02d}.{i:06d}"[:26], "2024-01-01 00:00:00")
+                for i in range(start, min(start + batch, rows))
+            ],
+        )
+        conn.commit()
+    conn.close()
+
+async def main(rows: int, ceiling_mb: float) -> int:
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        user = User(email="bench@crm.com", hashed_password="x", status=UserStatus.ACTIVE)
+        db.add(user)
+        await db.commit()
+    start = time.perf_counter()
+    fill(rows, user.id)
+    print(f"inserted {rows} leads in {time.perf_counter() - start:.1f}s")
+
+    token = create_access_token({"sub": user.id})
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": "/api/leads/export", "raw_path": b"/api/leads/export",
+        "query_string": b"", "root_path": "", "server": ("bench", 80), "client": ("bench", 1234),
+        "headers": [(b"host", b"bench"), (b"authorization", f"Bearer {token}".encode())],
+    }
+    counters = {"bytes": 0, "lines": 0, "status": None}
+    request_sent = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        # Count and drop each body chunk, like a client writing it to disk
+        if message["type"] == "http.response.start":
+            counters["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            counters["bytes"] += len(message.get("body", b""))
+            counters["lines"] += message.get("body", b"").count(b"\n")
+            if not message.get("more_body", False):
+                finished.set()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    await app(scope, receive, send)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    await engine.dispose()
+    assert counters["status"] == 200, counters
+    received, lines = counters["bytes"], counters["lines"]
+
+    peak_mb = peak / 1024 / 1024
+    print(f"streamed {lines - 1} rows, {received / 1024 / 1024:.1f} MB in {elapsed:.1f}s ({(lines - 1) / elapsed:.0f} rows/s)")
+    print(f"python heap peak while streaming: {peak_mb:.1f} MB (ceiling {ceiling_mb} MB)")
+    return 0 if peak_mb <= ceiling_mb and lines - 1 == rows else 1
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(asyncio.run(main(int(args[0]) if args else 1_000_000, float(args[1]) if len(args) > 1 else 32.0)))
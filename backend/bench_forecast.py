@@ -0,0 +1,95 @@
+"""
+Timing for the deal forecast (app/services/forecast.py).
+
+Fills a throwaway SQLite database with N deals (default 1,000,000) spread over 50 owners,
+every stage and three years of closing dates (5% without one), then reports separately
+the pipeline load (one SELECT into NumPy columns) and the vectorized forecast for each
+grouping, best of three runs, and a cached request (version check + cache hit + forecast).
+Exits non-zero if a forecast pass or the cached request exceeds the budget.
+
+    python bench_forecast.py [deals] [budget_ms]
+"""
+import asyncio
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+
+_tmp = tempfile.mkdtemp()
+_db_path = os.path.join(_tmp, "bench.db")
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_db_path}"
+
+from app.db.init_db import init_db
+from app.db.session import AsyncSessionLocal, engine
+from app.db.models import DealStage
+from app.services.forecast import forecast, get_pipeline, load_pipeline
+
+def fill(rows: int) -> None:
+    rng = random.Random(0)
+    owners = [str(uuid.uuid4()) for _ in range(50)]
+    stages = [s.value for s in DealStage]
+    conn = sqlite3.connect(_db_path)
+    batch = 10000
+    for start in range(0, rows, batch):
+        conn.executemany(
+            "INSERT INTO deals (id, name, amount, stage, closing_date, probability, account_id, owner_id, "
+            "created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, 'bench', ?, '2024-01-01 00:00:00', '2024-01-01 00:00:00')",
+            [
+                (str(uuid.uuid4()), f"Deal {i}", round(rng.uniform(1000, 100000), 2), rng.choice(stages),
+                 None if rng.random() < 0.05 else f"{rng.randint(2024, 2026)}-{rng.randint(1, 12):02d}-15 00:00:00.000000",
+                 rng.randrange(0, 101, 10), rng.choice(owners))
+                for i in range(start, min(start + batch, rows))
+            ],
+        )
+        conn.commit()
+    conn.close()
+
+def best_of(runs: int, fn):
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times) * 1000, result
+
+async def main(rows: int, budget_ms: float) -> int:
+    await init_db()
+    start = time.perf_counter()
+    fill(rows)
+    print(f"inserted {rows} deals in {time.perf_counter() - start:.1f}s")
+
+    load_ms = []
+    for _ in range(3):
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            pipeline = await load_pipeline(db)
+            load_ms.append((time.perf_counter() - start) * 1000)
+    assert len(pipeline) == rows, len(pipeline)
+    print(f"load_pipeline: {min(load_ms):.0f} ms ({rows / min(load_ms) * 1000:.0f} deals/s)")
+
+    cached_ms = []
+    for _ in range(4):
+        async with AsyncSessionLocal() as db:
+            start = time.perf_counter()
+            forecast(await get_pipeline(db), "month")
+            cached_ms.append((time.perf_counter() - start) * 1000)
+    await engine.dispose()
+    # The first call fills the cache
+    print(f"cold request: {cached_ms[0]:.0f} ms, cached request: {min(cached_ms[1:]):.1f} ms")
+
+    status = 1 if min(cached_ms[1:]) > budget_ms else 0
+    for group_by in ("month", "owner", "stage"):
+        elapsed, result = best_of(3, lambda: forecast(pipeline, group_by))
+        assert sum(b["deals"] for b in result["buckets"]) == rows
+        print(f"forecast by {group_by}: {elapsed:.1f} ms, {len(result['buckets'])} buckets, "
+              f"weighted {result['totals']['weighted']:.0f}")
+        if elapsed > budget_ms:
+            status = 1
+    return status
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    sys.exit(asyncio.run(main(int(args[0]) if args else 1_000_000, float(args[1]) if len(args) > 1 else 250.0)))
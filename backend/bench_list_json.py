@@ -0,0 +1,90 @@
+"""
+CPU benchmark: list endpoints with and without settings.FAST_JSON_RESPONSES.
+
+Runs the app in-process over httpx's ASGI transport against a throwaway SQLite database
+holding 1,000 leads and 100 deals, and reports process CPU time per 100-row page for
+the default path (ORM objects -> response_model validation), the fast path with orjson and
+the fast path's stdlib json fallback, plus the response size. The `fields=` URLs show
+sparse fieldsets, which take the projected path even with the fast path off. Also checks
+that every path returns the same body.
+
+    python bench_list_json.py [requests]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp}/bench.db"
+
+import httpx
+from app.main import app
+from app.api import fast_json
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.init_db import init_db
+from app.db.session import AsyncSessionLocal, engine
+from app.db.models import Account, Deal, DealStage, Lead, User, UserStatus
+
+URLS = [
+    "/api/leads/?limit=100",
+    "/api/leads/?limit=100&cursor=",
+    "/api/deals/",
+    # Sparse fieldsets: a four-column grid
+    "/api/leads/?limit=100&fields=first_name,last_name,email,status",
+    "/api/deals/?fields=name,amount,stage,closing_date",
+]
+
+async def seed(rows: int) -> str:
+    async with AsyncSessionLocal() as db:
+        user = User(email="bench@crm.com", hashed_password="x", status=UserStatus.ACTIVE)
+        account = Account(name="Bench", created_by_id="")
+        db.add_all([user, account])
+        await db.flush()
+        account.created_by_id = user.id
+        for i in range(rows):
+            db.add(Lead(first_name=f"First{i}", last_name=f"Last{i}", company=f"Company {i}",
+                        email=f"lead{i}@example.com", source="WEBSITE", value=float(i), created_by_id=user.id))
+        # GET /api/deals/ is unpaginated; 100 deals keeps it a 100-row page
+        for i in range(100):
+            db.add(Deal(name=f"Deal {i}", amount=1000.0 + i, stage=list(DealStage)[i % 6], probability=i % 100,
+                        account_id=account.id, owner_id=user.id))
+        await db.commit()
+        return user.id
+
+async def run(client: httpx.AsyncClient, headers: dict, url: str, n: int):
+    cpu = time.process_time()
+    for _ in range(n):
+        r = await client.get(url, headers=headers)
+        assert r.status_code == 200, r.text
+    return (time.process_time() - cpu) / n * 1000, r.json(), len(r.content)
+
+async def main(n: int):
+    await init_db()
+    user_id = await seed(1000)
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user_id})}"}
+    orjson = fast_json.orjson
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for url in URLS:
+            await run(client, headers, url, 20)  # warm up
+            settings.FAST_JSON_RESPONSES = False
+            default_ms, expected, size = await run(client, headers, url, n)
+            settings.FAST_JSON_RESPONSES = True
+            fast_ms, body, _ = await run(client, headers, url, n)
+            assert body == expected, "fast path body differs"
+            fast_json.orjson = None
+            json_ms, body, _ = await run(client, headers, url, n)
+            assert body == expected, "json fallback body differs"
+            fast_json.orjson = orjson
+            settings.FAST_JSON_RESPONSES = False
+            print(f"{url}\n    {size / 1024:5.1f} KiB   default {default_ms:6.2f} ms   orjson {fast_ms:6.2f} ms "
+                  f"({default_ms / fast_ms:.2f}x)   json {json_ms:6.2f} ms ({default_ms / json_ms:.2f}x)   CPU per request")
+
+    await engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 200))
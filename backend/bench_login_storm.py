@@ -0,0 +1,78 @@
+"""
+Load test: latency of an unrelated endpoint (GET /) while a login storm is running.
+
+Runs the app in-process over httpx's ASGI transport, so a handler that blocks the event
+loop delays every other request exactly as it would inside one uvicorn worker. Compares
+inline pbkdf2 (PASSWORD_HASH_WORKERS=0) against the worker pool.
+
+    python bench_login_storm.py [concurrent_logins] [seconds]
+"""
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp}/bench.db"
+
+import httpx
+from app.main import app
+from app.core.config import settings
+from app.core.security import get_password_hash, shutdown_hash_pool
+from app.db.init_db import init_db
+from app.db.session import AsyncSessionLocal, engine
+from app.db.models import User, UserStatus
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+async def login_storm(client, stop: asyncio.Event, counts: dict):
+    # Wrong password: still pays the full pbkdf2 verify, answers 401
+    while not stop.is_set():
+        r = await client.post("/api/auth/login", json={"email": "storm@crm.com", "password": "wrong"})
+        counts[r.status_code] = counts.get(r.status_code, 0) + 1
+
+async def probe(client, stop: asyncio.Event, latencies: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        r = await client.get("/")
+        assert r.status_code == 200
+        latencies.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(0.005)
+
+async def scenario(client, workers: int, concurrency: int, seconds: float):
+    settings.PASSWORD_HASH_WORKERS = workers
+    shutdown_hash_pool()
+    stop = asyncio.Event()
+    latencies, counts = [], {}
+    tasks = [asyncio.create_task(login_storm(client, stop, counts)) for _ in range(concurrency)]
+    tasks.append(asyncio.create_task(probe(client, stop, latencies)))
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    label = "inline" if workers == 0 else f"pool({workers})"
+    print(
+        f"{label:>8}: GET / p50={statistics.median(latencies):6.1f}ms "
+        f"p99={percentile(latencies, 99):6.1f}ms max={max(latencies):6.1f}ms "
+        f"probes={len(latencies)} logins={counts}"
+    )
+
+async def main(concurrency: int, seconds: float):
+    await init_db()
+    async with AsyncSessionLocal() as db:
+        db.add(User(email="storm@crm.com", hashed_password=get_password_hash("right"), status=UserStatus.ACTIVE))
+        await db.commit()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await scenario(client, 0, concurrency, seconds)
+        await scenario(client, 4, concurrency, seconds)
+    shutdown_hash_pool()
+    await engine.dispose()
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(main(int(args[0]) if args else 32, float(args[1]) if len(args) > 1 else 5.0))
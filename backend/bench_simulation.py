@@ -0,0 +1,63 @@
+"""
+Timing for the Monte Carlo revenue simulation (app/services/simulation.py).
+
+Builds a synthetic pipeline of N deals (default 100,000; ~70% open, closing over the next
+two years) in memory, then times simulate() for T trials (default 10,000) in a thread and
+across process pools of increasing size, and a cached get_simulation() call.
+
+    python bench_simulation.py [deals] [trials]
+"""
+import asyncio
+import os
+import sys
+import time
+
+os.environ.setdefault("SIMULATION_POOL_MIN_CELLS", "0")
+
+import numpy as np
+from app.core.config import settings
+from app.db.models import DealStage
+from app.services.forecast import STAGES, Pipeline
+from app.services.simulation import shutdown_simulation_pool, simulate
+
+def synthetic_pipeline(deals: int) -> Pipeline:
+    rng = np.random.default_rng(0)
+    stage_p = [0.2, 0.15, 0.15, 0.2, 0.15, 0.15]
+    return Pipeline(
+        amount=rng.uniform(1000, 100000, deals).round(2),
+        probability=rng.integers(0, 11, deals) * 10.0,
+        month=rng.integers(2026 * 12, 2028 * 12, deals),
+        stage=rng.choice(len(STAGES), deals, p=stage_p),
+        owner=rng.integers(0, 50, deals),
+        owners=[f"owner-{i}" for i in range(50)],
+    )
+
+async def timed(label: str, pipeline: Pipeline, trials: int, current_month: int) -> dict:
+    start = time.perf_counter()
+    result = await simulate(pipeline, trials, current_month)
+    elapsed = time.perf_counter() - start
+    cells = trials * result["open_deals"]
+    print(f"{label}: {elapsed:.2f}s ({cells / elapsed / 1e6:.0f}M deal-trials/s)")
+    return result
+
+async def main(deals: int, trials: int) -> None:
+    pipeline = synthetic_pipeline(deals)
+    current_month = 2026 * 12
+    open_deals = int(np.isin(pipeline.stage, [STAGES.index(DealStage.CLOSED_WON), STAGES.index(DealStage.CLOSED_LOST)], invert=True).sum())
+    print(f"{deals} deals, {open_deals} open, {trials} trials")
+
+    settings.SIMULATION_WORKERS = 0
+    result = await timed("thread", pipeline, trials, current_month)
+    for workers in sorted({2, 4, os.cpu_count() or 1}):
+        settings.SIMULATION_WORKERS = workers
+        # Warm the pool first: spawn start-up is paid once per process lifetime, not per request
+        await simulate(pipeline, workers, current_month)
+        await timed(f"pool x{workers}", pipeline, trials, current_month)
+        shutdown_simulation_pool()
+
+    q = result["quarters"][len(result["quarters"]) // 2]
+    print(f"{q['quarter']}: P10 {q['p10']:.0f}  P50 {q['p50']:.0f}  P90 {q['p90']:.0f}")
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    asyncio.run(main(int(args[0]) if args else 100_000, int(args[1]) if len(args) > 1 else 10_000))
@@ -0,0 +1,94 @@
+"""
+Concurrent read/write benchmark for the SQLite connection pragmas in app/db/session.py.
+
+Copies crm.db to a temp dir (the original is never touched) and, for each pragma set,
+runs reader tasks (lead list page + status stats) alongside writer tasks (insert a lead
+and commit) for a fixed time, reporting reads/s, writes/s and lock errors.
+
+    python bench_sqlite_pragmas.py [readers] [writers] [seconds]
+"""
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from sqlalchemy import event, select, desc, func
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from app.db.base import Base
+from app.db.models import Lead
+from app.db.session import sqlite_pragmas
+
+SOURCE_DB = os.path.join(os.path.dirname(os.path.abspath(__file__)), "crm.db")
+
+# SQLite's own defaults (rollback journal, fsync on every commit)
+BASELINE = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+async def reader(Session, stop, counts):
+    while not stop.is_set():
+        try:
+            async with Session() as db:
+                await db.execute(select(Lead).order_by(desc(Lead.created_at)).limit(50))
+                await db.execute(select(Lead.status, func.count(Lead.id)).group_by(Lead.status))
+            counts["reads"] += 1
+        except OperationalError:
+            counts["errors"] += 1
+
+async def writer(Session, stop, counts, n):
+    i = 0
+    while not stop.is_set():
+        i += 1
+        try:
+            async with Session() as db:
+                db.add(Lead(first_name="Bench", last_name=f"W{n}-{i}", company="Bench Co",
+                            email=f"bench{n}-{i}@crm.com", created_by_id="bench"))
+                await db.commit()
+            counts["writes"] += 1
+        except OperationalError:
+            counts["errors"] += 1
+
+async def scenario(label, pragmas, readers, writers, seconds):
+    tmp = tempfile.mkdtemp()
+    path = os.path.join(tmp, "crm.db")
+    if os.path.exists(SOURCE_DB):
+        shutil.copy(SOURCE_DB, path)
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", pool_size=readers + writers)
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    Session = async_sessionmaker(engine, expire_on_commit=False)
+    stop = asyncio.Event()
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    tasks = [asyncio.create_task(reader(Session, stop, counts)) for _ in range(readers)]
+    tasks += [asyncio.create_task(writer(Session, stop, counts, n)) for n in range(writers)]
+    start = time.perf_counter()
+    await asyncio.sleep(seconds)
+    stop.set()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    await engine.dispose()
+    shutil.rmtree(tmp, ignore_errors=True)
+
+    print(f"{label:>9}: reads/s={counts['reads'] / elapsed:8.1f} writes/s={counts['writes'] / elapsed:8.1f} "
+          f"lock errors={counts['errors']}  {pragmas}")
+    return counts
+
+async def main(readers, writers, seconds):
+    await scenario("baseline", BASELINE, readers, writers, seconds)
+    await scenario("tuned", sqlite_pragmas(), readers, writers, seconds)
+
+if __name__ == "__main__":
+    args = [float(a) for a in sys.argv[1:]]
+    asyncio.run(main(int(args[0]) if args else 8, int(args[1]) if len(args) > 1 else 2, args[2] if len(args) > 2 else 5.0))
@@ -0,0 +1,68 @@
+"""
+Write-path benchmark: create-and-commit with and without the post-commit db.refresh().
+
+Router create/update handlers used to `commit()` and then `refresh()` the object, paying an
+extra SELECT per write even though expire_on_commit=False keeps every attribute loaded.
+This measures both variants on the same session setup against a throwaway SQLite file, plus
+the current POST /api/leads/ handler end to end.
+
+    python bench_writes.py [writes]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{_tmp}/bench.db"
+
+import httpx
+from app.main import app
+from app.core.security import create_access_token
+from app.db.init_db import init_db
+from app.db.session import AsyncSessionLocal, engine
+from app.db.models import Account, User, UserStatus
+
+async def session_writes(n: int, refresh: bool) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        async with AsyncSessionLocal() as db:
+            account = Account(name=f"Bench {i}", created_by_id="bench")
+            db.add(account)
+            await db.commit()
+            if refresh:
+                await db.refresh(account)
+            assert account.id and account.created_at
+    return n / (time.perf_counter() - start)
+
+async def api_writes(n: int) -> float:
+    async with AsyncSessionLocal() as db:
+        user = User(email="bench@crm.com", hashed_password="x", status=UserStatus.ACTIVE)
+        db.add(user)
+        await db.commit()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        start = time.perf_counter()
+        for i in range(n):
+            r = await client.post("/api/leads/", headers=headers, json={
+                "first_name": "Bench", "last_name": str(i), "company": "Bench Co", "email": f"b{i}@crm.com"
+            })
+            assert r.status_code == 200, r.text
+        return n / (time.perf_counter() - start)
+
+async def main(n: int):
+    await init_db()
+    await session_writes(50, True)  # warm up
+    with_refresh = await session_writes(n, True)
+    without_refresh = await session_writes(n, False)
+    api = await api_writes(n)
+    await engine.dispose()
+    print(f"writes:                     {n}")
+    print(f"commit + refresh:           {with_refresh:8.0f} writes/s")
+    print(f"commit only:                {without_refresh:8.0f} writes/s  ({without_refresh / with_refresh:.2f}x)")
+    print(f"POST /api/leads/ (current): {api:8.0f} req/s")
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 1000))
@@ -0,0 +1,83 @@
+"""
+WebSocket broadcast benchmark: the old sequential ConnectionManager vs app/realtime/manager.py.
+
+Uses in-memory sockets whose send_text costs `--send-ms` (a network write), with a small
+fraction of slow clients that take `--slow-ms`. For each connection count it measures how
+long one broadcast takes to reach every healthy client:
+
+  sequential  the old loop that awaits send_text(json.dumps(...)) socket by socket
+  queued      serialize once, enqueue per connection, send concurrently, drop slow consumers
+
+    python bench_ws_broadcast.py [--counts 100,1000,3000] [--slow-ratio 0.01]
+"""
+import argparse
+import asyncio
+import json
+import time
+from app.realtime.manager import ConnectionManager
+
+class FakeWebSocket:
+    def __init__(self, send_delay: float):
+        self.send_delay = send_delay
+        self.received = asyncio.Event()
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, text: str):
+        await asyncio.sleep(self.send_delay)
+        self.received.set()
+
+    async def close(self, code: int = 1000):
+        pass
+
+class SequentialManager:
+    """The pre-queue ConnectionManager from server.py, kept for comparison."""
+
+    def __init__(self):
+        self.active_connections = {}
+
+    async def connect(self, user_id, websocket):
+        await websocket.accept()
+        self.active_connections[user_id] = websocket
+
+    async def broadcast(self, message: dict):
+        for connection in self.active_connections.values():
+            await connection.send_text(json.dumps(message))
+
+MESSAGE = {"type": "lead_created", "data": {"id": "x" * 36, "first_name": "Bench", "company": "Acme", "value": 1000.0}}
+
+async def run(manager, count: int, slow_every: int, send_delay: float, slow_delay: float) -> float:
+    sockets = []
+    for i in range(count):
+        slow = slow_every and i % slow_every == 0
+        ws = FakeWebSocket(slow_delay if slow else send_delay)
+        await manager.connect(f"user-{i}", ws)
+        if not slow:
+            sockets.append(ws)
+    start = time.perf_counter()
+    await manager.broadcast(MESSAGE)
+    await asyncio.gather(*(ws.received.wait() for ws in sockets))
+    elapsed = time.perf_counter() - start
+    if isinstance(manager, ConnectionManager):
+        await manager.close()
+    return elapsed
+
+async def main(args) -> None:
+    counts = [int(c) for c in args.counts.split(",")]
+    slow_every = int(1 / args.slow_ratio) if args.slow_ratio else 0
+    send_delay, slow_delay = args.send_ms / 1000, args.slow_ms / 1000
+    print(f"send={args.send_ms}ms slow={args.slow_ms}ms slow_ratio={args.slow_ratio}")
+    print(f"{'connections':>12} {'sequential ms':>14} {'queued ms':>10} {'speedup':>8}")
+    for count in counts:
+        seq = await run(SequentialManager(), count, slow_every, send_delay, slow_delay)
+        queued = await run(ConnectionManager(send_timeout=args.slow_ms / 2000), count, slow_every, send_delay, slow_delay)
+        print(f"{count:>12} {seq * 1000:>14.1f} {queued * 1000:>10.1f} {seq / queued:>7.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--counts", default="100,1000,3000")
+    parser.add_argument("--send-ms", type=float, default=0.2)
+    parser.add_argument("--slow-ms", type=float, default=200.0)
+    parser.add_argument("--slow-ratio", type=float, default=0.01)
+    asyncio.run(main(parser.parse_args()))
@@ -18,6 +18,9 @@ from fastapi_mail import FastMail, MessageSchema, ConnectionConfig, MessageType
 from pydantic import EmailStr, BaseModel
 import random
 import string
+from app.realtime.manager import ConnectionManager
+from app.realtime.backplane import create_backplane
+from app.services.audit import AuditWriter
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
@@ -118,38 +121,31 @@ async def send_verification_email(email: EmailStr, otp: str):
 app = FastAPI()
 api_router = APIRouter(prefix="/api")
 
-# WebSocket connection manager
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
-
-    async def connect(self, user_id: str, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections[user_id] = websocket
-
-    def disconnect(self, user_id: str):
-        if user_id in self.active_connections:
-            del self.active_connections[user_id]
-
-    async def send_personal_message(self, message: dict, user_id: str):
-        if user_id in self.active_connections:
-            try:
-                await self.active_connections[user_id].send_text(json.dumps(message))
-            except:
-                self.disconnect(user_id)
-
-    async def broadcast(self, message: dict, exclude_user: Optional[str] = None):
-        disconnected = []
-        for user_id, connection in self.active_connections.items():
-            if user_id != exclude_user:
-                try:
-                    await connection.send_text(json.dumps(message))
-                except:
-                    disconnected.append(user_id)
-        for user_id in disconnected:
-            self.disconnect(user_id)
-
-manager = ConnectionManager()
+# WebSocket connection manager: per-connection send queues, several tabs per user,
+# slow consumers are closed instead of stalling everyone (see app/realtime/manager.py)
+manager = ConnectionManager(
+    queue_size=int(os.environ.get('WS_SEND_QUEUE_SIZE', 256)),
+    send_timeout=float(os.environ.get('WS_SEND_TIMEOUT', 5.0)),
+)
+
+# Event backplane: with several uvicorn workers every event goes through it so clients on
+# other workers see it too (REALTIME_BACKPLANE=unix); see app/realtime/backplane.py
+backplane = create_backplane(
+    os.environ.get('REALTIME_BACKPLANE', 'inprocess'),
+    os.environ.get('REALTIME_SOCKET_DIR', '/tmp/crm-realtime'),
+)
+
+async def deliver_event(event: dict):
+    if event.get("user_id"):
+        await manager.send_personal_message(event["message"], event["user_id"])
+    else:
+        await manager.broadcast(event["message"], exclude_user=event.get("exclude_user"))
+
+async def broadcast(message: dict, exclude_user: Optional[str] = None):
+    await backplane.publish({"message": message, "exclude_user": exclude_user})
+
+async def send_personal_message(message: dict, user_id: str):
+    await backplane.publish({"message": message, "user_id": user_id})
 
 # Enums
 class RoleEnum(str, Enum):
@@ -374,17 +370,16 @@ async def get_current_user(token: HTTPAuthorizationCredentials = Depends(securit
         raise credentials_exception
     return user
 
+async def write_audit_logs(batch: List[dict]):
+    await db.audit_logs.insert_many(
+        [{**log, "created_at": log["created_at"].isoformat()} for log in batch], ordered=False
+    )
+
+# Audit events are queued and written in batches by a background task (app/services/audit.py)
+audit_writer = AuditWriter(write_audit_logs)
+
 async def create_audit_log(action: str, entity: str, entity_id: str, user_id: str, changes: Optional[dict] = None):
-    log = {
-        "id": str(uuid.uuid4()),
-        "action": action,
-        "entity": entity,
-        "entity_id": entity_id,
-        "changes": changes,
-        "user_id": user_id,
-        "created_at": datetime.now(timezone.utc).isoformat()
-    }
-    await db.audit_logs.insert_one(log)
+    audit_writer.record(action, entity, entity_id, user_id, changes)
 
 async def create_notification(user_id: str, type: NotificationType, title: str, message: str, metadata: Optional[dict] = None):
     notification = {
@@ -399,7 +394,7 @@ async def create_notification(user_id: str, type: NotificationType, title: str,
     }
     await db.notifications.insert_one(notification)
     try:
-        await manager.send_personal_message({"type": "notification", "data": notification}, user_id)
+        await send_personal_message({"type": "notification", "data": notification}, user_id)
     except:
         pass
 
@@ -607,7 +602,7 @@ async def create_customer(customer_data: CustomerCreate, current_user: dict = De
         )
     
     # Broadcast to all users
-    await manager.broadcast({"type": "customer_created", "data": customer_dict})
+    await broadcast({"type": "customer_created", "data": customer_dict})
     
     customer_dict["created_at"] = datetime.fromisoformat(customer_dict["created_at"])
     customer_dict["updated_at"] = datetime.fromisoformat(customer_dict["updated_at"])
@@ -639,7 +634,7 @@ async def update_customer(customer_id: str, update_data: CustomerUpdate, current
     updated_customer = await db.customers.find_one({"id": customer_id}, {"_id": 0})
     
     # Broadcast update
-    await manager.broadcast({"type": "customer_updated", "data": updated_customer})
+    await broadcast({"type": "customer_updated", "data": updated_customer})
     
     updated_customer["created_at"] = datetime.fromisoformat(updated_customer["created_at"])
     updated_customer["updated_at"] = datetime.fromisoformat(updated_customer["updated_at"])
@@ -655,7 +650,7 @@ async def delete_customer(customer_id: str, current_user: dict = Depends(get_cur
         raise HTTPException(status_code=404, detail="Customer not found")
     
     await create_audit_log("DELETE", "Customer", customer_id, current_user["id"])
-    await manager.broadcast({"type": "customer_deleted", "data": {"id": customer_id}})
+    await broadcast({"type": "customer_deleted", "data": {"id": customer_id}})
     
     return {"message": "Customer deleted successfully"}
 
@@ -708,7 +703,7 @@ async def create_lead(lead_data: LeadCreate, current_user: dict = Depends(get_cu
         )
     
     # Broadcast to all users
-    await manager.broadcast({"type": "lead_created", "data": lead_dict})
+    await broadcast({"type": "lead_created", "data": lead_dict})
     
     lead_dict["created_at"] = datetime.fromisoformat(lead_dict["created_at"])
     lead_dict["updated_at"] = datetime.fromisoformat(lead_dict["updated_at"])
@@ -756,7 +751,7 @@ async def update_lead(lead_id: str, update_data: LeadUpdate, current_user: dict
         )
     
     # Broadcast update
-    await manager.broadcast({"type": "lead_updated", "data": updated_lead})
+    await broadcast({"type": "lead_updated", "data": updated_lead})
     
     updated_lead["created_at"] = datetime.fromisoformat(updated_lead["created_at"])
     updated_lead["updated_at"] = datetime.fromisoformat(updated_lead["updated_at"])
@@ -774,7 +769,7 @@ async def delete_lead(lead_id: str, current_user: dict = Depends(get_current_use
         raise HTTPException(status_code=404, detail="Lead not found")
     
     await create_audit_log("DELETE", "Lead", lead_id, current_user["id"])
-    await manager.broadcast({"type": "lead_deleted", "data": {"id": lead_id}})
+    await broadcast({"type": "lead_deleted", "data": {"id": lead_id}})
     
     return {"message": "Lead deleted successfully"}
 
@@ -823,7 +818,7 @@ async def create_activity(activity_data: ActivityCreate, current_user: dict = De
     await create_audit_log("CREATE", "Activity", activity_dict["id"], current_user["id"])
     
     # Broadcast to all users
-    await manager.broadcast({"type": "activity_created", "data": activity_dict})
+    await broadcast({"type": "activity_created", "data": activity_dict})
     
     activity_dict["created_at"] = datetime.fromisoformat(activity_dict["created_at"])
     activity_dict["updated_at"] = datetime.fromisoformat(activity_dict["updated_at"])
@@ -879,6 +874,13 @@ async def get_audit_logs(
         log["created_at"] = datetime.fromisoformat(log["created_at"])
     return logs
 
+# Real-time delivery stats for this worker (Admin only)
+@api_router.get("/realtime/stats")
+async def get_realtime_stats(current_user: dict = Depends(get_current_user)):
+    if current_user["role"] != RoleEnum.ADMIN:
+        raise HTTPException(status_code=403, detail="Insufficient permissions")
+    return {"backplane": backplane.stats(), "connections": manager.stats()}
+
 # WebSocket endpoint
 @app.websocket("/ws/{token}")
 async def websocket_endpoint(websocket: WebSocket, token: str):
@@ -893,24 +895,29 @@ async def websocket_endpoint(websocket: WebSocket, token: str):
         await websocket.close(code=1008)
         return
     
-    # Connect user
-    await manager.connect(user_id, websocket)
+    # Connect user (one connection per tab)
+    first_tab = not manager.is_connected(user_id)
+    connection = await manager.connect(user_id, websocket)
     
     # Update user status to online
-    await db.users.update_one({"id": user_id}, {"$set": {"is_online": True}})
-    await manager.broadcast({"type": "user_online", "data": {"user_id": user_id}})
+    if first_tab:
+        await db.users.update_one({"id": user_id}, {"$set": {"is_online": True}})
+        await broadcast({"type": "user_online", "data": {"user_id": user_id}})
     
     try:
         while True:
             data = await websocket.receive_text()
             # Handle incoming messages if needed
     except WebSocketDisconnect:
-        manager.disconnect(user_id)
-        await db.users.update_one(
-            {"id": user_id},
-            {"$set": {"is_online": False, "last_seen": datetime.now(timezone.utc).isoformat()}}
-        )
-        await manager.broadcast({"type": "user_offline", "data": {"user_id": user_id}})
+        pass
+    finally:
+        # Offline only once the user's last tab is gone
+        if manager.disconnect(connection):
+            await db.users.update_one(
+                {"id": user_id},
+                {"$set": {"is_online": False, "last_seen": datetime.now(timezone.utc).isoformat()}}
+            )
+            await broadcast({"type": "user_offline", "data": {"user_id": user_id}})
 
 # Include router
 app.include_router(api_router)
@@ -934,6 +941,9 @@ logger = logging.getLogger(__name__)
 # Startup event
 @app.on_event("startup")
 async def startup_event():
+    await backplane.start(deliver_event)
+    await audit_writer.start()
+
     # Create default admin user
     admin_email = "admin@crm.com"
     admin = await db.users.find_one({"email": admin_email})
@@ -958,4 +968,7 @@ async def startup_event():
 
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await backplane.stop()
+    await manager.close()
+    await audit_writer.stop()
     client.close()
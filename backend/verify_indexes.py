@@ -0,0 +1,71 @@
+"""
+EXPLAIN check for the composite indexes declared in app/db/models.py.
+
+Compiles the hot query shapes used by the routers, runs EXPLAIN on the configured
+DATABASE_URL (SQLite: EXPLAIN QUERY PLAN, MySQL: EXPLAIN) and fails if the planner
+does not pick the expected index. tests/test_indexes.py runs the same shapes on SQLite
+under pytest.
+
+    python verify_indexes.py                      # uses DATABASE_URL / .env
+    DATABASE_URL=mysql+aiomysql://... python verify_indexes.py
+"""
+import asyncio
+import sys
+from sqlalchemy import select, desc, text
+from app.db.session import engine
+from app.db.init_db import init_db
+from app.db.models import User, Account, Contact, Lead, Deal, Activity, Notification, AuditLog
+from app.api.pagination import keyset_paginate, encode_cursor
+from datetime import datetime
+
+CURSOR = encode_cursor(datetime(2024, 1, 1), "00000000-0000-0000-0000-000000000000")
+
+QUERY_SHAPES = [
+    ("ix_leads_created_at_id", keyset_paginate(select(Lead), Lead, CURSOR, 100)),
+    ("ix_leads_status_created_at",
+     select(Lead).where(Lead.status == "NEW").order_by(desc(Lead.created_at)).limit(100)),
+    ("ix_accounts_created_at_id", keyset_paginate(select(Account), Account, CURSOR, 100)),
+    ("ix_users_created_at_id", keyset_paginate(select(User), User, CURSOR, 100)),
+    ("ix_contacts_created_at_id", keyset_paginate(select(Contact), Contact, CURSOR, 100)),
+    ("ix_contacts_account_id_created_at",
+     select(Contact).where(Contact.account_id == "a").order_by(desc(Contact.created_at)).limit(100)),
+    ("ix_deals_stage_created_at",
+     select(Deal).where(Deal.stage == "PROPOSAL").order_by(desc(Deal.created_at))),
+    ("ix_deals_account_id_created_at",
+     select(Deal).where(Deal.account_id == "a").order_by(desc(Deal.created_at))),
+    ("ix_activities_created_at_id", keyset_paginate(select(Activity), Activity, CURSOR, 50)),
+    ("ix_activities_lead_id_created_at",
+     select(Activity).where(Activity.lead_id == "l").order_by(desc(Activity.created_at)).limit(50)),
+    ("ix_notifications_user_id_created_at",
+     select(Notification).where(Notification.user_id == "u").order_by(desc(Notification.created_at)).limit(20)),
+    ("ix_notifications_user_id_is_read_created_at",
+     select(Notification).where(Notification.user_id == "u", Notification.is_read == False)),
+    ("ix_audit_logs_created_at", select(AuditLog).order_by(desc(AuditLog.created_at)).limit(50)),
+]
+
+async def explain(conn, stmt) -> str:
+    dialect = conn.dialect
+    sql = str(stmt.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    if dialect.name == "sqlite":
+        rows = await conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"))
+        return " | ".join(row.detail for row in rows)
+    rows = await conn.execute(text(f"EXPLAIN {sql}"))
+    return " | ".join(f"key={row._mapping['key']}" for row in rows)
+
+async def main() -> int:
+    await init_db()
+    failures = 0
+    async with engine.connect() as conn:
+        if conn.dialect.name not in ("sqlite", "mysql"):
+            print(f"Unsupported dialect for this check: {conn.dialect.name}")
+            return 1
+        for index_name, stmt in QUERY_SHAPES:
+            plan = await explain(conn, stmt)
+            ok = index_name in plan
+            failures += not ok
+            print(f"[{'OK' if ok else 'FAIL'}] {index_name}: {plan}")
+    await engine.dispose()
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
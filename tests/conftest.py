@@ -0,0 +1,53 @@
+"""
+Shared fixtures for the app backend (backend/app) on a throwaway SQLite database.
+
+The app is started once per session through TestClient, so the lifespan (init_db, the
+real-time hub, the audit writer) runs as in production. Async code runs on the app's own
+event loop through `run`, which keeps the engine's pooled connections on one loop.
+"""
+import os
+import sys
+import tempfile
+import uuid
+
+import pytest
+
+BACKEND = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backend")
+sys.path.insert(0, BACKEND)
+os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tempfile.mkdtemp()}/test.db"
+
+from fastapi.testclient import TestClient
+from app.main import app
+from app.core.security import create_access_token
+from app.db.session import AsyncSessionLocal
+from app.db.models import User, RoleEnum, UserStatus
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+@pytest.fixture(scope="session")
+def run(client):
+    """run(async_fn, *args) -> result, on the app's event loop."""
+    return client.portal.call
+
+def make_user(run, role: RoleEnum = RoleEnum.ADMIN, status: UserStatus = UserStatus.ACTIVE) -> User:
+    async def create():
+        async with AsyncSessionLocal() as db:
+            user = User(email=f"{uuid.uuid4().hex}@test.crm", hashed_password="x", role=role, status=status, is_verified=True)
+            db.add(user)
+            await db.commit()
+            return user
+    return run(create)
+
+def auth_headers(user: User) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': user.id})}"}
+
+@pytest.fixture
+def user(run) -> User:
+    return make_user(run)
+
+@pytest.fixture
+def headers(user) -> dict:
+    return auth_headers(user)
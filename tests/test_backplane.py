@@ -0,0 +1,42 @@
+import asyncio
+import logging
+import os
+from app.realtime.backplane import UnixSocketBackplane
+
+def _pair(socket_dir: str, max_event_bytes: int):
+    workers = []
+    for name in ("a", "b"):
+        backplane = UnixSocketBackplane(socket_dir, peer_refresh=0.0, max_event_bytes=max_event_bytes)
+        # Both live in this process; give each its own socket instead of worker-<pid>.sock
+        backplane.path = os.path.join(socket_dir, f"worker-{name}.sock")
+        workers.append(backplane)
+    return workers
+
+def test_oversize_events_are_rejected_everywhere(run, tmp_path, caplog):
+    async def scenario():
+        a, b = _pair(str(tmp_path), max_event_bytes=4096)
+        seen = {"a": [], "b": []}
+        for name, backplane in (("a", a), ("b", b)):
+            async def handler(event, name=name):
+                seen[name].append(event["message"]["data"])
+            await backplane.start(handler)
+        try:
+            await a.publish({"topic": "leads", "message": {"type": "small", "data": "x" * 100}})
+            await a.publish({"topic": "leads", "message": {"type": "big", "data": "x" * 10000}})
+            await a.publish({"topic": "leads", "message": {"type": "small", "data": "y" * 100}})
+            for _ in range(50):
+                if len(seen["b"]) >= 2:
+                    break
+                await asyncio.sleep(0.01)
+            return seen, a.stats()
+        finally:
+            await a.stop()
+            await b.stop()
+
+    with caplog.at_level(logging.WARNING, logger="app.realtime.backplane"):
+        seen, stats = run(scenario)
+
+    # Same stream on both workers: the oversize event reached neither
+    assert seen["a"] == seen["b"] == ["x" * 100, "y" * 100]
+    assert stats["oversize"] == 1 and stats["published"] == 2 and stats["errors"] == 0
+    assert "Rejected big event on leads" in caplog.text
@@ -0,0 +1,48 @@
+import uuid
+from sqlalchemy import select
+from app.db.session import AsyncSessionLocal
+from app.db.models import Account, Contact, Deal, DealStage, Lead, LeadStatus
+
+def _lead(client, headers, value: float) -> str:
+    payload = {"first_name": "Conv", "last_name": f"L{value:g}", "company": f"Conv {uuid.uuid4().hex[:8]}",
+               "email": f"{uuid.uuid4().hex[:12]}@example.com", "title": "CTO", "value": value}
+    return client.post("/api/leads/", json=payload, headers=headers).json()["id"]
+
+def _load(run, lead_id: str):
+    async def load():
+        async with AsyncSessionLocal() as db:
+            lead = (await db.execute(select(Lead).where(Lead.id == lead_id))).scalar_one()
+            account = await db.get(Account, lead.converted_account_id)
+            contact = await db.get(Contact, lead.converted_contact_id)
+            deal = await db.get(Deal, lead.converted_deal_id)
+            return lead, account, contact, deal
+    return run(load)
+
+def test_convert_batch_links_every_record(client, run, user, headers):
+    ids = [_lead(client, headers, v) for v in (100.0, 200.0, 300.0)]
+    already = _lead(client, headers, 50.0)
+    client.post(f"/api/leads/{already}/convert", headers=headers)
+
+    response = client.post("/api/leads/convert-batch", json={"lead_ids": ids + [already, "missing", ids[0]]}, headers=headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert [c["lead_id"] for c in body["converted"]] == ids
+    assert body["errors"] == [
+        {"lead_id": already, "detail": "Lead already converted"},
+        {"lead_id": "missing", "detail": "Lead not found"},
+        {"lead_id": ids[0], "detail": "Duplicate lead id"},
+    ]
+
+    for result in body["converted"]:
+        lead, account, contact, deal = _load(run, result["lead_id"])
+        assert lead.status == LeadStatus.CONVERTED and lead.converted_at is not None
+        assert (account.id, contact.id, deal.id) == (result["account_id"], result["contact_id"], result["deal_id"])
+        assert account.name == lead.company and account.created_by_id == user.id
+        assert (contact.email, contact.title, contact.account_id) == (lead.email, "CTO", account.id)
+        assert (deal.amount, deal.stage, deal.contact_id, deal.account_id) == (lead.value, DealStage.QUALIFICATION, contact.id, account.id)
+
+def test_single_convert_errors(client, headers):
+    assert client.post("/api/leads/missing/convert", headers=headers).status_code == 404
+    lead_id = _lead(client, headers, 10.0)
+    assert client.post(f"/api/leads/{lead_id}/convert", headers=headers).status_code == 200
+    assert client.post(f"/api/leads/{lead_id}/convert", headers=headers).status_code == 400
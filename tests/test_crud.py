@@ -0,0 +1,30 @@
+from sqlalchemy import select
+from app.db.crud import update_returning
+from app.db.session import AsyncSessionLocal
+from app.db.models import Lead, User
+
+def test_update_returning_refreshes_loaded_instance(run, user):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            loaded = (await db.execute(select(User).where(User.id == user.id))).scalar_one()
+            updated = await update_returning(db, User, user.id, {"first_name": "Renamed", "not_a_column": 1})
+            await db.commit()
+            return loaded, updated
+
+    loaded, updated = run(scenario)
+    assert updated is loaded
+    assert updated.first_name == "Renamed"
+
+def test_update_returning_unknown_id(run):
+    async def scenario():
+        async with AsyncSessionLocal() as db:
+            return await update_returning(db, Lead, "missing", {"company": "Nowhere"})
+
+    assert run(scenario) is None
+
+def test_self_patch_returns_new_values(client, user, headers):
+    # get_current_user loads the caller into the request's session before the UPDATE
+    response = client.patch(f"/api/users/{user.id}", json={"first_name": "Self"}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["first_name"] == "Self"
+    assert client.get("/api/auth/me", headers=headers).json()["first_name"] == "Self"
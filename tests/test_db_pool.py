@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from sqlalchemy import exc, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from app.core.config import settings
+from app.db.session import InstrumentedQueuePool, pool_metrics
+from app.db.models import UserStatus
+from tests.conftest import auth_headers, make_user
+
+def _engine(**pool):
+    return create_async_engine(settings.DATABASE_URL, poolclass=InstrumentedQueuePool, pool_size=1, max_overflow=0, **pool)
+
+def test_wait_counts_only_time_queued(run):
+    async def scenario():
+        engine = _engine(pool_timeout=5)
+        try:
+            before = pool_metrics.wait_total
+            # First checkout opens a connection: no queue wait however long connect takes
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            opened = pool_metrics.wait_total - before
+
+            async def hold():
+                async with engine.connect():
+                    await asyncio.sleep(0.2)
+
+            holder = asyncio.create_task(hold())
+            await asyncio.sleep(0.05)
+            before = pool_metrics.wait_total
+            async with engine.connect() as conn:
+                await conn.execute(text("SELECT 1"))
+            queued = pool_metrics.wait_total - before
+            await holder
+            return opened, queued
+        finally:
+            await engine.dispose()
+
+    opened, queued = run(scenario)
+    assert opened < 0.01
+    assert 0.1 < queued < 0.5
+
+def test_timeouts_are_counted(run):
+    async def scenario():
+        engine = _engine(pool_timeout=0.05)
+        try:
+            before = pool_metrics.timeouts
+            async with engine.connect():
+                with pytest.raises(exc.TimeoutError):
+                    async with engine.connect():
+                        pass
+            return pool_metrics.timeouts - before
+        finally:
+            await engine.dispose()
+
+    assert run(scenario) == 1
+
+def test_pool_status_reports_configured_values(client, headers):
+    status = client.get("/api/admin/db-pool", headers=headers).json()
+    assert status["pool_class"] == "InstrumentedQueuePool"
+    assert {"max_overflow", "timeout", "recycle", "pre_ping", "checkouts", "wait_ms_avg", "wait_ms_max"} <= set(status)
+    assert (status["max_overflow"], status["recycle"], status["pre_ping"]) == (10, -1, False)
+
+@pytest.mark.parametrize("status", [UserStatus.INACTIVE, UserStatus.SUSPENDED])
+def test_admin_endpoints_require_an_active_admin(client, run, status):
+    admin = make_user(run, status=status)
+    response = client.get("/api/admin/db-pool", headers=auth_headers(admin))
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
@@ -0,0 +1,94 @@
+import uuid
+from datetime import timedelta
+import pytest
+from sqlalchemy import insert
+from app.db.session import AsyncSessionLocal
+from app.db.models import Deal, DealStage, utcnow
+from tests.conftest import auth_headers, make_user
+
+# (stage, amount, probability, seconds before now); QUALIFICATION has a three-way created_at tie
+DEALS = [
+    *[(DealStage.QUALIFICATION, 100.0 * (i + 1), 10 * (i + 1), s) for i, s in enumerate((0, 1, 1, 1, 2, 3, 4))],
+    (DealStage.PROPOSAL, 1000.0, 50, 5),
+    (DealStage.PROPOSAL, 0.0, 90, 6),
+    (DealStage.CLOSED_WON, 250.5, 100, 7),
+]
+# Worked by hand from DEALS: (count, total_amount, weighted_amount)
+EXPECTED = {
+    DealStage.QUALIFICATION: (7, 2800.0, 10 + 40 + 90 + 160 + 250 + 360 + 490),
+    DealStage.NEEDS_ANALYSIS: (0, 0.0, 0.0),
+    DealStage.PROPOSAL: (2, 1000.0, 500.0),
+    DealStage.NEGOTIATION: (0, 0.0, 0.0),
+    DealStage.CLOSED_WON: (1, 250.5, 250.5),
+    DealStage.CLOSED_LOST: (0, 0.0, 0.0),
+}
+
+@pytest.fixture(scope="module")
+def board(client, run):
+    """An account holding DEALS; returns (headers, account_id, deal rows)."""
+    user = make_user(run)
+    headers = auth_headers(user)
+    account_id = client.post("/api/accounts/", json={"name": f"Board {uuid.uuid4().hex[:8]}"}, headers=headers).json()["id"]
+    now = utcnow()
+    rows = [
+        {"id": str(uuid.uuid4()), "name": f"Board {i}", "amount": amount, "stage": stage, "probability": probability,
+         "account_id": account_id, "owner_id": user.id, "created_at": now - timedelta(seconds=s), "updated_at": now}
+        for i, (stage, amount, probability, s) in enumerate(DEALS)
+    ]
+
+    async def seed():
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(Deal), rows)
+            await db.commit()
+    run(seed)
+    return headers, account_id, rows
+
+def _board(client, headers, **params) -> list:
+    response = client.get("/api/deals/board", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["columns"]
+
+def _totals(column) -> tuple:
+    return column["count"], pytest.approx(column["total_amount"]), pytest.approx(column["weighted_amount"])
+
+def test_stage_totals_match_hand_computed(client, board):
+    headers, account_id, _ = board
+    columns = _board(client, headers, account_id=account_id, limit=3)
+    assert [c["stage"] for c in columns] == [s.value for s in DealStage]
+    for column in columns:
+        count, amount, weighted = EXPECTED[DealStage(column["stage"])]
+        assert _totals(column) == (count, amount, weighted)
+        assert len(column["items"]) == min(count, 3)
+        assert (column["next_cursor"] is not None) == (count > 3)
+
+def test_load_more_pages_one_column(client, board):
+    headers, account_id, rows = board
+    stage = DealStage.QUALIFICATION
+    expected = [r["id"] for r in sorted(
+        (r for r in rows if r["stage"] == stage), key=lambda r: (r["created_at"], r["id"]), reverse=True
+    )]
+
+    ids, cursor, pages = [], None, 0
+    while True:
+        params = {"account_id": account_id, "stage": stage.value, "limit": 2}
+        if cursor:
+            params["cursor"] = cursor
+        columns = _board(client, headers, **params)
+        assert [c["stage"] for c in columns] == [stage.value]
+        # Totals describe the whole column on every page, not just the rows after the cursor
+        assert _totals(columns[0]) == EXPECTED[stage]
+        ids += [item["id"] for item in columns[0]["items"]]
+        cursor = columns[0]["next_cursor"]
+        pages += 1
+        if cursor is None:
+            break
+        assert pages < 10
+    # A page boundary falls inside the created_at tie: no duplicates, no gaps
+    assert ids == expected
+    assert pages == 4
+
+def test_cursor_requires_stage(client, board):
+    headers, account_id, _ = board
+    first = _board(client, headers, account_id=account_id, limit=2)[0]
+    response = client.get("/api/deals/board", params={"account_id": account_id, "cursor": first["next_cursor"]}, headers=headers)
+    assert response.status_code == 400
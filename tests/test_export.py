@@ -0,0 +1,87 @@
+import asyncio
+import tracemalloc
+import uuid
+import pytest
+from sqlalchemy import insert
+from app.main import app
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.session import AsyncSessionLocal
+from app.db.models import Lead, LeadStatus, utcnow
+from tests.conftest import make_user
+
+# Small-N version of bench_export_memory.py: the LOST leads here are the only ones in the
+# shared test database, so the export row count is exact
+ROWS = 20_000
+CEILING_MB = 3.0
+
+@pytest.fixture(scope="module")
+def exporter(run):
+    return make_user(run)
+
+@pytest.fixture(scope="module")
+def lost_leads(run, exporter):
+    async def fill():
+        now = utcnow()
+        async with AsyncSessionLocal() as db:
+            for start in range(0, ROWS, 5000):
+                await db.execute(insert(Lead), [
+                    {"id": str(uuid.uuid4()), "first_name": f"First{i}", "last_name": f"Last{i}", "company": f"Company {i}",
+                     "email": f"lost{i}@example.com", "status": LeadStatus.LOST, "value": float(i),
+                     "created_by_id": exporter.id, "created_at": now, "updated_at": now}
+                    for i in range(start, min(start + 5000, ROWS))
+                ])
+            await db.commit()
+    run(fill)
+    return ROWS
+
+async def stream_export(path: str, query_string: bytes, token: str) -> dict:
+    """Drive the ASGI app directly and drop each body chunk, so no client buffers the body."""
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": query_string,
+        "root_path": "", "server": ("test", 80), "client": ("test", 1234),
+        "headers": [(b"host", b"test"), (b"authorization", f"Bearer {token}".encode())],
+    }
+    counters = {"status": None, "bytes": 0, "lines": 0}
+    finished = asyncio.Event()
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            counters["status"] = message["status"]
+        elif message["type"] == "http.response.body":
+            counters["bytes"] += len(message.get("body", b""))
+            counters["lines"] += message.get("body", b"").count(b"\n")
+            if not message.get("more_body", False):
+                finished.set()
+
+    tracemalloc.start()
+    try:
+        await app(scope, receive, send)
+        counters["peak"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return counters
+
+@pytest.mark.parametrize("format", ["csv", "ndjson"])
+def test_export_streams_in_bounded_memory(run, exporter, lost_leads, monkeypatch, format):
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 500)
+    token = create_access_token({"sub": exporter.id})
+    result = run(stream_export, "/api/leads/export", f"status=LOST&format={format}".encode(), token)
+
+    assert result["status"] == 200
+    assert result["lines"] == lost_leads + (format == "csv")
+    peak_mb = result["peak"] / 1024 / 1024
+    body_mb = result["bytes"] / 1024 / 1024
+    # The body is larger than the ceiling, so holding it (or the rows) in memory would fail
+    assert body_mb > CEILING_MB
+    assert peak_mb < CEILING_MB, f"peak {peak_mb:.1f} MB for a {body_mb:.1f} MB export"
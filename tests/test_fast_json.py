@@ -0,0 +1,97 @@
+import json
+import uuid
+from datetime import datetime
+import pytest
+from app.api import fast_json
+from app.core.config import settings
+from tests.conftest import auth_headers, make_user
+
+# Includes floats that orjson, pydantic and json spell differently (1e20 / 1e+20, 1e-7 / 1e-07)
+AMOUNTS = [0.1 + 0.2, 1e-7, 1e20, 123456789.125, 0.0, -2.5]
+ENDPOINTS = ["leads", "accounts", "contacts", "activities", "deals", "users"]
+
+@pytest.fixture(scope="module")
+def seeded(client, run):
+    """Rows on every list endpoint with datetimes, enums, None values and awkward floats."""
+    headers = auth_headers(make_user(run))
+    make_user(run)
+    tag = f"fj{uuid.uuid4().hex[:10]}"
+
+    def post(path, **payload):
+        response = client.post(path, json=payload, headers=headers)
+        assert response.status_code == 200, response.text
+        return response.json()["id"]
+
+    account_id = post("/api/accounts/", name=f"{tag} Ltd", industry=None, website="https://example.com")
+    post("/api/accounts/", name=f"{tag} Partners", industry="Energy", billing_address="1 Main St")
+    post("/api/contacts/", first_name="Null", last_name="Fields", account_id=account_id)
+    post("/api/contacts/", first_name="Full", last_name="Fields", email=f"{tag}@example.com", phone="+1 555", title="CFO",
+         account_id=account_id)
+    lead_ids = [
+        post("/api/leads/", first_name="Fast", last_name=str(i), company=f"{tag} Co", email=f"{tag}{i}@example.com",
+             value=value, status=status, title=None)
+        for i, (value, status) in enumerate(zip(AMOUNTS, ["NEW", "CONTACTED", "QUALIFIED", "LOST", "NEW", "NEW"]))
+    ]
+    for i, lead_id in enumerate(lead_ids[:4]):
+        post("/api/activities/", type="CALL", subject=f"Call {i}", description=None if i % 2 else "Notes", lead_id=lead_id)
+    for i, amount in enumerate(AMOUNTS):
+        post("/api/deals/", name=f"{tag} deal {i}", amount=amount, stage=["PROPOSAL", "CLOSED_WON"][i % 2],
+             closing_date=datetime(2027, 1 + i, 15, 9, 30, 0, 123456 * (i % 2)).isoformat() if i % 3 else None,
+             account_id=account_id)
+    return headers, {
+        "leads": {"search": tag},
+        "accounts": {},
+        "contacts": {"account_id": account_id},
+        "activities": {},
+        "deals": {"account_id": account_id},
+        "users": {},
+    }
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request, monkeypatch):
+    """The fast path's encoder: orjson, or the json fallback used when it is not installed."""
+    if request.param == "json":
+        monkeypatch.setattr(fast_json, "orjson", None)
+    return request.param
+
+def _get(client, monkeypatch, fast: bool, endpoint: str, headers, params):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast)
+    response = client.get(f"/api/{endpoint}/", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return json.loads(response.content)
+
+def _typed(value):
+    """Decoded JSON with key order and leaf types made significant (1 != 1.0, order matters)."""
+    if isinstance(value, dict):
+        return [(key, _typed(item)) for key, item in value.items()]
+    if isinstance(value, list):
+        return [_typed(item) for item in value]
+    return type(value).__name__, value
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def test_fast_path_matches_validated_output(client, monkeypatch, seeded, encoder, endpoint):
+    headers, filters = seeded
+    params = {**filters[endpoint], "limit": 1000}
+    validated = _get(client, monkeypatch, False, endpoint, headers, params)
+    assert validated
+    assert _typed(_get(client, monkeypatch, True, endpoint, headers, params)) == _typed(validated)
+
+@pytest.mark.parametrize("endpoint", [e for e in ENDPOINTS if e != "deals"])
+def test_fast_path_matches_validated_pages(client, monkeypatch, seeded, encoder, endpoint):
+    headers, filters = seeded
+    cursor, pages = "", 0
+    while cursor is not None and pages < 5:
+        params = {**filters[endpoint], "cursor": cursor, "limit": 1}
+        validated = _get(client, monkeypatch, False, endpoint, headers, params)
+        assert _typed(_get(client, monkeypatch, True, endpoint, headers, params)) == _typed(validated)
+        cursor = validated["next_cursor"]
+        pages += 1
+    assert pages > 1
+
+def test_seeded_rows_cover_every_kind_of_value(client, monkeypatch, seeded):
+    headers, filters = seeded
+    deals = _get(client, monkeypatch, True, "deals", headers, filters["deals"])
+    assert sorted(d["amount"] for d in deals) == sorted(AMOUNTS)
+    assert {d["stage"] for d in deals} == {"PROPOSAL", "CLOSED_WON"}
+    assert None in {d["closing_date"] for d in deals}
+    assert any(d["closing_date"] and d["closing_date"].endswith(".123456") for d in deals)
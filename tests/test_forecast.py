@@ -0,0 +1,52 @@
+import uuid
+from sqlalchemy import update
+from app.db.session import AsyncSessionLocal
+from app.db.models import Deal
+from app.services.forecast import pipeline_cache
+
+def _account(client, headers) -> str:
+    return client.post("/api/accounts/", json={"name": f"Forecast {uuid.uuid4().hex[:8]}"}, headers=headers).json()["id"]
+
+def _deal(client, headers, account_id: str, amount: float) -> str:
+    payload = {"name": "Forecast deal", "amount": amount, "account_id": account_id}
+    return client.post("/api/deals/", json=payload, headers=headers).json()["id"]
+
+def _totals(client, headers, **params) -> dict:
+    response = client.get("/api/deals/forecast", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["totals"]
+
+def test_back_to_back_edits_change_the_forecast(client, headers):
+    account_id = _account(client, headers)
+    deal_id = _deal(client, headers, account_id, 100.0)
+    assert _totals(client, headers, account_id=account_id)["amount"] == 100.0
+
+    for amount in (200.0, 300.0):
+        client.patch(f"/api/deals/{deal_id}", json={"amount": amount}, headers=headers)
+        assert _totals(client, headers, account_id=account_id)["amount"] == amount
+    assert _totals(client, headers)["amount"] >= 300.0
+
+def test_writes_that_keep_updated_at_are_seen(client, run, headers):
+    # Same row count and max(updated_at) as before, as two edits within one DATETIME second leave it
+    account_id = _account(client, headers)
+    deal_id = _deal(client, headers, account_id, 100.0)
+    assert _totals(client, headers, account_id=account_id)["amount"] == 100.0
+
+    async def raw_update():
+        async with AsyncSessionLocal() as db:
+            await db.execute(update(Deal).where(Deal.id == deal_id).values(amount=150.0))
+            await db.commit()
+    run(raw_update)
+    assert _totals(client, headers, account_id=account_id)["amount"] == 150.0
+
+def test_unrelated_writes_keep_the_filtered_cache(client, headers):
+    account_id, other_id = _account(client, headers), _account(client, headers)
+    _deal(client, headers, account_id, 100.0)
+    _totals(client, headers, account_id=account_id)
+    cached = pipeline_cache.get((account_id, None))
+
+    edited, deleted = _deal(client, headers, other_id, 50.0), _deal(client, headers, other_id, 60.0)
+    client.patch(f"/api/deals/{edited}", json={"amount": 55.0}, headers=headers)
+    client.delete(f"/api/deals/{deleted}", headers=headers)
+    assert _totals(client, headers, account_id=account_id)["amount"] == 100.0
+    assert pipeline_cache.get((account_id, None)) is cached
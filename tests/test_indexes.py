@@ -0,0 +1,11 @@
+import pytest
+from app.db.session import engine
+from verify_indexes import QUERY_SHAPES, explain
+
+@pytest.mark.parametrize("index_name, stmt", QUERY_SHAPES, ids=[name for name, _ in QUERY_SHAPES])
+def test_planner_uses_index(run, index_name, stmt):
+    async def plan():
+        async with engine.connect() as conn:
+            return await explain(conn, stmt)
+
+    assert index_name in run(plan)
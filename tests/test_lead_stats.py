@@ -0,0 +1,54 @@
+import uuid
+import pytest
+from sqlalchemy import func, select
+from app.db.session import AsyncSessionLocal
+from app.db.models import Lead
+
+def _overview(client, headers) -> dict:
+    stats = client.get("/api/leads/stats/overview", headers=headers).json()["stats"]
+    return {s["_id"]: (s["count"], s["total_value"]) for s in stats}
+
+def _aggregate(run) -> dict:
+    async def group_by():
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Lead.status, func.count(Lead.id), func.coalesce(func.sum(Lead.value), 0.0)).group_by(Lead.status)
+            )
+            return {status: (count, pytest.approx(total)) for status, count, total in result}
+    return run(group_by)
+
+def _lead(client, headers, **fields) -> dict:
+    payload = {"first_name": "Stat", "last_name": "Lead", "company": "Stats Co",
+               "email": f"{uuid.uuid4().hex[:12]}@example.com", **fields}
+    response = client.post("/api/leads/", json=payload, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+def test_deltas_match_a_full_aggregate(client, run, headers):
+    # Start from an exact table: other tests seed leads with plain INSERTs
+    assert client.post("/api/admin/lead-stats/rebuild", headers=headers).status_code == 200
+    before = _overview(client, headers)
+
+    a = _lead(client, headers, value=100.0)
+    b = _lead(client, headers, value=250.0, status="QUALIFIED")
+    c = _lead(client, headers, value=40.0, status="CONTACTED")
+    d = _lead(client, headers, value=75.0)
+    e = _lead(client, headers, value=5.0)
+
+    new_count, new_total = before.get("NEW", (0, 0.0))
+    assert _overview(client, headers)["NEW"] == (new_count + 3, pytest.approx(new_total + 180.0))
+
+    client.patch(f"/api/leads/{a['id']}", json={"status": "CONTACTED", "value": 120.0}, headers=headers)
+    client.patch(f"/api/leads/{c['id']}", json={"value": 60.0}, headers=headers)
+    client.post(f"/api/leads/{b['id']}/convert", headers=headers)
+    client.post("/api/leads/convert-batch", json={"lead_ids": [d["id"], b["id"], "missing"]}, headers=headers)
+    client.patch(f"/api/leads/{e['id']}", json={"status": "CONVERTED"}, headers=headers)
+    client.delete(f"/api/leads/{c['id']}", headers=headers)
+    client.post("/api/leads/bulk?format=ndjson", content=(
+        '{"first_name": "Bulk", "last_name": "One", "company": "Bulk Co", "email": "bulk1@example.com", "value": 9.5}\n'
+        '{"first_name": "Bulk", "last_name": "Two", "company": "Bulk Co", "email": "not-an-email"}\n'
+    ), headers=headers)
+
+    assert _overview(client, headers) == {
+        status: agg for status, agg in _aggregate(run).items() if agg[0] > 0
+    }
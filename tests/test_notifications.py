@@ -0,0 +1,62 @@
+from sqlalchemy import delete, insert
+from app.db.session import AsyncSessionLocal
+from app.db.models import Notification
+from app.services.notifications import create_notification
+
+def _add(run, user_id: str, n: int, via_helper: bool = False) -> list:
+    async def add():
+        async with AsyncSessionLocal() as db:
+            if via_helper:
+                rows = [await create_notification(db, user_id, "t", "m") for _ in range(n)]
+            else:
+                # Plain ORM insert, bypassing create_notification
+                rows = [Notification(user_id=user_id, title="t", message="m") for _ in range(n)]
+                db.add_all(rows)
+            await db.commit()
+            return [r.id for r in rows]
+    return run(add)
+
+def _unread(client, headers) -> int:
+    return client.get("/api/notifications/unread-count", headers=headers).json()["unread"]
+
+def test_counter_follows_every_insert_path(client, run, user, headers):
+    _add(run, user.id, 2, via_helper=True)
+    _add(run, user.id, 3)
+
+    async def core_insert():
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(Notification).values(id="core-insert", user_id=user.id, title="t", message="m", is_read=False))
+            await db.commit()
+    run(core_insert)
+    assert _unread(client, headers) == 6
+
+def test_single_read(client, run, user, headers):
+    ids = _add(run, user.id, 2)
+    response = client.patch(f"/api/notifications/{ids[0]}/read", headers=headers)
+    assert response.status_code == 200
+    assert _unread(client, headers) == 1
+    # Reading it again does not decrement twice
+    client.patch(f"/api/notifications/{ids[0]}/read", headers=headers)
+    assert _unread(client, headers) == 1
+
+def test_batch_read_all_and_delete(client, run, user, headers):
+    ids = _add(run, user.id, 5)
+    body = client.post("/api/notifications/read", json={"ids": ids[:2] + ["unknown"]}, headers=headers).json()
+    assert body["updated"] == 2
+    assert _unread(client, headers) == 3
+
+    async def remove():
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(Notification).where(Notification.id == ids[4]))
+            await db.commit()
+    run(remove)
+    assert _unread(client, headers) == 2
+
+    client.post("/api/notifications/read-all", headers=headers)
+    assert _unread(client, headers) == 0
+
+def test_unread_count_etag(client, run, user, headers):
+    _add(run, user.id, 1)
+    first = client.get("/api/notifications/unread-count", headers=headers)
+    cached = client.get("/api/notifications/unread-count", headers={**headers, "If-None-Match": first.headers["ETag"]})
+    assert cached.status_code == 304
@@ -0,0 +1,54 @@
+import uuid
+from datetime import timedelta
+import pytest
+from sqlalchemy import insert
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.db.models import Lead, utcnow
+
+@pytest.fixture
+def tagged_leads(run, user):
+    """Seven leads sharing a unique company token; three of them share one created_at."""
+    tag = uuid.uuid4().hex
+    base = utcnow()
+    stamps = [base - timedelta(seconds=s) for s in (0, 1, 1, 1, 2, 3, 4)]
+    rows = [
+        {"id": str(uuid.uuid4()), "first_name": "Page", "last_name": str(i), "company": f"{tag} Inc",
+         "email": f"page{i}@example.com", "created_by_id": user.id, "created_at": stamp, "updated_at": stamp}
+        for i, stamp in enumerate(stamps)
+    ]
+
+    async def seed():
+        async with AsyncSessionLocal() as db:
+            await db.execute(insert(Lead), rows)
+            await db.commit()
+    run(seed)
+    expected = [r["id"] for r in sorted(rows, key=lambda r: (r["created_at"], r["id"]), reverse=True)]
+    return tag, expected
+
+def _walk(client, headers, tag: str, limit: int) -> list:
+    ids, cursor, pages = [], "", 0
+    while cursor is not None:
+        page = client.get("/api/leads/", params={"search": tag, "cursor": cursor, "limit": limit}, headers=headers).json()
+        ids += [item["id"] for item in page["items"]]
+        cursor = page["next_cursor"]
+        pages += 1
+        assert pages <= 10
+    return ids
+
+@pytest.mark.parametrize("fast_json", [False, True])
+def test_cursor_walk_covers_every_row_once(client, headers, tagged_leads, monkeypatch, fast_json):
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast_json)
+    tag, expected = tagged_leads
+    # A page boundary falls inside the three-way created_at tie
+    assert _walk(client, headers, tag, 2) == expected
+    assert _walk(client, headers, tag, 7) == expected
+
+def test_last_page_has_no_cursor(client, headers, tagged_leads):
+    tag, _ = tagged_leads
+    page = client.get("/api/leads/", params={"search": tag, "cursor": "", "limit": 10}, headers=headers).json()
+    assert len(page["items"]) == 7
+    assert page["next_cursor"] is None
+
+def test_invalid_cursor_is_rejected(client, headers):
+    assert client.get("/api/leads/", params={"cursor": "not-a-cursor"}, headers=headers).status_code == 400
@@ -0,0 +1,27 @@
+import pytest
+from starlette.websockets import WebSocketDisconnect
+from app.api.deps import user_cache
+from app.core.security import create_access_token
+from app.db.models import UserStatus
+from tests.conftest import make_user
+
+def _token(user) -> str:
+    return create_access_token({"sub": user.id})
+
+def test_active_user_connects(client, user):
+    with client.websocket_connect(f"/api/ws?token={_token(user)}") as ws:
+        ws.send_json({"action": "ping"})
+        assert ws.receive_json()["type"] == "pong"
+
+@pytest.mark.parametrize("cached", [False, True])
+def test_inactive_user_is_rejected(client, run, cached):
+    user = make_user(run, status=UserStatus.SUSPENDED)
+    if cached:
+        # Snapshot as get_current_user stores it
+        client.get("/api/notifications/unread-count", headers={"Authorization": f"Bearer {_token(user)}"})
+        assert user_cache.get(user.id) is not None
+    with pytest.raises(WebSocketDisconnect) as exc:
+        with client.websocket_connect(f"/api/ws?token={_token(user)}") as ws:
+            ws.send_json({"action": "ping"})
+            ws.receive_json()
+    assert exc.value.code == 1008
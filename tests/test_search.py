@@ -0,0 +1,107 @@
+import uuid
+import pytest
+from sqlalchemy import text
+from app.db.session import AsyncSessionLocal
+from app.db.models import RoleEnum
+from tests.conftest import auth_headers, make_user
+
+@pytest.fixture(scope="module")
+def records(client, run):
+    """One strong and one weak lead match, a contact and an account, all sharing a unique token."""
+    headers = auth_headers(make_user(run))
+    tag = f"srch{uuid.uuid4().hex[:10]}"
+
+    def post(path, **payload):
+        response = client.post(path, json=payload, headers=headers)
+        assert response.status_code == 200, response.text
+        return response.json()["id"]
+
+    account = post("/api/accounts/", name=f"{tag} Holdings", industry="Retail")
+    weak_email = f"w{uuid.uuid4().hex[:12]}@example.com"
+    return tag, weak_email, {
+        "strong": post("/api/leads/", first_name=tag, last_name=tag, company=f"{tag} Labs", email=f"{tag}@example.com"),
+        "weak": post("/api/leads/", first_name="Ada", last_name="Byron", company=f"{tag} Works", email=weak_email),
+        "contact": post("/api/contacts/", first_name="Grace", last_name=tag, account_id=account),
+        "account": account,
+    }
+
+def _search(client, headers, q, **params):
+    response = client.get("/api/search/", params={"q": q, **params}, headers=headers)
+    assert response.status_code == 200, response.text
+    return response.json()["results"]
+
+def _lead_ids(client, headers, search: str) -> set:
+    response = client.get("/api/leads/", params={"search": search, "limit": 100}, headers=headers)
+    assert response.status_code == 200, response.text
+    return {lead["id"] for lead in response.json()}
+
+def test_results_are_ranked(client, headers, records):
+    tag, _, ids = records
+    results = _search(client, headers, tag)
+    assert {(r["entity"], r["id"]) for r in results} == {
+        ("lead", ids["strong"]), ("lead", ids["weak"]), ("contact", ids["contact"]), ("account", ids["account"])
+    }
+    scores = [r["score"] for r in results]
+    assert scores == sorted(scores, reverse=True)
+    leads = [r["id"] for r in results if r["entity"] == "lead"]
+    assert leads == [ids["strong"], ids["weak"]]
+
+def test_type_filter(client, headers, records):
+    tag, _, ids = records
+    assert [(r["entity"], r["id"]) for r in _search(client, headers, tag, types="account")] == [("account", ids["account"])]
+    assert {r["entity"] for r in _search(client, headers, tag, types="lead, contact")} == {"lead", "contact"}
+    response = client.get("/api/search/", params={"q": tag, "types": "lead,deal"}, headers=headers)
+    assert response.status_code == 400
+
+def test_prefix_and_multiple_tokens(client, headers, records):
+    tag, _, ids = records
+    assert {r["id"] for r in _search(client, headers, tag[:8], types="lead")} >= {ids["strong"], ids["weak"]}
+    # Every token must match
+    assert [r["id"] for r in _search(client, headers, f"ada {tag}", types="lead")] == [ids["weak"]]
+
+@pytest.mark.parametrize("q", [
+    '"{tag}', '{tag}"', '{tag}*', '-{tag}', '{tag}:', '({tag})', '^{tag}', '{tag} +', "{tag}'",
+])
+def test_query_syntax_is_treated_as_text(client, headers, records, q):
+    tag, _, ids = records
+    assert ids["strong"] in {r["id"] for r in _search(client, headers, q.format(tag=tag))}
+
+@pytest.mark.parametrize("q", ['"', "*", "()", "-", "NEAR"])
+def test_input_without_matches_is_not_an_error(client, headers, q):
+    _search(client, headers, q)
+
+def test_operator_words_are_plain_tokens(client, headers, records):
+    tag, _, _ = records
+    # OR / NOT / NEAR are tokens every result must also contain, not FTS operators
+    missing = f"nomatch{uuid.uuid4().hex[:6]}"
+    assert _search(client, headers, f"{tag} OR {missing}") == []
+    assert _search(client, headers, f"{tag} NOT {missing}") == []
+    assert _search(client, headers, f"NEAR({tag} {missing})") == []
+
+def test_leads_search_matches_token_prefixes(client, headers, records):
+    tag, weak_email, ids = records
+    assert _lead_ids(client, headers, tag) == {ids["strong"], ids["weak"]}
+    assert _lead_ids(client, headers, tag[:6]) >= {ids["strong"], ids["weak"]}
+    assert _lead_ids(client, headers, f"Ada {tag}") == {ids["weak"]}
+    assert _lead_ids(client, headers, f"{tag} Labs") == {ids["strong"]}
+    # An email is searched as its tokens
+    assert _lead_ids(client, headers, weak_email) == {ids["weak"]}
+    # Substrings inside a token no longer match (they did with the old ILIKE '%...%' scan)
+    assert _lead_ids(client, headers, tag[2:]) == set()
+    assert _lead_ids(client, headers, '"' + tag + '*') == {ids["strong"], ids["weak"]}
+
+def test_rebuild_restores_the_index(client, run, headers, records):
+    tag, _, ids = records
+
+    async def clear():
+        async with AsyncSessionLocal() as db:
+            for table in ("leads", "contacts", "accounts"):
+                await db.execute(text(f"INSERT INTO {table}_fts({table}_fts) VALUES ('delete-all')"))
+            await db.commit()
+    run(clear)
+    assert _search(client, headers, tag) == []
+
+    assert client.post("/api/admin/search/rebuild", headers=auth_headers(make_user(run, role=RoleEnum.EMPLOYEE))).status_code == 403
+    response = client.post("/api/admin/search/rebuild", headers=headers)
+    assert response.status_code == 200
+    assert {r["id"] for r in _search(client, headers, tag)} == set(ids.values())
@@ -0,0 +1,53 @@
+import uuid
+from datetime import timedelta
+import numpy as np
+from app.db.models import DealStage, utcnow
+from app.services.forecast import build_pipeline
+from app.services.simulation import simulate, simulate_trials, simulation_cache
+
+def _pipeline():
+    # (amount, probability, month, stage, owner) for open deals over the next few months
+    now = utcnow()
+    month = now.year * 12 + now.month - 1
+    stage = list(DealStage).index(DealStage.PROPOSAL)
+    rows = [(1000.0 * (i + 1), 10 * (i % 9 + 1), month + i % 5, stage, "owner") for i in range(40)]
+    return build_pipeline(rows), month
+
+def test_fixed_seed_is_reproducible(run):
+    pipeline, month = _pipeline()
+    args = (pipeline.amount, pipeline.probability, pipeline.month, month // 3, 3, 0.3, 3, 500)
+    assert np.array_equal(simulate_trials(*args, 0), simulate_trials(*args, 0))
+    assert not np.array_equal(simulate_trials(*args, 0), simulate_trials(*args, 1))
+
+    first = run(simulate, pipeline, 2000, month)
+    second = run(simulate, pipeline, 2000, month)
+    assert first == second
+    assert first["open_deals"] == 40 and first["quarters"]
+
+def test_deal_update_invalidates_the_cache(client, headers):
+    account_id = client.post("/api/accounts/", json={"name": f"Sim {uuid.uuid4().hex[:8]}"}, headers=headers).json()["id"]
+    closing = (utcnow() + timedelta(days=45)).isoformat()
+    deal_ids = [
+        client.post("/api/deals/", json={"name": f"Sim {i}", "amount": 1000.0, "stage": "PROPOSAL",
+                                         "closing_date": closing, "account_id": account_id}, headers=headers).json()["id"]
+        for i in range(3)
+    ]
+
+    def simulation() -> dict:
+        response = client.get("/api/deals/simulation", params={"account_id": account_id, "trials": 1000}, headers=headers)
+        assert response.status_code == 200, response.text
+        return response.json()
+
+    first = simulation()
+    assert first["open_deals"] == 3
+    cached = simulation_cache.stats()["hits"]
+    assert simulation() == first
+    assert simulation_cache.stats()["hits"] == cached + 1
+
+    client.patch(f"/api/deals/{deal_ids[0]}", json={"amount": 5000.0}, headers=headers)
+    raised = simulation()
+    assert raised["open_deals"] == 3
+    assert sum(q["mean"] for q in raised["quarters"]) > sum(q["mean"] for q in first["quarters"])
+
+    client.patch(f"/api/deals/{deal_ids[1]}", json={"stage": "CLOSED_LOST"}, headers=headers)
+    assert simulation()["open_deals"] == 2
@@ -0,0 +1,17 @@
+import pytest
+
+@pytest.mark.parametrize("path, payload", [
+    ("/api/accounts/", {"name": "Stamp Co"}),
+    ("/api/leads/", {"first_name": "Ada", "last_name": "Stamp", "company": "Stamp Co", "email": "ada@stamp.example"}),
+])
+def test_create_and_read_serialize_timestamps_alike(client, headers, path, payload):
+    created = client.post(path, json=payload, headers=headers)
+    assert created.status_code in (200, 201), created.text
+    body = created.json()
+
+    read = client.get(f"{path}{body['id']}", headers=headers).json()
+    patched = client.patch(f"{path}{body['id']}", json={}, headers=headers).json()
+    assert body["created_at"] == read["created_at"] == patched["created_at"]
+    assert body["updated_at"] == read["updated_at"]
+    # Naive UTC on every path: no "Z" or offset suffix
+    assert not body["created_at"].endswith("Z") and "+" not in body["created_at"]
@@ -0,0 +1,38 @@
+import uuid
+import pytest
+from app.api.deps import invalidate_user, user_cache
+from app.db.models import RoleEnum
+from tests.conftest import auth_headers, make_user
+
+def test_cache_stats_count_hits_and_misses(client, user, headers):
+    before = client.get("/api/admin/caches", headers=headers).json()["user"]
+    client.get("/api/auth/me", headers=headers)
+    after = client.get("/api/admin/caches", headers=headers).json()["user"]
+    # The first request stored the snapshot; /me and the second stats call are served from it
+    assert after["hits"] - before["hits"] == 2
+    assert set(after) == {"size", "maxsize", "hits", "misses"}
+
+def test_cache_stats_admin_only(client, run):
+    employee = make_user(run, role=RoleEnum.EMPLOYEE)
+    assert client.get("/api/admin/caches", headers=auth_headers(employee)).status_code == 403
+
+@pytest.mark.parametrize("hit", [False, True])
+def test_handlers_work_on_both_paths(client, run, user, headers, hit):
+    def request(method, path, **kwargs):
+        if hit:
+            client.get("/api/auth/me", headers=headers)  # store the snapshot
+        else:
+            invalidate_user(user.id)
+        before = user_cache.hits
+        response = client.request(method, path, headers=headers, **kwargs)
+        assert response.status_code == 200, response.text
+        assert (user_cache.hits > before) == hit
+        return response.json()
+
+    me = request("GET", "/api/auth/me")
+    assert (me["id"], me["email"], me["role"], me["status"]) == (user.id, user.email, "ADMIN", "ACTIVE")
+    lead = request("POST", "/api/leads/", json={"first_name": "Cache", "last_name": "Path", "company": "Cache Co",
+                                                "email": f"{uuid.uuid4().hex[:12]}@example.com"})
+    assert lead["created_by_id"] == user.id
+    assert request("PATCH", f"/api/users/{user.id}", json={"last_name": f"hit={hit}"})["last_name"] == f"hit={hit}"
+    assert request("GET", "/api/admin/caches")["user"]["maxsize"] > 0